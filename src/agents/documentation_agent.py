@@ -3,7 +3,8 @@
 import pandas as pd
 import time
 import os
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from crewai import Agent, Task, Crew
 from src.core.config import APP_CONFIG, logger
 from src.core.ai_config import AI_CONFIG
@@ -68,6 +69,12 @@ class MultiProviderAIClient:
             import anthropic
             return anthropic.Anthropic(api_key=APP_CONFIG.anthropic_api_key)
     
+    def close(self) -> None:
+        """Release the provider client's HTTP connections, if it holds any"""
+        close = getattr(self.client, 'close', None)
+        if callable(close):
+            close()
+    
     def generate_text(self, prompt: str, max_tokens: int = 1000, model: str = None) -> str:
         """Generate text using the configured provider"""
         if model is None:
@@ -124,6 +131,10 @@ class DocumentationAgent:
         self.ai_client = MultiProviderAIClient()
         self.agent = self._create_agent()
     
+    def close(self) -> None:
+        """Close the underlying AI client"""
+        self.ai_client.close()
+    
     def _create_agent(self) -> Agent:
         """Create the documentation agent - UPDATED with configurable system message"""
         return Agent(
@@ -138,30 +149,57 @@ class DocumentationAgent:
         """Generate business documentation for all database objects"""
         logger.info(f"Generating documentation for {len(enriched_df)} columns using {AI_CONFIG.primary_model} ({AI_CONFIG.provider})")
         
-        # Group by table for efficient processing
+        # Group by table for efficient processing; a categorical table_name would
+        # otherwise yield empty groups (and AI calls) for unused categories
         documented_data = []
         
-        for table_name in enriched_df['table_name'].unique():
-            table_df = enriched_df[enriched_df['table_name'] == table_name]
+        for table_name, table_df in enriched_df.groupby('table_name', sort=False, observed=True):
+            documented_data.extend(self.document_table(table_name, table_df))
+        
+        return pd.DataFrame(documented_data)
+    
+    def generate_documentation_stream(self, table_frames: Iterable[Tuple[str, pd.DataFrame]]) -> pd.DataFrame:
+        """Generate documentation while per-table frames are still being produced
+        
+        Each table is submitted to a worker as soon as it arrives, so AI requests
+        overlap with upstream profiling. Concurrency is bounded by the AI
+        performance settings to respect provider rate limits.
+        """
+        max_workers = AI_CONFIG.max_concurrent_requests if AI_CONFIG.enable_concurrent_requests else 1
+        logger.info(f"Generating documentation using {AI_CONFIG.primary_model} ({AI_CONFIG.provider}) "
+                    f"with {max_workers} concurrent table request(s)")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.document_table, table_name, table_df)
+                for table_name, table_df in table_frames
+            ]
             
-            try:
-                # Generate table description using configurable prompts
-                table_description = self._generate_table_description(table_name, table_df)
-                
-                # Generate column descriptions in configurable batches
-                columns_with_descriptions = self._generate_column_descriptions(table_df, table_description)
-                
-                documented_data.extend(columns_with_descriptions)
-                
-            except Exception as e:
-                logger.error(f"Failed to document table {table_name}: {str(e)}")
-                # Add without descriptions
-                for _, row in table_df.iterrows():
-                    documented_data.append(dict(row))
+            # Collect in submission order to keep the table ordering stable
+            documented_data = []
+            for future in futures:
+                documented_data.extend(future.result())
         
         return pd.DataFrame(documented_data)
     
-    def _generate_table_description(self, table_name: str, table_df: pd.DataFrame) -> str:
+    def document_table(self, table_name: str, table_df: pd.DataFrame) -> List[Dict]:
+        """Generate table and column documentation for a single table"""
+        # Convert once; the helpers below work on plain row dicts
+        records = table_df.to_dict('records')
+        
+        try:
+            # Generate table description using configurable prompts
+            table_description = self._generate_table_description(table_name, records)
+            
+            # Generate column descriptions in configurable batches
+            return self._generate_column_descriptions(records, table_description)
+            
+        except Exception as e:
+            logger.error(f"Failed to document table {table_name}: {str(e)}")
+            # Add without descriptions
+            return records
+    
+    def _generate_table_description(self, table_name: str, records: List[Dict]) -> str:
         """Generate business description for a table - UPDATED with configurable prompts"""
         logger.info(f"Generating table description for {table_name}")
         
@@ -169,7 +207,7 @@ class DocumentationAgent:
         column_info = []
         max_columns = AI_CONFIG.max_context_columns
         
-        for _, col in table_df.head(max_columns).iterrows():
+        for col in records[:max_columns]:
             info = f"- {col['column_name']} ({col['business_data_type']})"
             if col.get('sample_values'):
                 # Truncate sample values using config
@@ -180,7 +218,7 @@ class DocumentationAgent:
         # Generate prompt using configurable template
         prompt = AI_CONFIG.get_table_description_prompt(
             table_name=table_name,
-            column_count=len(table_df),
+            column_count=len(records),
             column_info='\n'.join(column_info)
         )
         
@@ -202,13 +240,13 @@ class DocumentationAgent:
                 return description
             else:
                 logger.warning(f"Generated table description for {table_name} failed validation")
-                return f"Business data table containing {len(table_df)} data elements."
+                return f"Business data table containing {len(records)} data elements."
                 
         except Exception as e:
             logger.error(f"Failed to generate table description: {str(e)}")
-            return f"Business data table containing {len(table_df)} data elements."
+            return f"Business data table containing {len(records)} data elements."
     
-    def _generate_column_descriptions(self, table_df: pd.DataFrame, table_description: str) -> List[Dict]:
+    def _generate_column_descriptions(self, records: List[Dict], table_description: str) -> List[Dict]:
         """Generate descriptions for table columns - UPDATED with configurable batching"""
         columns_data = []
         
@@ -216,13 +254,13 @@ class DocumentationAgent:
         batch_size = AI_CONFIG.batch_size
         
         # Process in batches
-        for i in range(0, len(table_df), batch_size):
-            batch = table_df.iloc[i:i+batch_size]
+        for i in range(0, len(records), batch_size):
+            batch = records[i:i+batch_size]
             
             try:
                 batch_descriptions = self._generate_batch_descriptions(batch, table_description)
                 
-                for j, (_, row) in enumerate(batch.iterrows()):
+                for j, row in enumerate(batch):
                     column_data = dict(row)
                     column_data['table_description'] = table_description
                     
@@ -241,7 +279,7 @@ class DocumentationAgent:
             except Exception as e:
                 logger.error(f"Failed to generate batch descriptions: {str(e)}")
                 # Add without descriptions
-                for _, row in batch.iterrows():
+                for row in batch:
                     column_data = dict(row)
                     column_data['table_description'] = table_description
                     column_data['column_description'] = f"Data field: {row['column_name']}"
@@ -249,10 +287,10 @@ class DocumentationAgent:
         
         return columns_data
     
-    def _generate_batch_descriptions(self, batch_df: pd.DataFrame, table_context: str) -> List[str]:
+    def _generate_batch_descriptions(self, batch: List[Dict], table_context: str) -> List[str]:
         """Generate descriptions for a batch of columns - UPDATED with configurable prompts"""
         column_info = []
-        for _, col in batch_df.iterrows():
+        for col in batch:
             info = f"{col['column_name']} ({col['data_type']}, {col['business_data_type']})"
             if col.get('sample_values'):
                 # Truncate sample values using config
@@ -268,7 +306,7 @@ class DocumentationAgent:
         
         try:
             # Select model and token limit based on batch complexity
-            complexity = "complex" if len(batch_df) > 5 else "standard"
+            complexity = "complex" if len(batch) > 5 else "standard"
             model = AI_CONFIG.get_model_for_task(complexity)
             max_tokens = AI_CONFIG.get_effective_token_limit("batch")
             
@@ -296,7 +334,7 @@ class DocumentationAgent:
             
         except Exception as e:
             logger.error(f"Failed to generate batch descriptions: {str(e)}")
-            return [f"Data field: {row['column_name']}" for _, row in batch_df.iterrows()]
+            return [f"Data field: {row['column_name']}" for row in batch]
     
     def _make_api_request(self, prompt: str, model: str = None, max_tokens: int = None) -> str:
         """Make API request with configurable retry logic - UPDATED for multi-provider"""
@@ -154,6 +154,14 @@ Return only the descriptions, one per line, in the same order as the columns lis
     def request_timeout_seconds(self) -> int:
         return self.get('performance.request_timeout_seconds', 60)
     
+    @property
+    def enable_concurrent_requests(self) -> bool:
+        return self.get('performance.enable_concurrent_requests', False)
+    
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self.get('performance.max_concurrent_requests', 3)
+    
     # Quality configuration properties
     @property
     def require_complete_descriptions(self) -> bool:
@@ -1,13 +1,52 @@
 """Base configuration loader to reduce duplication"""
 
+import os
+import sys
+import copy
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger("database_catalog")
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+def _intern_strings(node: Any) -> Any:
+    """Recursively intern string keys and values of a parsed config tree"""
+    if isinstance(node, str):
+        return sys.intern(node)
+    if isinstance(node, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_strings(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_intern_strings(v) for v in node]
+    return node
+
+def _read_yaml_fd(fd: int) -> Any:
+    """Parse the YAML behind an open descriptor"""
+    chunks = []
+    remaining = os.fstat(fd).st_size
+    while remaining > 0:
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    
+    # Intern keywords, suffixes and business types so repeated comparisons are cheap
+    return _intern_strings(yaml.load(b"".join(chunks), Loader=_YamlLoader))
+
+@lru_cache(maxsize=1024)
+def _key_parts(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation key once; the same literal keys are looked up repeatedly"""
+    return tuple(key_path.split('.'))
+
 class BaseConfig(ABC):
     """Base configuration loader with common functionality"""
     
@@ -19,19 +58,23 @@ class BaseConfig(ABC):
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file with fallback to defaults"""
-        if not self.config_path.exists():
+        try:
+            fd = os.open(self.config_path, os.O_RDONLY)
+        except FileNotFoundError:
             logger.warning(f"Config file {self.config_path} not found. Using default {self.config_name} settings.")
             return self._get_default_config()
+        except OSError as e:
+            logger.error(f"Error loading {self.config_name} config from {self.config_path}: {e}. Using defaults.")
+            return self._get_default_config()
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                if config is None:
-                    logger.warning(f"Empty config file {self.config_path}. Using defaults.")
-                    return self._get_default_config()
-                
-                logger.info(f"Loaded {self.config_name} settings from {self.config_path}")
-                return config
+            config = _read_yaml_fd(fd)
+            if config is None:
+                logger.warning(f"Empty config file {self.config_path}. Using defaults.")
+                return self._get_default_config()
+            
+            logger.info(f"Loaded {self.config_name} settings from {self.config_path}")
+            return config
                 
         except yaml.YAMLError as e:
             logger.error(f"YAML error in {self.config_path}: {e}. Using default settings.")
@@ -39,6 +82,8 @@ class BaseConfig(ABC):
         except Exception as e:
             logger.error(f"Error loading {self.config_name} config from {self.config_path}: {e}. Using defaults.")
             return self._get_default_config()
+        finally:
+            os.close(fd)
     
     @abstractmethod
     def _get_default_config(self) -> Dict[str, Any]:
@@ -47,11 +92,10 @@ class BaseConfig(ABC):
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'database.host')"""
-        keys = key_path.split('.')
         value = self._config
         
         try:
-            for key in keys:
+            for key in _key_parts(key_path):
                 value = value[key]
             return value
         except (KeyError, TypeError):
@@ -59,19 +103,25 @@ class BaseConfig(ABC):
     
     def update(self, key_path: str, value: Any) -> None:
         """Update configuration value using dot notation"""
-        keys = key_path.split('.')
+        keys = _key_parts(key_path)
         config_section = self._config
         
-        # Navigate to the parent of the target key
+        # Navigate to the parent of the target key, creating sections on the way
         for key in keys[:-1]:
-            if key not in config_section:
-                config_section[key] = {}
-            config_section = config_section[key]
+            config_section = config_section.setdefault(key, {})
         
         # Set the final value
         config_section[keys[-1]] = value
         logger.debug(f"Updated {self.config_name} config: {key_path} = {value}")
     
+    def save_state(self) -> Dict[str, Any]:
+        """Deep copy of the current settings, for restore_state()"""
+        return copy.deepcopy(self._config)
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Replace the current settings with a save_state() copy"""
+        self._config = copy.deepcopy(state)
+    
     def validate(self) -> bool:
         """Validate configuration - can be overridden by subclasses"""
         return True
@@ -84,7 +134,7 @@ class BaseConfig(ABC):
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2)
+                yaml.dump(self._config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
             
             logger.info(f"Saved {self.config_name} configuration to {save_path}")
             return True
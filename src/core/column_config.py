@@ -1,6 +1,8 @@
 """Column classification configuration loader - Refactored to use BaseConfig"""
 
-from typing import Dict, List, Any
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from src.core.base_config import BaseConfig
 
 class ColumnClassificationConfig(BaseConfig):
@@ -8,6 +10,7 @@ class ColumnClassificationConfig(BaseConfig):
     
     def __init__(self, config_path: str = "config/column_classification.yaml"):
         super().__init__(config_path, "column classification")
+        self._compile_rules()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Fallback to hardcoded defaults if config file is missing"""
@@ -62,11 +65,65 @@ class ColumnClassificationConfig(BaseConfig):
             }
         }
     
+    def _compile_rules(self) -> None:
+        """Precompute suffix tuples and the keyword regex from the current settings"""
+        # str.endswith accepts a tuple and checks every suffix in one C-level call
+        self._primary_key_suffix_tuple = tuple(self.primary_key_suffixes)
+        self._foreign_key_suffix_tuple = tuple(self.foreign_key_suffixes)
+        self._compile_keyword_pattern()
+        # Names repeat across tables; a fresh cache per compile drops stale results
+        self._classify_cached = lru_cache(maxsize=512)(self._classify)
+    
+    def _compile_keyword_pattern(self) -> None:
+        """Compile every keyword rule into one regex with a named group per rule
+        
+        Each rule is a lookahead anchored at the start of the name, so the
+        alternation tries rules in priority order and the first rule with a
+        keyword anywhere in the name wins, in a single match call.
+        """
+        self._keyword_rules = {
+            'amount': (self.amount_keywords, 'measure', self.get_amount_business_type()),
+            'quantity': (self.quantity_keywords, 'measure', self.get_quantity_business_type()),
+            'description': (self.description_keywords, 'dimension', self.get_description_business_type()),
+            'status': (self.status_keywords, 'dimension', self.get_status_business_type()),
+            'location': (self.location_keywords, 'dimension', self.get_location_business_type()),
+        }
+        # One alternation per rule, also used on its own for column-wise scans
+        self._keyword_patterns = {name: re.compile('|'.join(map(re.escape, keywords)))
+                                  for name, (keywords, _, _) in self._keyword_rules.items() if keywords}
+        branches = [f"(?=.*?(?P<{name}>{pattern.pattern}))"
+                    for name, pattern in self._keyword_patterns.items()]
+        self._keyword_re = re.compile('|'.join(branches)) if branches else None
+    
+    def keyword_pattern(self, rule: str) -> Optional[re.Pattern]:
+        """Compiled keyword alternation for a rule, or None when it has no keywords"""
+        return self._keyword_patterns.get(rule)
+    
+    def update(self, key_path: str, value: Any) -> None:
+        """Update configuration value and recompile the classification rules"""
+        super().update(key_path, value)
+        self._compile_rules()
+    
+    def reload(self) -> bool:
+        """Reload configuration from file and recompile the classification rules"""
+        reloaded = super().reload()
+        self._compile_rules()
+        return reloaded
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved settings and recompile the classification rules"""
+        super().restore_state(state)
+        self._compile_rules()
+    
     # Primary key properties
     @property
     def primary_key_suffixes(self) -> List[str]:
         return self.get('primary_keys.suffixes', ['_sk', '_id', '_key', '_pk'])
     
+    @property
+    def primary_key_suffix_tuple(self) -> Tuple[str, ...]:
+        return self._primary_key_suffix_tuple
+    
     @property
     def primary_key_requires_not_null(self) -> bool:
         return self.get('primary_keys.requires_not_null', True)
@@ -76,6 +133,10 @@ class ColumnClassificationConfig(BaseConfig):
     def foreign_key_suffixes(self) -> List[str]:
         return self.get('foreign_keys.suffixes', ['_sk', '_fk', '_ref_id', '_foreign_key'])
     
+    @property
+    def foreign_key_suffix_tuple(self) -> Tuple[str, ...]:
+        return self._foreign_key_suffix_tuple
+    
     # Measure field properties
     @property
     def amount_keywords(self) -> List[str]:
@@ -139,70 +200,40 @@ class ColumnClassificationConfig(BaseConfig):
     
     def classify_field_by_name(self, field_name: str) -> Dict[str, Any]:
         """Classify a field based on its name and return classification info"""
-        field_lower = field_name.lower()
-        
+        # Callers get their own copy of the cached result
+        return dict(self._classify_cached(field_name.lower()))
+    
+    def _classify(self, field_lower: str) -> Dict[str, Any]:
+        """Classification of a lowercased field name"""
         # Check primary keys
-        for suffix in self.primary_key_suffixes:
-            if field_lower.endswith(suffix):
-                return {
-                    'role': 'primary_key',
-                    'business_type': 'Identifier',
-                    'reason': f'Ends with primary key suffix: {suffix}'
-                }
+        if field_lower.endswith(self._primary_key_suffix_tuple):
+            suffix = next(suffix for suffix in self._primary_key_suffix_tuple if field_lower.endswith(suffix))
+            return {
+                'role': 'primary_key',
+                'business_type': 'Identifier',
+                'reason': f'Ends with primary key suffix: {suffix}'
+            }
         
         # Check foreign keys
-        for suffix in self.foreign_key_suffixes:
-            if field_lower.endswith(suffix):
-                return {
-                    'role': 'foreign_key',
-                    'business_type': 'Identifier',
-                    'reason': f'Ends with foreign key suffix: {suffix}'
-                }
-        
-        # Check amount fields
-        for keyword in self.amount_keywords:
-            if keyword in field_lower:
-                return {
-                    'role': 'measure',
-                    'business_type': self.get_amount_business_type(),
-                    'reason': f'Contains amount keyword: {keyword}'
-                }
-        
-        # Check quantity fields
-        for keyword in self.quantity_keywords:
-            if keyword in field_lower:
-                return {
-                    'role': 'measure',
-                    'business_type': self.get_quantity_business_type(),
-                    'reason': f'Contains quantity keyword: {keyword}'
-                }
-        
-        # Check description fields
-        for keyword in self.description_keywords:
-            if keyword in field_lower:
-                return {
-                    'role': 'dimension',
-                    'business_type': self.get_description_business_type(),
-                    'reason': f'Contains description keyword: {keyword}'
-                }
-        
-        # Check status fields
-        for keyword in self.status_keywords:
-            if keyword in field_lower:
-                return {
-                    'role': 'dimension',
-                    'business_type': self.get_status_business_type(),
-                    'reason': f'Contains status keyword: {keyword}'
-                }
+        if field_lower.endswith(self._foreign_key_suffix_tuple):
+            suffix = next(suffix for suffix in self._foreign_key_suffix_tuple if field_lower.endswith(suffix))
+            return {
+                'role': 'foreign_key',
+                'business_type': 'Identifier',
+                'reason': f'Ends with foreign key suffix: {suffix}'
+            }
         
-        # Check location fields
-        for keyword in self.location_keywords:
-            if keyword in field_lower:
-                return {
-                    'role': 'dimension',
-                    'business_type': self.get_location_business_type(),
-                    'reason': f'Contains location keyword: {keyword}'
-                }
+        # Check keyword rules (amount, quantity, description, status, location) in one scan
+        match = self._keyword_re.match(field_lower) if self._keyword_re else None
+        if match:
+            rule = match.lastgroup
+            keywords, role, business_type = self._keyword_rules[rule]
+            keyword = next(keyword for keyword in keywords if keyword in field_lower)
+            return {
+                'role': role,
+                'business_type': business_type,
+                'reason': f'Contains {rule} keyword: {keyword}'
+            }
         
         # Default classification
         return {
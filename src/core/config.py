@@ -4,7 +4,7 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional, Set
 from dotenv import load_dotenv
 from pydantic import BaseModel, field_validator
 
@@ -67,15 +67,15 @@ class AppConfig(BaseModel):
     timestamp_format: str = "%Y%m%d_%H%M%S"
     csv_encoding: str = "utf-8"
 
+    # Output directories already created in this process (shared across instances)
+    _ready_dirs: ClassVar[Set[str]] = set()
+
     def __init__(self, **kwargs):
         super().__init__(
             log_level=kwargs.get('log_level', os.getenv("LOG_LEVEL", "INFO")),
             output_dir=kwargs.get('output_dir', os.getenv("OUTPUT_DIR", "./outputs")),
             anthropic_api_key=kwargs.get('anthropic_api_key', os.getenv("ANTHROPIC_API_KEY")),
         )
-        
-        # Ensure output directory exists
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
 
     def get_timestamped_filename(self, base_name: str, extension: str = "csv") -> str:
         """Generate timestamped filename"""
@@ -83,7 +83,10 @@ class AppConfig(BaseModel):
         return f"{base_name}_{timestamp}.{extension}"
 
     def get_output_path(self, filename: str) -> Path:
-        """Return full path for an output file"""
+        """Return full path for an output file, creating the output directory on first use"""
+        if self.output_dir not in AppConfig._ready_dirs:
+            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+            AppConfig._ready_dirs.add(self.output_dir)
         return Path(self.output_dir) / filename
 
 # Global config instances
@@ -23,6 +23,7 @@ class DataProcessingConfig(BaseConfig):
                 'medium_table_threshold': 100000,
                 'large_table_threshold': 1000000,
                 'bernoulli_sample_percent': 10,
+                'system_sample_percent': 1,
                 'max_sample_rows': 5000 
             },
             'profiling': {
@@ -44,6 +45,8 @@ class DataProcessingConfig(BaseConfig):
             'performance': {
                 'enable_parallel_processing': False,
                 'max_workers': 4,
+                'use_async_queries': True,
+                'result_download_threads': 8,
                 'memory_limit_mb': 1024,
                 'enable_caching': True
             }
@@ -83,6 +86,10 @@ class DataProcessingConfig(BaseConfig):
     def bernoulli_sample_percent(self) -> int:
         return self.get('sampling.bernoulli_sample_percent', 10)
     
+    @property
+    def system_sample_percent(self) -> float:
+        return self.get('sampling.system_sample_percent', 1)
+    
     @property
     def max_sample_rows(self) -> int:
         return self.get('sampling.max_sample_rows', 5000)
@@ -139,6 +146,14 @@ class DataProcessingConfig(BaseConfig):
     def max_workers(self) -> int:
         return self.get('performance.max_workers', 4)
     
+    @property
+    def use_async_queries(self) -> bool:
+        return self.get('performance.use_async_queries', True)
+    
+    @property
+    def result_download_threads(self) -> int:
+        return self.get('performance.result_download_threads', 8)
+    
     @property
     def memory_limit_mb(self) -> int:
         return self.get('performance.memory_limit_mb', 1024)
@@ -157,19 +172,22 @@ class DataProcessingConfig(BaseConfig):
         elif row_count <= self.large_table_threshold:
             return "percentage"
         else:
-            return "row_sample"
+            return "block_sample"
     
     def get_sample_clause(self, row_count: int) -> str:
-        """Generate appropriate TABLESAMPLE clause"""
+        """Generate the SAMPLE clause that follows the table reference in FROM
+        
+        Tables above the large threshold are sampled by micro-partition (SYSTEM),
+        so Snowflake skips the unsampled partitions instead of scanning every row.
+        """
         strategy = self.get_sampling_strategy(row_count)
         
         if strategy == "none":
             return ""
         elif strategy == "percentage":
-            return f"TABLESAMPLE BERNOULLI({self.bernoulli_sample_percent})"
-        else:  # row_sample
-            sample_size = min(self.max_sample_rows, self.default_sample_size)
-            return f"TABLESAMPLE ({sample_size} ROWS)"
+            return f"SAMPLE BERNOULLI ({self.bernoulli_sample_percent})"
+        else:  # block_sample
+            return f"SAMPLE SYSTEM ({self.system_sample_percent})"
     
     def format_numeric_value(self, value: float) -> str:
         """Format numeric value with configured precision"""
@@ -38,21 +38,21 @@ class CatalogPipeline:
             
             # Step 3: Collect metadata
             logger.info("Step 3: Collecting column metadata")
-            metadata_df = self.schema_discoverer.get_table_metadata(table_names)
-            if metadata_df.empty:
+            catalog_df = self.schema_discoverer.get_table_metadata(table_names)
+            if catalog_df.empty:
                 raise Exception("No column metadata found")
             
-            # Step 4: Analyze column roles
+            # Step 4: Analyze column roles (enriches the frame in place)
             logger.info("Step 4: Analyzing column roles")
-            analyzed_df = self.schema_discoverer.analyze_column_roles(metadata_df)
+            catalog_df = self.schema_discoverer.analyze_column_roles(catalog_df)
             
-            # Step 5: Profile data
+            # Steps 5-6: Profile data and generate documentation (AI agent)
+            # Each table is documented as soon as its profile is ready, so AI
+            # requests overlap with the remaining profiling queries
             logger.info("Step 5: Profiling data samples")
-            profiled_df = self.data_profiler.profile_columns(analyzed_df)
-            
-            # Step 6: Generate documentation (AI agent)
-            logger.info("Step 6: Generating AI documentation")
-            documented_df = self.documentation_agent.generate_documentation(profiled_df)
+            logger.info("Step 6: Generating AI documentation (overlapped with profiling)")
+            table_profiles = self.data_profiler.iter_table_profiles(catalog_df)
+            documented_df = self.documentation_agent.generate_documentation_stream(table_profiles)
             
             # Step 7: Save final dataset
             logger.info("Step 7: Saving final data dictionary")
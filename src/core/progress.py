@@ -1,8 +1,19 @@
 """Progress tracking utilities for database catalog operations"""
 
+import io
+import sys
 import time
+import queue
+import atexit
 import logging
-from typing import Optional, Dict, Any, Iterator, Callable
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from itertools import islice
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                wait, FIRST_COMPLETED)
+from typing import Optional, Dict, Any, Iterable, Iterator, Callable, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger("database_catalog")
@@ -14,55 +25,191 @@ except ImportError:
     TQDM_AVAILABLE = False
     logger.info("tqdm not available, using basic progress tracking")
 
+class _ForwardToCatalogLogger(logging.Handler):
+    """Hands queued progress records to the catalog logger's handler chain"""
+    
+    def emit(self, record: logging.LogRecord):
+        logger.handle(record)
+
+def _start_log_listener() -> QueueListener:
+    """Route progress records through a queue so callers never block on handler I/O"""
+    listener = getattr(progress_logger, "_queue_listener", None)
+    if listener is None:
+        log_queue = queue.SimpleQueue()
+        progress_logger.addHandler(QueueHandler(log_queue))
+        progress_logger.propagate = False
+        
+        listener = QueueListener(log_queue, _ForwardToCatalogLogger())
+        listener.start()
+        atexit.register(listener.stop)
+        progress_logger._queue_listener = listener
+    return listener
+
+progress_logger = logging.getLogger("database_catalog.progress")
+_log_listener = _start_log_listener()
+
+class _LogBuffer:
+    """Bounded buffer that batches progress lines into a single log record"""
+    
+    def __init__(self, capacity: int = 8192, flush_interval: float = 5.0):
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = io.StringIO()
+        self._lock = threading.Lock()
+        # Set while lines are waiting; one daemon thread flushes them periodically
+        self._pending = threading.Event()
+        self._flusher = None
+    
+    def push(self, line: str):
+        """Buffer a line, flushing once the buffer reaches capacity"""
+        with self._lock:
+            self._buffer.write(line)
+            self._buffer.write("\n")
+            full = self._buffer.tell() >= self.capacity
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically,
+                                                 name="progress-log-flusher", daemon=True)
+                self._flusher.start()
+        
+        if full:
+            self.flush()
+        elif not self._pending.is_set():
+            self._pending.set()
+    
+    def _flush_periodically(self):
+        """Flush lines left in the buffer so they don't go stale during slow operations"""
+        while True:
+            self._pending.wait()
+            time.sleep(self.flush_interval)
+            self.flush()
+    
+    def flush(self):
+        """Emit all buffered lines as one log record"""
+        with self._lock:
+            text = self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._pending.clear()
+        
+        if text:
+            progress_logger.info(text.rstrip("\n"))
+
+_log_buffer = _LogBuffer()
+_push_progress = _log_buffer.push
+atexit.register(_log_buffer.flush)
+
+def flush_progress_logs():
+    """Flush buffered progress lines and wait until queued records are handled"""
+    _log_buffer.flush()
+    _log_listener.stop()
+    _log_listener.start()
+
+def _compute_progress(current: int, total: int, elapsed: float,
+                      pct_scale: float) -> Tuple[float, float, float]:
+    """Return (percentage, rate per second, ETA in seconds) for a progress line"""
+    rate = current / elapsed if elapsed > 0 else 0.0
+    eta = (total - current) / rate if rate > 0 else 0.0
+    return current * pct_scale, rate, eta
+
 class ProgressTracker:
     """Unified progress tracking with multiple output methods"""
     
     def __init__(self, total: int, description: str = "Processing", 
-                 use_tqdm: bool = True, log_interval: int = 10):
+                 use_tqdm: Optional[bool] = None, log_interval: int = 10, check_every: int = 1024,
+                 mininterval: float = 0.25, miniters: int = 100, sampling_rate: int = 1):
+        if check_every <= 0 or check_every & (check_every - 1):
+            raise ValueError(f"check_every must be a power of two, got {check_every}")
+        if sampling_rate <= 0 or sampling_rate & (sampling_rate - 1):
+            raise ValueError(f"sampling_rate must be a power of two, got {sampling_rate}")
+        
         self.total = total
         self.description = description
         self.current = 0
-        self.start_time = time.time()
-        self.last_log_time = time.time()
+        self.start_time = time.monotonic()
+        self.last_log_time = self.start_time
         self.log_interval = log_interval  # Log every N seconds
+        if use_tqdm is None:
+            # Redrawing a bar into a redirected stream is slow and unreadable
+            use_tqdm = sys.stderr is not None and sys.stderr.isatty()
         self.use_tqdm = use_tqdm and TQDM_AVAILABLE
         
+        # On the log path the clock is read every update at first; while updates keep
+        # arriving well inside log_interval the gap doubles, up to `check_every`
+        self._tick = 0
+        self._check_mask = 0
+        self._max_check_mask = check_every - 1
+        self._fast_gap = log_interval / 8
+        self._last_check_time = self.start_time
+        # Only do any work at all on every `sampling_rate`-th update
+        self._sample_mask = sampling_rate - 1
+        self._bar_updates = 0
+        
+        self._final_elapsed = None
+        self._final_rate = None
+        self._closed = False
+        
+        # Log line template and percentage scale, computed once per tracker
+        self._fmt = "%s: %d/%d (%.1f%%) Rate: %.1f/s ETA: %s"
+        self._fmt_open = "%s: %d Rate: %.1f/s"
+        self._pct_scale = 100.0 / total if total else 0.0
+        
         # Initialize progress bar if available
         if self.use_tqdm:
-            self.pbar = tqdm(total=total, desc=description, unit="items")
+            if total:
+                # Small totals would otherwise only redraw on close
+                miniters = max(1, min(miniters, total // 100))
+            self.pbar = tqdm(total=total, desc=description, unit="items",
+                             mininterval=mininterval, miniters=miniters)
         else:
             self.pbar = None
-            logger.info(f"Starting {description}: 0/{total}")
+            progress_logger.info(f"Starting {description}: 0/{'?' if total is None else total}")
     
     def update(self, increment: int = 1, message: str = None):
         """Update progress by increment"""
         self.current += increment
+        self._tick += 1
+        if self._tick & self._sample_mask and (self.total is None or self.current < self.total):
+            return
         
         if self.use_tqdm and self.pbar:
-            if message:
+            self._bar_updates += 1
+            # Each postfix change redraws the bar: pass the first message, then every 64th
+            if message and (self._bar_updates & 63) == 1:
                 self.pbar.set_postfix_str(message)
-            self.pbar.update(increment)
+            # Catch up on any increments skipped by sampling
+            self.pbar.update(self.current - self.pbar.n)
         else:
-            # Log-based progress tracking
-            current_time = time.time()
-            if current_time - self.last_log_time >= self.log_interval or self.current >= self.total:
+            # Log-based progress tracking; the final update always logs
+            finished = self.total is not None and self.current >= self.total
+            if not finished and self._tick & self._check_mask:
+                return
+            
+            current_time = time.monotonic()
+            if current_time - self._last_check_time < self._fast_gap:
+                self._check_mask = min(self._check_mask * 2 + 1, self._max_check_mask)
+            else:
+                self._check_mask = 0
+            self._last_check_time = current_time
+            
+            if finished or current_time - self.last_log_time >= self.log_interval:
+                current = self.current
+                total = self.total
                 elapsed = current_time - self.start_time
-                rate = self.current / elapsed if elapsed > 0 else 0
-                eta = (self.total - self.current) / rate if rate > 0 else 0
-                
-                progress_msg = f"{self.description}: {self.current}/{self.total} "
-                progress_msg += f"({self.current/self.total*100:.1f}%) "
-                progress_msg += f"Rate: {rate:.1f}/s "
+                pct, rate, eta = _compute_progress(current, total or 0, elapsed, self._pct_scale)
+                if finished:
+                    # close() reports these instead of reading the clock again
+                    self._final_elapsed, self._final_rate = elapsed, rate
                 
-                if eta < 3600:
-                    progress_msg += f"ETA: {eta/60:.1f}m"
+                if total is None:
+                    # Open-ended stream: no percentage or ETA to report
+                    progress_msg = self._fmt_open % (self.description, current, rate)
                 else:
-                    progress_msg += f"ETA: {eta/3600:.1f}h"
-                
+                    eta_str = f"{eta/60:.1f}m" if eta < 3600 else f"{eta/3600:.1f}h"
+                    progress_msg = self._fmt % (self.description, current, total, pct, rate, eta_str)
                 if message:
                     progress_msg += f" | {message}"
                 
-                logger.info(progress_msg)
+                _push_progress(progress_msg)
                 self.last_log_time = current_time
     
     def set_description(self, description: str):
@@ -78,13 +225,23 @@ class ProgressTracker:
     
     def close(self):
         """Close the progress tracker"""
+        if self._closed:
+            return
+        self._closed = True
+        
         if self.use_tqdm and self.pbar:
+            self.pbar.update(self.current - self.pbar.n)
             self.pbar.close()
         else:
-            elapsed = time.time() - self.start_time
-            rate = self.current / elapsed if elapsed > 0 else 0
-            logger.info(f"Completed {self.description}: {self.current}/{self.total} "
-                       f"in {elapsed:.1f}s (avg {rate:.1f}/s)")
+            if self._final_elapsed is not None:
+                elapsed, rate = self._final_elapsed, self._final_rate
+            else:
+                elapsed = time.monotonic() - self.start_time
+                rate = self.current / elapsed if elapsed > 0 else 0
+            total = '?' if self.total is None else self.total
+            _log_buffer.push(f"Completed {self.description}: {self.current}/{total} "
+                             f"in {elapsed:.1f}s (avg {rate:.1f}/s)")
+            _log_buffer.flush()
     
     def __enter__(self):
         return self
@@ -92,6 +249,9 @@ class ProgressTracker:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+# (seconds per unit, unit name) tiers for reporting durations
+_UNITS = ((1.0, "seconds"), (60.0, "minutes"), (3600.0, "hours"))
+
 class OperationTimer:
     """Timer for tracking operation durations"""
     
@@ -101,24 +261,20 @@ class OperationTimer:
         self.end_time = None
         
         if log_start:
-            logger.info(f"Starting {operation_name}...")
+            progress_logger.info(f"Starting {operation_name}...")
     
     def start(self):
         """Start the timer"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         return self
     
     def stop(self):
         """Stop the timer and log duration"""
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
         duration = self.end_time - self.start_time
         
-        if duration < 60:
-            logger.info(f"Completed {self.operation_name} in {duration:.1f} seconds")
-        elif duration < 3600:
-            logger.info(f"Completed {self.operation_name} in {duration/60:.1f} minutes")
-        else:
-            logger.info(f"Completed {self.operation_name} in {duration/3600:.1f} hours")
+        scale, unit = _UNITS[0 if duration < 60 else 1 if duration < 3600 else 2]
+        _log_buffer.push("Completed %s in %.1f %s" % (self.operation_name, duration / scale, unit))
         
         return duration
     
@@ -127,7 +283,7 @@ class OperationTimer:
         """Get current duration"""
         if self.start_time is None:
             return None
-        end_time = self.end_time or time.time()
+        end_time = self.end_time or time.monotonic()
         return end_time - self.start_time
     
     def __enter__(self):
@@ -136,9 +292,10 @@ class OperationTimer:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
+        _log_buffer.flush()
 
 @contextmanager
-def progress_tracker(total: int, description: str = "Processing", **kwargs):
+def progress_tracker(total: Optional[int], description: str = "Processing", **kwargs):
     """Context manager for progress tracking"""
     tracker = ProgressTracker(total, description, **kwargs)
     try:
@@ -154,15 +311,16 @@ def operation_timer(operation_name: str):
         yield timer.start()
     finally:
         timer.stop()
+        _log_buffer.flush()
 
-def track_progress(iterable, description: str = "Processing", **kwargs):
-    """Track progress over an iterable"""
-    if hasattr(iterable, '__len__'):
-        total = len(iterable)
-    else:
-        # Convert to list to get length (might use more memory)
-        iterable = list(iterable)
-        total = len(iterable)
+def track_progress(iterable: Iterable, description: str = "Processing",
+                   estimated_total: Optional[int] = None, **kwargs):
+    """Track progress over an iterable
+    
+    Inputs without a length are streamed as-is; ``estimated_total`` is used
+    for them if given, otherwise progress is reported without a percentage.
+    """
+    total = len(iterable) if hasattr(iterable, '__len__') else estimated_total
     
     with progress_tracker(total, description, **kwargs) as tracker:
         for item in iterable:
@@ -172,83 +330,189 @@ def track_progress(iterable, description: str = "Processing", **kwargs):
 class BatchProcessor:
     """Process items in batches with progress tracking"""
     
-    def __init__(self, batch_size: int = 10, progress_description: str = "Processing batches"):
+    def __init__(self, batch_size: int = 10, progress_description: str = "Processing batches",
+                 max_workers: int = 1, io_bound: bool = True, ordered: bool = True):
         self.batch_size = batch_size
         self.progress_description = progress_description
+        self.max_workers = max_workers
+        self.io_bound = io_bound  # Threads for I/O-bound work, processes for CPU-bound
+        self.ordered = ordered
+    
+    def _iter_batches(self, items: Iterable) -> Iterator:
+        """Yield batches, slicing sequences and streaming any other iterable"""
+        if hasattr(items, '__len__') and hasattr(items, '__getitem__'):
+            for i in range(0, len(items), self.batch_size):
+                yield items[i:i + self.batch_size]
+            return
+        
+        # A fresh list per batch: processor_func may hold on to the batch it was given
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
     
-    def process_batches(self, items, processor_func: Callable, **kwargs):
-        """Process items in batches with progress tracking"""
-        total_items = len(items) if hasattr(items, '__len__') else len(list(items))
-        num_batches = (total_items + self.batch_size - 1) // self.batch_size
+    def _run_sequential(self, batches: Iterator, processor_func: Callable) -> Iterator:
+        """Run batches one at a time, yielding (batch_num, size, result, error)"""
+        for batch_num, batch in enumerate(batches, 1):
+            try:
+                batch_result, error = processor_func(batch), None
+            except Exception as e:
+                batch_result, error = None, e
+            yield batch_num, len(batch), batch_result, error
+    
+    def _run_parallel(self, batches: Iterator, processor_func: Callable) -> Iterator:
+        """Run batches on a worker pool, yielding (batch_num, size, result, error)
+        
+        At most ``max_workers * 2`` batches are in flight, so generator inputs
+        are still pulled lazily.
+        """
+        executor_cls = ThreadPoolExecutor if self.io_bound else ProcessPoolExecutor
+        window = self.max_workers * 2
+        pending = deque()
+        
+        with executor_cls(max_workers=self.max_workers) as executor:
+            for batch_num, batch in enumerate(batches, 1):
+                pending.append((batch_num, len(batch), executor.submit(processor_func, batch)))
+                if len(pending) >= window:
+                    yield from self._drain(pending, keep=window - 1)
+            yield from self._drain(pending, keep=0)
+    
+    def _drain(self, pending: deque, keep: int) -> Iterator:
+        """Collect finished futures until at most ``keep`` remain pending"""
+        while len(pending) > keep:
+            if self.ordered:
+                finished = [pending.popleft()]
+            else:
+                wait([future for _, _, future in pending], return_when=FIRST_COMPLETED)
+                finished = [entry for entry in pending if entry[2].done()]
+                for entry in finished:
+                    pending.remove(entry)
+            
+            for batch_num, size, future in finished:
+                error = future.exception()
+                yield batch_num, size, None if error else future.result(), error
+    
+    def process_batches(self, items: Iterable, processor_func: Callable,
+                        expected_total: Optional[int] = None, **kwargs):
+        """Process items in batches with progress tracking
+        
+        Generators are consumed one batch at a time rather than materialized;
+        pass ``expected_total`` to get batch counts for inputs without a length.
+        With ``max_workers > 1`` batches run concurrently and progress is
+        reported as they complete.
+        """
+        total_items = len(items) if hasattr(items, '__len__') else expected_total
+        num_batches = None
+        if total_items is not None:
+            num_batches = (total_items + self.batch_size - 1) // self.batch_size
+        
+        batches = self._iter_batches(items)
+        if self.max_workers > 1:
+            outcomes = self._run_parallel(batches, processor_func)
+        else:
+            outcomes = self._run_sequential(batches, processor_func)
         
         results = []
+        processed = 0
+        completed = 0
         
         with progress_tracker(num_batches, f"{self.progress_description} (batch_size={self.batch_size})", 
                             **kwargs) as tracker:
             
-            for i in range(0, total_items, self.batch_size):
-                batch = items[i:i + self.batch_size]
-                batch_num = i // self.batch_size + 1
+            for batch_num, size, batch_result, error in outcomes:
+                processed += size
+                completed += 1
                 
-                tracker.set_postfix(batch=f"{batch_num}/{num_batches}", 
-                                   items=f"{min(i + self.batch_size, total_items)}/{total_items}")
+                tracker.set_postfix(batch=f"{completed}/{num_batches or '?'}", 
+                                   items=f"{processed}/{total_items or '?'}")
                 
-                try:
-                    batch_result = processor_func(batch)
-                    if isinstance(batch_result, list):
-                        results.extend(batch_result)
-                    else:
-                        results.append(batch_result)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing batch {batch_num}: {e}")
+                if error is not None:
+                    logger.error(f"Error processing batch {batch_num}: {error}")
                     # Could add error handling strategy here
                     continue
                 
+                if isinstance(batch_result, list):
+                    results.extend(batch_result)
+                else:
+                    results.append(batch_result)
+                
                 tracker.update(1)
         
         return results
 
+class _OperationStats(Mapping):
+    """Read-only per-operation view that builds each entry on access"""
+    
+    def __init__(self, completed: Dict[str, int], totals: Dict[str, int]):
+        self._completed = completed
+        self._totals = totals
+    
+    def __getitem__(self, op: str) -> Dict[str, Any]:
+        total = self._totals[op]
+        completed = self._completed[op]
+        return {
+            'completed': completed,
+            'total': total,
+            'percentage': (completed / total * 100) if total > 0 else 0
+        }
+    
+    def __iter__(self):
+        return iter(self._totals)
+    
+    def __len__(self) -> int:
+        return len(self._totals)
+
 class ProgressReporter:
     """Advanced progress reporting with multiple metrics"""
     
     def __init__(self, total_operations: Dict[str, int]):
         self.total_operations = total_operations
         self.completed_operations = {key: 0 for key in total_operations.keys()}
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.operation_timers = {}
+        
+        # Running sums so polling does not re-add every operation
+        self._total_items_sum = sum(total_operations.values())
+        self._completed_sum = 0
+        self._operation_stats = _OperationStats(self.completed_operations, self.total_operations)
     
     def start_operation(self, operation_name: str):
         """Start tracking a specific operation"""
-        self.operation_timers[operation_name] = time.time()
-        logger.info(f"Starting operation: {operation_name}")
+        self.operation_timers[operation_name] = time.monotonic()
+        progress_logger.info(f"Starting operation: {operation_name}")
     
     def complete_operation(self, operation_name: str, count: int = 1):
         """Mark operation as completed"""
         if operation_name not in self.completed_operations:
-            logger.warning(f"Unknown operation: {operation_name}")
+            progress_logger.warning(f"Unknown operation: {operation_name}")
             return
         
         self.completed_operations[operation_name] += count
+        self._completed_sum += count
         
         # Log completion if operation is finished
         if operation_name in self.operation_timers:
-            duration = time.time() - self.operation_timers[operation_name]
+            duration = time.monotonic() - self.operation_timers[operation_name]
             del self.operation_timers[operation_name]
             
             total = self.total_operations[operation_name]
             completed = self.completed_operations[operation_name]
             
             if completed >= total:
-                logger.info(f"Completed operation: {operation_name} "
+                progress_logger.info(f"Completed operation: {operation_name} "
                           f"({completed}/{total}) in {duration:.1f}s")
     
     def get_overall_progress(self) -> Dict[str, Any]:
-        """Get overall progress statistics"""
-        total_items = sum(self.total_operations.values())
-        completed_items = sum(self.completed_operations.values())
+        """Get overall progress statistics
+        
+        ``operations`` is a live read-only mapping; entries are computed on access.
+        """
+        total_items = self._total_items_sum
+        completed_items = self._completed_sum
         
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = time.monotonic() - self.start_time
         completion_rate = completed_items / elapsed_time if elapsed_time > 0 else 0
         
         eta = (total_items - completed_items) / completion_rate if completion_rate > 0 else 0
@@ -260,15 +524,7 @@ class ProgressReporter:
             'elapsed_time_seconds': elapsed_time,
             'completion_rate_per_second': completion_rate,
             'eta_seconds': eta,
-            'operations': {
-                op: {
-                    'completed': self.completed_operations[op],
-                    'total': self.total_operations[op],
-                    'percentage': (self.completed_operations[op] / self.total_operations[op] * 100) 
-                                if self.total_operations[op] > 0 else 0
-                }
-                for op in self.total_operations.keys()
-            }
+            'operations': self._operation_stats
         }
     
     def print_progress_report(self):
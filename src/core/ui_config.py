@@ -1,237 +1,324 @@
 """UI configuration loader - Refactored to use BaseConfig"""
 
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Iterable, List
 from src.core.base_config import BaseConfig
 
+# Hardcoded fallback settings, built once at import
+_DEFAULT_UI_CONFIG: Dict[str, Any] = {
+    'server': {
+        'host': '0.0.0.0',
+        'port': 7860,
+        'share': False,
+        'inbrowser': True,
+        'max_threads': 40,
+        'show_error': True,
+        'show_api': True
+    },
+    'display': {
+        'results_per_page': 50,
+        'max_search_results': 200,
+        'description_truncate_length': 100,
+        'sample_values_truncate_length': 150,
+        'long_text_indicator': '...',
+        'max_columns_in_context': 10,
+        'show_row_numbers': True,
+        'enable_sorting': True
+    },
+    'styling': {
+        'table_border': '1px solid #ddd',
+        'cell_padding': '8px',
+        'header_background': '#f2f2f2',
+        'header_text_color': '#333',
+        'even_row_background': '#f9f9f9',
+        'odd_row_background': '#ffffff',
+        'hover_background': '#e6f3ff',
+        'font_family': 'Arial, sans-serif',
+        'font_size': '14px',
+        'header_font_weight': 'bold',
+        'code_background': '#f5f5f5',
+        'code_border': '1px solid #ccc',
+        'code_padding': '2px 4px'
+    },
+    'interface': {
+        'default_tab': 'Search Catalog',
+        'search_placeholder': 'Search tables, columns, or descriptions...',
+        'enable_advanced_search': True,
+        'search_history_size': 10,
+        'show_table_stats': True,
+        'enable_column_filtering': True,
+        'enable_csv_export': True,
+        'enable_json_export': False
+    },
+    'theme': {
+        'primary_color': 'blue',
+        'secondary_color': 'yellow',
+        'neutral_color': 'gray',
+        'success_color': 'green',
+        'warning_color': 'orange',
+        'error_color': 'red',
+        'enable_dark_mode': False,
+        'dark_background': '#1a1a1a',
+        'dark_text': '#ffffff'
+    },
+    'performance': {
+        'lazy_loading': True,
+        'pagination_enabled': True,
+        'debounce_search_ms': 300,
+        'use_search_index': True,
+        'cache_search_results': True,
+        'cache_duration_minutes': 30
+    }
+}
+
 class UIConfig(BaseConfig):
     """Loads and manages UI configuration using BaseConfig"""
     
     def __init__(self, config_path: str = "config/ui_settings.yaml"):
         super().__init__(config_path, "UI settings")
+        self._snapshot()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Fallback to hardcoded defaults"""
-        return {
-            'server': {
-                'host': '0.0.0.0',
-                'port': 7860,
-                'share': False,
-                'inbrowser': True,
-                'max_threads': 40,
-                'show_error': True,
-                'show_api': True
-            },
-            'display': {
-                'results_per_page': 50,
-                'max_search_results': 200,
-                'description_truncate_length': 100,
-                'sample_values_truncate_length': 150,
-                'long_text_indicator': '...',
-                'max_columns_in_context': 10,
-                'show_row_numbers': True,
-                'enable_sorting': True
-            },
-            'styling': {
-                'table_border': '1px solid #ddd',
-                'cell_padding': '8px',
-                'header_background': '#f2f2f2',
-                'header_text_color': '#333',
-                'even_row_background': '#f9f9f9',
-                'odd_row_background': '#ffffff',
-                'hover_background': '#e6f3ff',
-                'font_family': 'Arial, sans-serif',
-                'font_size': '14px',
-                'header_font_weight': 'bold',
-                'code_background': '#f5f5f5',
-                'code_border': '1px solid #ccc',
-                'code_padding': '2px 4px'
-            },
-            'interface': {
-                'default_tab': 'Search Catalog',
-                'search_placeholder': 'Search tables, columns, or descriptions...',
-                'enable_advanced_search': True,
-                'search_history_size': 10,
-                'show_table_stats': True,
-                'enable_column_filtering': True,
-                'enable_csv_export': True,
-                'enable_json_export': False
-            },
-            'theme': {
-                'primary_color': 'blue',
-                'secondary_color': 'yellow',
-                'neutral_color': 'gray',
-                'success_color': 'green',
-                'warning_color': 'orange',
-                'error_color': 'red',
-                'enable_dark_mode': False,
-                'dark_background': '#1a1a1a',
-                'dark_text': '#ffffff'
-            },
-            'performance': {
-                'lazy_loading': True,
-                'pagination_enabled': True,
-                'debounce_search_ms': 300,
-                'cache_search_results': True,
-                'cache_duration_minutes': 30
-            }
-        }
+        # Copied because update() mutates the active config in place
+        return copy.deepcopy(_DEFAULT_UI_CONFIG)
+    
+    def _snapshot(self) -> None:
+        """Resolve settings and CSS strings once instead of walking the config per access"""
+        get = self.get
+        self._host = get('server.host', '0.0.0.0')
+        self._port = get('server.port', 7860)
+        self._share = get('server.share', False)
+        self._inbrowser = get('server.inbrowser', True)
+        self._max_threads = get('server.max_threads', 40)
+        self._show_error = get('server.show_error', True)
+        self._show_api = get('server.show_api', True)
+        
+        self._results_per_page = get('display.results_per_page', 50)
+        self._max_search_results = get('display.max_search_results', 200)
+        self._description_truncate_length = get('display.description_truncate_length', 100)
+        self._sample_values_truncate_length = get('display.sample_values_truncate_length', 150)
+        self._long_text_indicator = get('display.long_text_indicator', '...')
+        self._max_columns_in_context = get('display.max_columns_in_context', 10)
+        
+        self._table_border = get('styling.table_border', '1px solid #ddd')
+        self._cell_padding = get('styling.cell_padding', '8px')
+        self._header_background = get('styling.header_background', '#f2f2f2')
+        self._header_text_color = get('styling.header_text_color', '#333')
+        self._font_family = get('styling.font_family', 'Arial, sans-serif')
+        self._font_size = get('styling.font_size', '14px')
+        self._even_row_background = get('styling.even_row_background', '#f9f9f9')
+        self._odd_row_background = get('styling.odd_row_background', '#ffffff')
+        self._hover_background = get('styling.hover_background', '#e6f3ff')
+        
+        self._search_placeholder = get('interface.search_placeholder', 'Search tables, columns, or descriptions...')
+        self._default_tab = get('interface.default_tab', 'Search Catalog')
+        self._enable_csv_export = get('interface.enable_csv_export', True)
+        self._use_search_index = get('performance.use_search_index', True)
+        
+        self._primary_color = get('theme.primary_color', 'blue')
+        self._success_color = get('theme.success_color', 'green')
+        self._warning_color = get('theme.warning_color', 'orange')
+        self._enable_dark_mode = get('theme.enable_dark_mode', False)
+        
+        # Pre-rendered styles used for every table the UI renders
+        self._table_style = f"""
+        width: 100%; 
+        border-collapse: collapse; 
+        font-family: {self._font_family}; 
+        font-size: {self._font_size};
+        """
+        self._header_style = f"""
+        border: {self._table_border}; 
+        padding: {self._cell_padding}; 
+        background-color: {self._header_background}; 
+        color: {self._header_text_color}; 
+        font-weight: {get('styling.header_font_weight', 'bold')};
+        """
+        self._cell_style = f"""
+        border: {self._table_border}; 
+        padding: {self._cell_padding};
+        """
+        self._code_cell_style = self._cell_style + f"""
+            background-color: {get('styling.code_background', '#f5f5f5')}; 
+            border: {get('styling.code_border', '1px solid #ccc')}; 
+            padding: {get('styling.code_padding', '2px 4px')};
+            font-family: monospace;
+            """
+    
+    def update(self, key_path: str, value: Any) -> None:
+        """Update configuration value and refresh the resolved settings"""
+        super().update(key_path, value)
+        self._snapshot()
+    
+    def reload(self) -> bool:
+        """Reload configuration from file and refresh the resolved settings"""
+        reloaded = super().reload()
+        self._snapshot()
+        return reloaded
+    
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore saved settings and refresh the resolved settings"""
+        super().restore_state(state)
+        self._snapshot()
     
     # Server configuration properties
     @property
     def host(self) -> str:
-        return self.get('server.host', '0.0.0.0')
+        return self._host
     
     @property
     def port(self) -> int:
-        return self.get('server.port', 7860)
+        return self._port
     
     @property
     def share(self) -> bool:
-        return self.get('server.share', False)
+        return self._share
     
     @property
     def inbrowser(self) -> bool:
-        return self.get('server.inbrowser', True)
+        return self._inbrowser
     
     @property
     def max_threads(self) -> int:
-        return self.get('server.max_threads', 40)
+        return self._max_threads
     
     @property
     def show_error(self) -> bool:
-        return self.get('server.show_error', True)
+        return self._show_error
     
     @property
     def show_api(self) -> bool:
-        return self.get('server.show_api', True)
+        return self._show_api
     
     # Display configuration properties
     @property
     def results_per_page(self) -> int:
-        return self.get('display.results_per_page', 50)
+        return self._results_per_page
     
     @property
     def max_search_results(self) -> int:
-        return self.get('display.max_search_results', 200)
+        return self._max_search_results
     
     @property
     def description_truncate_length(self) -> int:
-        return self.get('display.description_truncate_length', 100)
+        return self._description_truncate_length
     
     @property
     def sample_values_truncate_length(self) -> int:
-        return self.get('display.sample_values_truncate_length', 150)
+        return self._sample_values_truncate_length
     
     @property
     def long_text_indicator(self) -> str:
-        return self.get('display.long_text_indicator', '...')
+        return self._long_text_indicator
     
     @property
     def max_columns_in_context(self) -> int:
-        return self.get('display.max_columns_in_context', 10)
+        return self._max_columns_in_context
     
     # Styling properties
     @property
     def table_border(self) -> str:
-        return self.get('styling.table_border', '1px solid #ddd')
+        return self._table_border
     
     @property
     def cell_padding(self) -> str:
-        return self.get('styling.cell_padding', '8px')
+        return self._cell_padding
     
     @property
     def header_background(self) -> str:
-        return self.get('styling.header_background', '#f2f2f2')
+        return self._header_background
     
     @property
     def header_text_color(self) -> str:
-        return self.get('styling.header_text_color', '#333')
+        return self._header_text_color
     
     @property
     def font_family(self) -> str:
-        return self.get('styling.font_family', 'Arial, sans-serif')
+        return self._font_family
     
     @property
     def font_size(self) -> str:
-        return self.get('styling.font_size', '14px')
+        return self._font_size
+    
+    @property
+    def even_row_background(self) -> str:
+        return self._even_row_background
+    
+    @property
+    def odd_row_background(self) -> str:
+        return self._odd_row_background
+    
+    @property
+    def hover_background(self) -> str:
+        return self._hover_background
     
     # Interface properties
     @property
     def search_placeholder(self) -> str:
-        return self.get('interface.search_placeholder', 'Search tables, columns, or descriptions...')
+        return self._search_placeholder
     
     @property
     def default_tab(self) -> str:
-        return self.get('interface.default_tab', 'Search Catalog')
+        return self._default_tab
     
     @property
     def enable_csv_export(self) -> bool:
-        return self.get('interface.enable_csv_export', True)
+        return self._enable_csv_export
+    
+    # Performance properties
+    @property
+    def use_search_index(self) -> bool:
+        return self._use_search_index
     
     # Theme properties
     @property
     def primary_color(self) -> str:
-        return self.get('theme.primary_color', 'blue')
+        return self._primary_color
     
     @property
     def success_color(self) -> str:
-        return self.get('theme.success_color', 'green')
+        return self._success_color
+    
+    @property
+    def warning_color(self) -> str:
+        return self._warning_color
     
     @property
     def enable_dark_mode(self) -> bool:
-        return self.get('theme.enable_dark_mode', False)
+        return self._enable_dark_mode
     
     # Helper methods
     def get_table_style(self) -> str:
         """Generate CSS style for tables"""
-        return f"""
-        width: 100%; 
-        border-collapse: collapse; 
-        font-family: {self.font_family}; 
-        font-size: {self.font_size};
-        """
+        return self._table_style
     
     def get_header_style(self) -> str:
         """Generate CSS style for table headers"""
-        header_font_weight = self.get('styling.header_font_weight', 'bold')
-        return f"""
-        border: {self.table_border}; 
-        padding: {self.cell_padding}; 
-        background-color: {self.header_background}; 
-        color: {self.header_text_color}; 
-        font-weight: {header_font_weight};
-        """
+        return self._header_style
     
     def get_cell_style(self, is_code: bool = False) -> str:
         """Generate CSS style for table cells"""
-        base_style = f"""
-        border: {self.table_border}; 
-        padding: {self.cell_padding};
-        """
-        
-        if is_code:
-            code_background = self.get('styling.code_background', '#f5f5f5')
-            code_border = self.get('styling.code_border', '1px solid #ccc')
-            code_padding = self.get('styling.code_padding', '2px 4px')
-            
-            base_style += f"""
-            background-color: {code_background}; 
-            border: {code_border}; 
-            padding: {code_padding};
-            font-family: monospace;
-            """
-        
-        return base_style
+        return self._code_cell_style if is_code else self._cell_style
     
     def truncate_text(self, text: str, max_length: int = None, is_description: bool = False) -> str:
         """Truncate text according to configuration"""
         if max_length is None:
-            max_length = self.description_truncate_length if is_description else self.sample_values_truncate_length
+            max_length = self._description_truncate_length if is_description else self._sample_values_truncate_length
         
         if len(text) <= max_length:
             return text
         
-        return text[:max_length] + self.long_text_indicator
+        return f"{text[:max_length]}{self._long_text_indicator}"
+    
+    def truncate_many(self, texts: Iterable[str], max_length: int = None,
+                      is_description: bool = False) -> List[str]:
+        """Truncate a column of texts without a method call per cell"""
+        if max_length is None:
+            max_length = self._description_truncate_length if is_description else self._sample_values_truncate_length
+        indicator = self._long_text_indicator
+        
+        return [text if len(text) <= max_length else f"{text[:max_length]}{indicator}" for text in texts]
     
     def get_gradio_theme_config(self) -> Dict[str, Any]:
         """Get Gradio theme configuration - Using BaseConfig dot notation"""
@@ -243,6 +330,8 @@ class UIConfig(BaseConfig):
     
     def validate(self) -> bool:
         """Validate configuration values"""
+        # Re-resolve first so a freshly reloaded config is what gets checked
+        self._snapshot()
         try:
             # Validate port range
             if not (1024 <= self.port <= 65535):
@@ -1,43 +1,313 @@
 """Data profiling tool for sampling and statistics - Updated with configuration"""
 
+import json
 import pandas as pd
-from typing import Dict, Any, List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Iterator, Tuple
 from src.core.config import DB_CONFIG, APP_CONFIG, logger
 from src.tools.database_connector import DatabaseConnector
 
 # NEW: Import the data processing config
 from src.core.data_processing_config import DATA_PROCESSING_CONFIG
 
+NUMERIC_TYPES = ('NUMBER', 'INTEGER', 'BIGINT', 'DECIMAL')
+TEXT_TYPES = ('TEXT', 'VARCHAR', 'CHAR')
+DATE_TYPES = ('DATE', 'DATETIME', 'TIMESTAMP')
+
+def _column_kind(data_type: str) -> str:
+    """Map a Snowflake data type onto the profile kind used for it"""
+    data_type = data_type.upper()
+    if data_type in NUMERIC_TYPES:
+        return 'numeric'
+    if data_type in TEXT_TYPES:
+        return 'text'
+    if data_type in DATE_TYPES:
+        return 'date'
+    return ''
+
+def _quote_identifier(name: str) -> str:
+    """Double-quote an identifier as stored in INFORMATION_SCHEMA (handles reserved words like ORDER)"""
+    return '"' + name.replace('"', '""') + '"'
+
+def _format_numeric(value: Any) -> Any:
+    return DATA_PROCESSING_CONFIG.format_numeric_value(float(value)) if value is not None else None
+
+def _format_date(value: Any) -> Any:
+    return str(value) if value else None
+
+def _as_is(value: Any) -> Any:
+    return value
+
+# Aggregates profiled per column kind: (profile key, result alias suffix, SQL template, formatter)
+AGG_SPECS = {
+    'numeric': (
+        ('min_value', 'min', 'MIN({})', _format_numeric),
+        ('max_value', 'max', 'MAX({})', _format_numeric),
+        ('avg_value', 'avg', 'AVG({})', _format_numeric),
+        ('distinct_count', 'dc', 'COUNT(DISTINCT {})', _as_is),
+    ),
+    'date': (
+        ('min_value', 'min', 'MIN({})', _format_date),
+        ('max_value', 'max', 'MAX({})', _format_date),
+        ('distinct_count', 'dc', 'COUNT(DISTINCT {})', _as_is),
+    ),
+    # Text columns are profiled from sample values; only the distinct count is aggregated
+    'text': (
+        ('distinct_count', 'dc', 'COUNT(DISTINCT {})', _as_is),
+    ),
+}
+
+# Stands in for the table reference in cached query text; NUL never appears in
+# Snowflake identifiers, so substituting it cannot touch column names
+_TABLE_PLACEHOLDER = "\0table\0"
+
+def _table_stats_query(table_ref: str, sample_clause: str, columns: Tuple[Tuple[str, str], ...]) -> str:
+    """Aggregate query for every (column, kind) of a table, aliased by position: c<i>_min, ..."""
+    return _stats_query_template(sample_clause, columns).replace(_TABLE_PLACEHOLDER, table_ref)
+
+def _table_sample_query(table_ref: str, sample_clause: str, columns: Tuple[Tuple[int, str], ...],
+                        max_values: int, max_length: int) -> str:
+    """Server-side sample text for (position, column) text columns, aliased c<i>_sample"""
+    template = _sample_query_template(sample_clause, columns, max_values, max_length)
+    return template.replace(_TABLE_PLACEHOLDER, table_ref)
+
+# The templates are keyed on a table's shape (columns and sampling), not its name,
+# so tables sharing a column layout reuse the same text
+
+@lru_cache(maxsize=256)
+def _stats_query_template(sample_clause: str, columns: Tuple[Tuple[str, str], ...]) -> str:
+    """Aggregate query text with the table left as a placeholder"""
+    select_list = [
+        f"{template.format(column)} AS c{i}_{alias}"
+        for i, (column, kind) in enumerate((_quote_identifier(name), kind) for name, kind in columns)
+        for _, alias, template, _ in AGG_SPECS.get(kind, ())
+    ]
+    
+    if not select_list:
+        return ""
+    
+    return f"""
+        SELECT {', '.join(select_list)}
+        FROM {_TABLE_PLACEHOLDER} {sample_clause}
+        """
+
+@lru_cache(maxsize=256)
+def _sample_query_template(sample_clause: str, columns: Tuple[Tuple[int, str], ...],
+                           max_values: int, max_length: int) -> str:
+    """Sample-values query text with the table left as a placeholder
+    
+    Values are truncated and joined by LISTAGG so one short string per column
+    crosses the wire.
+    """
+    subqueries = [
+        f"""(
+                    SELECT LISTAGG(IFF(LENGTH(v) > {max_length}, SUBSTR(v, 1, {max_length}) || '...', v), '; ')
+                        WITHIN GROUP (ORDER BY v)
+                    FROM (
+                        SELECT DISTINCT {column} AS v
+                        FROM {_TABLE_PLACEHOLDER} {sample_clause}
+                        WHERE {column} IS NOT NULL AND {column} <> ''
+                        ORDER BY v
+                        LIMIT {max_values}
+                    )
+                ) AS c{i}_sample"""
+        for i, column in ((i, _quote_identifier(column_name)) for i, column_name in columns)
+    ]
+    return "SELECT " + ",\n".join(subqueries)
+
 class DataProfiler:
     """Profiles data and collects samples/statistics"""
     
     def __init__(self, db_connector: DatabaseConnector):
         self.db = db_connector
+        self._row_counts: Dict[str, int] = {}
+        self._db_schema = f"{DB_CONFIG.database}.{DB_CONFIG.schema_name}"
+        self._table_refs: Dict[str, str] = {}
     
     def profile_columns(self, metadata_df: pd.DataFrame) -> pd.DataFrame:
-        """Profile columns with samples and statistics"""
+        """Profile columns with samples and statistics
+
+        Profile fields are written onto ``metadata_df`` in place so the pipeline
+        threads a single frame through analysis and profiling.
+        """
         logger.info(f"Profiling {len(metadata_df)} columns")
+        self._seed_row_counts(metadata_df)
+        self._load_row_counts(metadata_df['table_name'].unique())
+        
+        groups = self._table_groups(metadata_df)
+        return self._write_profiles(metadata_df, (
+            (positions, table_profiles)
+            for (_, positions, _), table_profiles in zip(groups, self._profile_tables(groups))
+        ))
+    
+    def iter_table_profiles(self, metadata_df: pd.DataFrame) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Profile columns table by table, yielding each table as soon as it is profiled"""
+        self._seed_row_counts(metadata_df)
+        self._load_row_counts(metadata_df['table_name'].unique())
         
-        enriched_data = []
+        if self._async_enabled():
+            # Every table's queries are submitted before the first result is awaited,
+            # so Snowflake runs them side by side while earlier tables are yielded
+            logger.info(f"Profiling {len(metadata_df)} columns")
+            groups = self._table_groups(metadata_df)
+            for (table_name, positions, _), table_profiles in zip(groups, self._profile_tables_async(groups)):
+                table_df = metadata_df.iloc[positions].copy()
+                yield table_name, self._write_profiles(table_df, [(range(len(positions)), table_profiles)])
+            return
         
-        for _, row in metadata_df.iterrows():
-            table_name = row['table_name']
-            column_name = row['column_name']
-            data_type = row['data_type']
+        groups = metadata_df.groupby('table_name', sort=False, observed=True)
+        with ThreadPoolExecutor(max_workers=self._worker_count(groups.ngroups)) as executor:
+            futures = [(table_name, executor.submit(self.profile_columns, table_df))
+                       for table_name, table_df in groups]
             
+            # Yield in table order; later tables keep profiling in the background
+            for table_name, future in futures:
+                yield table_name, future.result()
+    
+    @staticmethod
+    def _table_groups(metadata_df: pd.DataFrame) -> List[Tuple[str, Any, List[Tuple[str, str]]]]:
+        """(table name, row positions, [(column name, data type)]) per table, in first-seen order"""
+        column_names = metadata_df['column_name'].to_numpy()
+        data_types = metadata_df['data_type'].to_numpy()
+        
+        # One round of queries per table instead of several per column
+        return [
+            (table_name, positions, [(column_names[i], data_types[i]) for i in positions])
+            for table_name, positions in metadata_df.groupby('table_name', sort=False, observed=True).indices.items()
+        ]
+    
+    @staticmethod
+    def _write_profiles(df: pd.DataFrame, table_profiles: Iterable[Tuple[Any, List[Dict[str, Any]]]]) -> pd.DataFrame:
+        """Write (row positions, column profiles) pairs onto df, one column per profile field"""
+        # Scatter each table's profiles straight into per-field columns as it
+        # finishes, instead of keeping every dict around for a final DataFrame
+        field_values: Dict[str, List[Any]] = {}
+        for positions, profiles in table_profiles:
+            for i, profile in zip(positions, profiles):
+                for field, value in profile.items():
+                    if field not in field_values:
+                        field_values[field] = [None] * len(df)
+                    field_values[field][i] = value
+        
+        # One vectorized write per profile field onto the existing frame
+        for field, values in field_values.items():
+            df[field] = values
+        
+        return df
+    
+    def _async_enabled(self) -> bool:
+        """Whether queries can be submitted without waiting on their results"""
+        return DATA_PROCESSING_CONFIG.use_async_queries and hasattr(self.db, 'submit_async')
+    
+    def _worker_count(self, table_count: int) -> int:
+        """Number of tables to profile concurrently, per the performance settings"""
+        if not DATA_PROCESSING_CONFIG.enable_parallel_processing:
+            return 1
+        return max(1, min(DATA_PROCESSING_CONFIG.max_workers, table_count))
+    
+    def _profile_tables(self, groups: List[Tuple[str, Any, List[Tuple[str, str]]]]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each table's column profiles in group order"""
+        if self._async_enabled():
+            yield from self._profile_tables_async(groups)
+            return
+        
+        # Tables are independent, so their queries can wait on Snowflake concurrently
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(groups))) as executor:
+            yield from executor.map(lambda group: self._profile_table_safely(group[0], group[2]), groups)
+    
+    def _profile_tables_async(self, groups: List[Tuple[str, Any, List[Tuple[str, str]]]]) -> Iterator[List[Dict[str, Any]]]:
+        """Submit every table's bulk queries up front, then collect results in order
+        
+        Snowflake executes the submitted queries side by side, so no client threads
+        are needed to overlap them.
+        """
+        submitted = []
+        for table_name, _, columns in groups:
             try:
-                profile_data = self._profile_single_column(table_name, column_name, data_type)
-                
-                # Merge with existing metadata
-                enriched_row = dict(row)
-                enriched_row.update(profile_data)
-                enriched_data.append(enriched_row)
-                
+                kinds, queries = self._table_queries(table_name, columns)
+                submitted.append((kinds, [self.db.submit_async(query) for query in queries], None))
             except Exception as e:
-                logger.warning(f"Failed to profile {table_name}.{column_name}: {str(e)}")
-                enriched_data.append(dict(row))
+                submitted.append((None, None, e))
         
-        return pd.DataFrame(enriched_data)
+        for (table_name, _, columns), (kinds, query_ids, error) in zip(groups, submitted):
+            if error is None:
+                try:
+                    results = [self.db.fetch_async(query_id) for query_id in query_ids]
+                    yield self._table_profiles(kinds, [rows[0] if rows else {} for rows in results])
+                    continue
+                except Exception as e:
+                    error = e
+            yield self._profile_columns_individually(table_name, columns, error)
+    
+    def _profile_table_safely(self, table_name: str, columns: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Profile a table in bulk, falling back to one column at a time if that fails"""
+        try:
+            return self._profile_table_bulk(table_name, columns)
+        except Exception as e:
+            return self._profile_columns_individually(table_name, columns, e)
+    
+    def _profile_columns_individually(self, table_name: str, columns: List[Tuple[str, str]],
+                                      error: Exception) -> List[Dict[str, Any]]:
+        """Fallback after a failed bulk query"""
+        logger.warning(f"Bulk profiling failed for {table_name}, profiling columns individually: {str(error)}")
+        return [self._profile_column_safely(table_name, column_name, data_type)
+                for column_name, data_type in columns]
+    
+    def _profile_table_bulk(self, table_name: str, columns: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Profile every column of a table with one aggregate query and one sample-values query"""
+        kinds, queries = self._table_queries(table_name, columns)
+        results = [self.db.execute_query(query) for query in queries]
+        return self._table_profiles(kinds, [rows[0] if rows else {} for rows in results])
+    
+    def _table_queries(self, table_name: str, columns: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        """Column kinds plus the aggregate and (if there are text columns) sample-values queries"""
+        row_count = self._get_table_row_count(table_name)
+        sample_clause = self._get_sample_clause(row_count)
+        table_ref = self._table_ref(table_name)
+        
+        kinds = [_column_kind(data_type) for _, data_type in columns]
+        
+        # Query text is built once per table shape and stays byte-identical
+        # between runs for Snowflake's result cache
+        stats_query = _table_stats_query(table_ref, sample_clause,
+                                         tuple((column_name, kind) for (column_name, _), kind in zip(columns, kinds)))
+        if not stats_query:
+            return kinds, []
+        
+        text_columns = tuple((i, columns[i][0]) for i, kind in enumerate(kinds) if kind == 'text')
+        if not text_columns:
+            return kinds, [stats_query]
+        
+        sample_query = _table_sample_query(table_ref, sample_clause, text_columns,
+                                           DATA_PROCESSING_CONFIG.max_distinct_values,
+                                           DATA_PROCESSING_CONFIG.max_individual_value_length)
+        return kinds, [stats_query, sample_query]
+    
+    def _table_profiles(self, kinds: List[str], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Split the aggregate row (and sample-values row, if any) into per-column profiles"""
+        stats = rows[0] if rows else {}
+        samples = rows[1] if len(rows) > 1 else {}
+        
+        profiles = []
+        for i, kind in enumerate(kinds):
+            if kind in ('numeric', 'date'):
+                profiles.append({key: formatter(stats.get(f"c{i}_{alias}"))
+                                 for key, alias, _, formatter in AGG_SPECS[kind]})
+            elif kind == 'text' and samples.get(f"c{i}_sample"):
+                profiles.append(self._cap_sample_text(samples[f"c{i}_sample"], stats.get(f"c{i}_dc") or 0))
+            else:
+                profiles.append({})
+        
+        return profiles
+    
+    def _profile_column_safely(self, table_name: str, column_name: str, data_type: str) -> Dict[str, Any]:
+        """Profile one column on its own, returning an empty profile on failure"""
+        try:
+            return self._profile_single_column(table_name, column_name, data_type)
+        except Exception as e:
+            logger.warning(f"Failed to profile {table_name}.{column_name}: {str(e)}")
+            return {}
     
     def _profile_single_column(self, table_name: str, column_name: str, data_type: str) -> Dict[str, Any]:
         """Profile a single column"""
@@ -48,134 +318,164 @@ class DataProfiler:
         sample_clause = self._get_sample_clause(row_count)
         
         try:
-            if data_type.upper() in ['NUMBER', 'INTEGER', 'BIGINT', 'DECIMAL']:
-                profile.update(self._profile_numeric_column(table_name, column_name, sample_clause))
-            elif data_type.upper() in ['TEXT', 'VARCHAR', 'CHAR']:
+            kind = _column_kind(data_type)
+            if kind in ('numeric', 'date'):
+                profile.update(self._profile_aggregate_column(table_name, column_name, sample_clause, AGG_SPECS[kind]))
+            elif kind == 'text':
                 profile.update(self._profile_text_column(table_name, column_name, sample_clause))
-            elif data_type.upper() in ['DATE', 'DATETIME', 'TIMESTAMP']:
-                profile.update(self._profile_date_column(table_name, column_name, sample_clause))
         except Exception as e:
             profile['profiling_error'] = str(e)
         
         return profile
     
-    def _get_table_row_count(self, table_name: str) -> int:
-        """Get approximate row count for table"""
+    def _seed_row_counts(self, metadata_df: pd.DataFrame) -> None:
+        """Take row counts already joined onto the metadata by SchemaDiscoverer"""
+        if 'row_count' not in metadata_df.columns:
+            return
+        counts = metadata_df.drop_duplicates('table_name')
+        for table_name, row_count in zip(counts['table_name'], counts['row_count']):
+            if table_name not in self._row_counts and pd.notna(row_count):
+                self._row_counts[table_name] = int(row_count)
+    
+    def _load_row_counts(self, table_names) -> None:
+        """Fetch approximate row counts for tables not seen yet in one metadata lookup"""
+        missing = [name for name in table_names if name not in self._row_counts]
+        if not missing:
+            return
+        
+        # The names travel as one JSON array parameter, so the statement text
+        # stays the same size however many tables are requested
+        query = f"""
+        SELECT table_name, row_count
+        FROM {DB_CONFIG.database}.INFORMATION_SCHEMA.TABLES
+        WHERE table_schema = %s
+        AND table_name IN (SELECT value::STRING FROM TABLE(FLATTEN(INPUT => PARSE_JSON(%s))))
+        """
+        
         try:
-            query = f"SELECT COUNT(*) as cnt FROM {DB_CONFIG.database}.{DB_CONFIG.schema_name}.{table_name}"
-            result = self.db.execute_query(query)
-            return result[0]['CNT'] if result else 0
-        except:
-            return DATA_PROCESSING_CONFIG.large_table_threshold  # Use config default assumption
+            result = self.db.execute_query(query, [DB_CONFIG.schema_name, json.dumps(missing)])
+        except Exception as e:
+            logger.warning(f"Could not fetch row counts: {str(e)}")
+            return
+        
+        for row in result:
+            self._row_counts[row['table_name']] = row['row_count'] or 0
+        
+        # Don't look up tables the schema doesn't list again; assume they are large
+        for name in missing:
+            self._row_counts.setdefault(name, DATA_PROCESSING_CONFIG.large_table_threshold)
+    
+    def _table_ref(self, table_name: str) -> str:
+        """Fully qualified, quoted reference to a table in the configured schema"""
+        table_ref = self._table_refs.get(table_name)
+        if table_ref is None:
+            table_ref = self._table_refs[table_name] = f"{self._db_schema}.{_quote_identifier(table_name)}"
+        return table_ref
+    
+    def _get_table_row_count(self, table_name: str) -> int:
+        """Get approximate row count for table from the INFORMATION_SCHEMA lookup"""
+        if table_name not in self._row_counts:
+            self._load_row_counts([table_name])
+        # Use config default assumption when the table's count is unavailable
+        return self._row_counts.get(table_name, DATA_PROCESSING_CONFIG.large_table_threshold)
     
     def _get_sample_clause(self, row_count: int) -> str:
         """Determine sampling strategy based on table size - UPDATED to use config"""
         return DATA_PROCESSING_CONFIG.get_sample_clause(row_count)
     
-    def _profile_numeric_column(self, table_name: str, column_name: str, sample_clause: str) -> Dict:
-        """Profile numeric column - UPDATED with configurable formatting"""
+    def _profile_aggregate_column(self, table_name: str, column_name: str, sample_clause: str,
+                                  agg_spec: Tuple[Tuple[str, str, str, Any], ...]) -> Dict:
+        """Profile a numeric or date column with the aggregates listed in its AGG_SPECS entry"""
+        column = _quote_identifier(column_name)
+        select_list = ', '.join(f"{template.format(column)} AS {key}" for key, _, template, _ in agg_spec)
         query = f"""
-        SELECT 
-            MIN({column_name}) as min_value,
-            MAX({column_name}) as max_value,
-            AVG({column_name}) as avg_value,
-            COUNT(DISTINCT {column_name}) as distinct_count
-        FROM {DB_CONFIG.database}.{DB_CONFIG.schema_name}.{table_name}
-        WHERE {column_name} IS NOT NULL
-        {sample_clause}
+        SELECT {select_list}
+        FROM {self._table_ref(table_name)} {sample_clause}
+        WHERE {column} IS NOT NULL
         """
         
         result = self.db.execute_query(query)
         if result:
             row = result[0]
-            # Format numeric values using config
-            formatted_result = {}
-            for key, value in row.items():
-                if key.lower() in ['min_value', 'max_value', 'avg_value'] and value is not None:
-                    formatted_result[key.lower()] = DATA_PROCESSING_CONFIG.format_numeric_value(float(value))
-                else:
-                    formatted_result[key.lower()] = value
-            return formatted_result
+            return {key: formatter(row.get(key)) for key, _, _, formatter in agg_spec}
         return {}
     
     def _profile_text_column(self, table_name: str, column_name: str, sample_clause: str) -> Dict:
         """Profile text column - UPDATED to use configurable limits"""
+        column = _quote_identifier(column_name)
+        table_ref = self._table_ref(table_name)
         # Use configurable max distinct values
         max_values = DATA_PROCESSING_CONFIG.max_distinct_values
         
         # First check how many distinct values exist
         count_query = f"""
-        SELECT COUNT(DISTINCT {column_name}) as distinct_count
-        FROM {DB_CONFIG.database}.{DB_CONFIG.schema_name}.{table_name}
-        WHERE {column_name} IS NOT NULL
-        {sample_clause}
+        SELECT COUNT(DISTINCT {column}) as distinct_count
+        FROM {table_ref} {sample_clause}
+        WHERE {column} IS NOT NULL
         """
         
         count_result = self.db.execute_query(count_query)
-        distinct_count = count_result[0].get('DISTINCT_COUNT', 0) if count_result else 0
+        distinct_count = count_result[0].get('distinct_count', 0) if count_result else 0
         
         # Only get all values if reasonable number, otherwise limit using config
         limit_clause = "" if distinct_count <= max_values else f"LIMIT {max_values}"
         
         query = f"""
-        SELECT DISTINCT {column_name}
-        FROM {DB_CONFIG.database}.{DB_CONFIG.schema_name}.{table_name}
-        WHERE {column_name} IS NOT NULL
-        {sample_clause}
-        ORDER BY {column_name}
+        SELECT DISTINCT {column} AS value
+        FROM {table_ref} {sample_clause}
+        WHERE {column} IS NOT NULL
+        ORDER BY {column}
         {limit_clause}
         """
         
-        result = self.db.execute_query(query)
-        if result:
-            # Handle case where column name might be uppercase in result
-            sample_values = []
-            for row in result:
-                # Try both cases
-                value = row.get(column_name) or row.get(column_name.upper())
-                if value:
-                    # Truncate individual values using config
-                    str_value = str(value)
-                    if len(str_value) > DATA_PROCESSING_CONFIG.max_individual_value_length:
-                        str_value = str_value[:DATA_PROCESSING_CONFIG.max_individual_value_length] + "..."
-                    sample_values.append(str_value)
-            
-            # Join values and apply total length limit using config
-            values_text = '; '.join(sample_values)
-            if len(values_text) > DATA_PROCESSING_CONFIG.max_sample_text_length:
-                values_text = values_text[:DATA_PROCESSING_CONFIG.max_sample_text_length] + "..."
-            
-            # Add indicator if truncated using config
-            if distinct_count > max_values:
-                truncation_msg = f"{DATA_PROCESSING_CONFIG.truncation_indicator}({distinct_count} total distinct values)"
-                
-                # Ensure we don't exceed length limit
-                if len(values_text) + len(truncation_msg) > DATA_PROCESSING_CONFIG.max_sample_text_length:
-                    values_text = values_text[:DATA_PROCESSING_CONFIG.max_sample_text_length - len(truncation_msg)]
-                
-                values_text += truncation_msg
-                
-            return {'sample_values': values_text, 'distinct_count': distinct_count}
+        # Stream values and stop once the sample text is already at its length cap
+        max_text_length = DATA_PROCESSING_CONFIG.max_sample_text_length
+        max_value_length = DATA_PROCESSING_CONFIG.max_individual_value_length + len("...")
+        separator_length = len('; ')
+        
+        values = []
+        text_length = -separator_length
+        for row in self.db.execute_query_streaming(query):
+            value = row['value']
+            values.append(value)
+            if value:
+                text_length += min(len(str(value)), max_value_length) + separator_length
+                if text_length >= max_text_length:
+                    break
+        
+        if values:
+            return self._format_text_sample(values, distinct_count)
         return {}
     
-    def _profile_date_column(self, table_name: str, column_name: str, sample_clause: str) -> Dict:
-        """Profile date column (unchanged but could add config for date formatting)"""
-        query = f"""
-        SELECT 
-            MIN({column_name}) as min_value,
-            MAX({column_name}) as max_value,
-            COUNT(DISTINCT {column_name}) as distinct_count
-        FROM {DB_CONFIG.database}.{DB_CONFIG.schema_name}.{table_name}
-        WHERE {column_name} IS NOT NULL
-        {sample_clause}
-        """
+    def _format_text_sample(self, values: List[Any], distinct_count: int) -> Dict[str, Any]:
+        """Build the truncated sample-values text for a text column"""
+        sample_values = []
+        for value in values:
+            if value:
+                # Truncate individual values using config
+                str_value = str(value)
+                if len(str_value) > DATA_PROCESSING_CONFIG.max_individual_value_length:
+                    str_value = str_value[:DATA_PROCESSING_CONFIG.max_individual_value_length] + "..."
+                sample_values.append(str_value)
         
-        result = self.db.execute_query(query)
-        if result:
-            row = result[0]
-            return {
-                'min_value': str(row.get('MIN_VALUE') or row.get('min_value')) if row.get('MIN_VALUE') or row.get('min_value') else None,
-                'max_value': str(row.get('MAX_VALUE') or row.get('max_value')) if row.get('MAX_VALUE') or row.get('max_value') else None,
-                'distinct_count': row.get('DISTINCT_COUNT') or row.get('distinct_count')
-            }
-        return {}
\ No newline at end of file
+        return self._cap_sample_text('; '.join(sample_values), distinct_count)
+    
+    def _cap_sample_text(self, values_text: str, distinct_count: int) -> Dict[str, Any]:
+        """Apply the total length limit and distinct-count indicator to joined sample text"""
+        max_values = DATA_PROCESSING_CONFIG.max_distinct_values
+        
+        # Apply total length limit using config
+        if len(values_text) > DATA_PROCESSING_CONFIG.max_sample_text_length:
+            values_text = values_text[:DATA_PROCESSING_CONFIG.max_sample_text_length] + "..."
+        
+        # Add indicator if truncated using config
+        if distinct_count > max_values:
+            truncation_msg = f"{DATA_PROCESSING_CONFIG.truncation_indicator}({distinct_count} total distinct values)"
+            
+            # Ensure we don't exceed length limit
+            if len(values_text) + len(truncation_msg) > DATA_PROCESSING_CONFIG.max_sample_text_length:
+                values_text = values_text[:DATA_PROCESSING_CONFIG.max_sample_text_length - len(truncation_msg)]
+            
+            values_text += truncation_msg
+            
+        return {'sample_values': values_text, 'distinct_count': distinct_count}
@@ -1,11 +1,22 @@
 """Enhanced database connection utility with comprehensive error handling"""
 
 import time
+import weakref
+import threading
+import pandas as pd
 import snowflake.connector
-from snowflake.connector import DictCursor, DatabaseError, ProgrammingError, InterfaceError
-from typing import Optional, Dict, Any, List
+from snowflake.connector import DatabaseError, ProgrammingError, InterfaceError
+from typing import Optional, Dict, Any, List, Iterator
 from contextlib import contextmanager
 from src.core.config import DB_CONFIG, logger
+from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+
+# pyarrow enables the connector's Arrow-backed fetch_pandas_all
+try:
+    import pyarrow  # noqa: F401
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
 
 class DatabaseConnectionError(Exception):
     """Custom exception for database connection issues"""
@@ -15,6 +26,10 @@ class DatabaseQueryError(Exception):
     """Custom exception for database query issues"""
     pass
 
+def _column_names(cursor) -> tuple:
+    """Lowercased result column names; Snowflake reports unquoted identifiers in uppercase"""
+    return tuple(column[0].lower() for column in cursor.description or ())
+
 class DatabaseConnector:
     """Enhanced database connector with comprehensive error handling"""
     
@@ -25,9 +40,19 @@ class DatabaseConnector:
         self.query_timeout = 60
         self._connection_attempts = 0
         self._is_connected = False
+        # Guards (re)connecting and closing; queries run concurrently on their own cursors
+        self._lock = threading.RLock()
+        # One reusable cursor per thread, tracked so close() can release them all
+        self._tls = threading.local()
+        self._cursors = weakref.WeakSet()
     
     def connect(self) -> bool:
         """Establish database connection with enhanced error handling and retry logic"""
+        with self._lock:
+            return self._connect()
+    
+    def _connect(self) -> bool:
+        """Connect with retries; callers hold ``self._lock``"""
         self._connection_attempts = 0
         
         for attempt in range(self.max_retries):
@@ -42,14 +67,17 @@ class DatabaseConnector:
                     'client_session_keep_alive': True,
                     'autocommit': True,
                     'login_timeout': 30,
-                    'ocsp_response_cache_filename': None  # Disable OCSP caching issues
+                    'ocsp_response_cache_filename': None,  # Disable OCSP caching issues
+                    # Large results arrive in chunks that are downloaded concurrently
+                    'client_prefetch_threads': DATA_PROCESSING_CONFIG.result_download_threads,
+                    # Session-wide default; per-query overrides go through statement params
+                    'session_parameters': {'STATEMENT_TIMEOUT_IN_SECONDS': self.query_timeout}
                 })
                 
+                # connect() authenticates and opens the session, raising on failure,
+                # so no follow-up test query is needed
                 self.connection = snowflake.connector.connect(**conn_params)
                 
-                # Test connection with a simple query
-                self._test_connection()
-                
                 self._is_connected = True
                 logger.info(f"Database connection established successfully on attempt {attempt + 1}")
                 return True
@@ -91,30 +119,21 @@ class DatabaseConnector:
         logger.error(error_msg)
         raise DatabaseConnectionError(error_msg)
     
-    def _test_connection(self) -> None:
-        """Test the database connection with a simple query"""
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT CURRENT_VERSION()")
-            result = cursor.fetchone()
-            cursor.close()
-            
-            if result:
-                logger.debug(f"Connected to Snowflake version: {result[0]}")
-            else:
-                raise DatabaseConnectionError("Connection test query returned no results")
-                
-        except Exception as e:
-            raise DatabaseConnectionError(f"Connection test failed: {str(e)}")
-    
     @property
     def is_connected(self) -> bool:
-        """Check if database is connected and responsive"""
-        if not self._is_connected or not self.connection:
+        """Check if database is connected, without a round-trip
+        
+        A dropped connection is noticed when a query fails with InterfaceError;
+        use health_check() to actively probe the server.
+        """
+        return self._is_connected and self.connection is not None
+    
+    def health_check(self) -> bool:
+        """Check that the connection is still responsive with a ``SELECT 1``"""
+        if not self.is_connected:
             return False
         
         try:
-            # Quick connection test
             cursor = self.connection.cursor()
             cursor.execute("SELECT 1")
             cursor.fetchone()
@@ -124,57 +143,122 @@ class DatabaseConnector:
             self._is_connected = False
             return False
     
+    def _get_cursor(self):
+        """Return this thread's cursor on the current connection, creating it on first use
+        
+        Only for queries whose results are fully fetched before returning; streaming
+        and async queries get their own cursors.
+        """
+        cursor = getattr(self._tls, 'cursor', None)
+        if cursor is None or cursor.connection is not self.connection:
+            with self._lock:
+                cursor = self.connection.cursor()
+                self._cursors.add(cursor)
+            self._tls.cursor = cursor
+        return cursor
+    
+    def _close_cursors(self) -> None:
+        """Close every per-thread cursor; callers hold ``self._lock``"""
+        for cursor in list(self._cursors):
+            try:
+                cursor.close()
+            except:
+                pass  # Ignore cursor close errors
+        self._cursors = weakref.WeakSet()
+        self._tls = threading.local()
+    
+    def _statement_params(self, timeout: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Per-statement timeout override; the session default is set once at connect"""
+        if timeout and timeout != self.query_timeout:
+            return {'STATEMENT_TIMEOUT_IN_SECONDS': timeout}
+        return None
+    
     def execute_query(self, query: str, params: Optional[List] = None, timeout: Optional[int] = None) -> List[Dict]:
-        """Execute query with enhanced error handling and timeout control"""
+        """Execute query with enhanced error handling and timeout control
+        
+        Rows are returned as dicts keyed by lowercased column names.
+        """
         if not self.is_connected:
             raise DatabaseConnectionError("Database not connected. Call connect() first.")
         
         query_timeout = timeout or self.query_timeout
-        cursor = None
         
         try:
-            cursor = self.connection.cursor(DictCursor)
-            
-            # Set query timeout if supported
-            try:
-                cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {query_timeout}")
-            except Exception as e:
-                logger.debug(f"Could not set query timeout: {e}")
+            cursor = self._get_cursor()
             
             logger.debug(f"Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
             
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+            cursor.execute(query, params or None, _statement_params=self._statement_params(timeout))
             
-            results = cursor.fetchall()
+            names = _column_names(cursor)
+            results = [dict(zip(names, row)) for row in cursor.fetchall()]
             logger.debug(f"Query returned {len(results)} rows")
             return results
             
-        except snowflake.connector.errors.ProgrammingError as e:
-            error_code = getattr(e, 'errno', None)
-            error_msg = str(e)
+        except Exception as e:
+            raise self._translate_query_error(e, query_timeout)
+    
+    def execute_query_pandas(self, query: str, params: Optional[List] = None,
+                             timeout: Optional[int] = None) -> pd.DataFrame:
+        """Execute query and return the result as a DataFrame with lowercased column names
+        
+        Uses the Arrow result format when pyarrow is installed; otherwise the
+        frame is built from the row tuples and the cursor's column names,
+        skipping per-row dict construction either way.
+        """
+        if not self.is_connected:
+            raise DatabaseConnectionError("Database not connected. Call connect() first.")
+        
+        query_timeout = timeout or self.query_timeout
+        
+        try:
+            cursor = self._get_cursor()
             
-            if error_code == 2003:  # Compilation error
-                raise DatabaseQueryError(f"SQL compilation error: {error_msg}")
-            elif "does not exist" in error_msg.lower():
-                raise DatabaseQueryError(f"Object not found: {error_msg}")
-            elif "timeout" in error_msg.lower():
-                raise DatabaseQueryError(f"Query timeout after {query_timeout}s: {error_msg}")
+            logger.debug(f"Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
+            
+            cursor.execute(query, params or None, _statement_params=self._statement_params(timeout))
+            if ARROW_AVAILABLE:
+                df = cursor.fetch_pandas_all()
+                df.columns = df.columns.str.lower()
             else:
-                raise DatabaseQueryError(f"SQL programming error: {error_msg}")
-                
-        except snowflake.connector.errors.DatabaseError as e:
-            raise DatabaseQueryError(f"Database error during query execution: {str(e)}")
+                df = pd.DataFrame.from_records(cursor.fetchall(), columns=list(_column_names(cursor)),
+                                               coerce_float=False)
+            logger.debug(f"Query returned {len(df)} rows")
+            return df
             
-        except snowflake.connector.errors.InterfaceError as e:
-            # Connection might be lost
-            self._is_connected = False
-            raise DatabaseConnectionError(f"Connection lost during query: {str(e)}")
+        except Exception as e:
+            raise self._translate_query_error(e, query_timeout)
+    
+    def execute_query_streaming(self, query: str, params: Optional[List] = None,
+                                batch_size: int = 1000, timeout: Optional[int] = None) -> Iterator[Dict]:
+        """Execute query and yield rows as they are fetched in ``batch_size`` chunks
+        
+        Callers can stop iterating early; the cursor is closed either way.
+        """
+        if not self.is_connected:
+            raise DatabaseConnectionError("Database not connected. Call connect() first.")
+        
+        query_timeout = timeout or self.query_timeout
+        cursor = None
+        
+        try:
+            with self._lock:
+                cursor = self.connection.cursor()
+            
+            logger.debug(f"Streaming query: {query[:100]}{'...' if len(query) > 100 else ''}")
+            
+            cursor.execute(query, params or None, _statement_params=self._statement_params(timeout))
+            
+            names = _column_names(cursor)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(zip(names, row))
             
         except Exception as e:
-            raise DatabaseQueryError(f"Unexpected error during query execution: {str(e)}")
+            raise self._translate_query_error(e, query_timeout)
             
         finally:
             if cursor:
@@ -183,6 +267,83 @@ class DatabaseConnector:
                 except:
                     pass  # Ignore cursor close errors
     
+    def submit_async(self, query: str, params: Optional[List] = None, timeout: Optional[int] = None) -> str:
+        """Submit query without waiting for it to finish and return its Snowflake query id"""
+        if not self.is_connected:
+            raise DatabaseConnectionError("Database not connected. Call connect() first.")
+        
+        query_timeout = timeout or self.query_timeout
+        cursor = None
+        
+        try:
+            with self._lock:
+                cursor = self.connection.cursor()
+            
+            logger.debug(f"Submitting query: {query[:100]}{'...' if len(query) > 100 else ''}")
+            cursor.execute_async(query, params or None, _statement_params=self._statement_params(timeout))
+            return cursor.sfqid
+            
+        except Exception as e:
+            raise self._translate_query_error(e, query_timeout)
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass  # Ignore cursor close errors
+    
+    def fetch_async(self, query_id: str) -> List[Dict]:
+        """Wait for a query started with submit_async and return its rows like execute_query"""
+        cursor = None
+        
+        try:
+            with self._lock:
+                cursor = self.connection.cursor()
+            
+            # Polls the query status until it finishes, raising if it failed
+            cursor.get_results_from_sfqid(query_id)
+            rows = cursor.fetchall()
+            names = _column_names(cursor)
+            logger.debug(f"Query {query_id} returned {len(rows)} rows")
+            return [dict(zip(names, row)) for row in rows]
+            
+        except Exception as e:
+            raise self._translate_query_error(e, self.query_timeout)
+            
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass  # Ignore cursor close errors
+    
+    def _translate_query_error(self, e: Exception, query_timeout: int) -> Exception:
+        """Map a driver exception onto DatabaseQueryError / DatabaseConnectionError"""
+        if isinstance(e, snowflake.connector.errors.ProgrammingError):
+            error_code = getattr(e, 'errno', None)
+            error_msg = str(e)
+            
+            if error_code == 2003:  # Compilation error
+                return DatabaseQueryError(f"SQL compilation error: {error_msg}")
+            elif "does not exist" in error_msg.lower():
+                return DatabaseQueryError(f"Object not found: {error_msg}")
+            elif "timeout" in error_msg.lower():
+                return DatabaseQueryError(f"Query timeout after {query_timeout}s: {error_msg}")
+            else:
+                return DatabaseQueryError(f"SQL programming error: {error_msg}")
+        
+        if isinstance(e, snowflake.connector.errors.DatabaseError):
+            return DatabaseQueryError(f"Database error during query execution: {str(e)}")
+        
+        if isinstance(e, snowflake.connector.errors.InterfaceError):
+            # Connection might be lost; the next query on this thread gets a fresh cursor
+            self._is_connected = False
+            self._tls.cursor = None
+            return DatabaseConnectionError(f"Connection lost during query: {str(e)}")
+        
+        return DatabaseQueryError(f"Unexpected error during query execution: {str(e)}")
+    
     def execute_query_with_retry(self, query: str, params: Optional[List] = None, 
                                 max_retries: int = 2) -> List[Dict]:
         """Execute query with automatic retry on recoverable errors"""
@@ -253,15 +414,17 @@ class DatabaseConnector:
     
     def close(self) -> None:
         """Close database connection with proper cleanup"""
-        if self.connection:
-            try:
-                self.connection.close()
-                logger.info("Database connection closed successfully")
-            except Exception as e:
-                logger.warning(f"Error while closing database connection: {e}")
-            finally:
-                self.connection = None
-                self._is_connected = False
+        with self._lock:
+            if self.connection:
+                try:
+                    self.connection.close()
+                    logger.info("Database connection closed successfully")
+                except Exception as e:
+                    logger.warning(f"Error while closing database connection: {e}")
+                finally:
+                    self._close_cursors()
+                    self.connection = None
+                    self._is_connected = False
 
 # Context manager for automatic connection management
 @contextmanager
@@ -1,18 +1,52 @@
 """Schema discovery and metadata collection tool - Updated to use configuration"""
 
+import re
+import weakref
+import threading
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from src.core.config import DB_CONFIG, logger
 from src.tools.database_connector import DatabaseConnector
 
 # NEW: Import the column classification config
 from src.core.column_config import COLUMN_CONFIG
 
+def _contains_any(values: pd.Series, pattern: Optional[re.Pattern]) -> pd.Series:
+    """Vectorized keyword test with a precompiled alternation; None matches nothing"""
+    if pattern is None:
+        return pd.Series(False, index=values.index)
+    return values.str.contains(pattern, na=False)
+
+# Low-cardinality metadata columns kept as categoricals: each distinct value is
+# stored once and comparisons run on the integer codes
+CATEGORICAL_COLUMNS = ('table_name', 'data_type', 'is_nullable')
+
+# Table-level fields the schema query joins onto every column row; only table
+# discovery reports them, so they stay out of the per-column metadata
+TABLE_ONLY_COLUMNS = ('bytes',)
+
 class SchemaDiscoverer:
     """Discovers database schema and collects metadata"""
     
+    # Schema query results shared by every discoverer, keyed by (database, schema).
+    # Each entry holds a weak reference to the connector that fetched it; once
+    # that connector is closed or gone the entry is treated as stale.
+    _schema_cache: Dict[Tuple[str, str], Tuple[weakref.ref, pd.DataFrame]] = {}
+    _schema_cache_lock = threading.Lock()
+    
     def __init__(self, db_connector: DatabaseConnector):
         self.db = db_connector
+    
+    @classmethod
+    def invalidate(cls, db_connector: Optional[DatabaseConnector] = None) -> None:
+        """Drop cached schema results, only those fetched through db_connector if given"""
+        with cls._schema_cache_lock:
+            if db_connector is None:
+                cls._schema_cache.clear()
+                return
+            for key in [key for key, (owner, _) in cls._schema_cache.items() if owner() is db_connector]:
+                del cls._schema_cache[key]
 
     def _filter_tables(self, tables_df: pd.DataFrame) -> pd.DataFrame:
         """Filter tables based on configuration"""
@@ -41,19 +75,68 @@ class SchemaDiscoverer:
         # Return all tables if no filtering specified
         return tables_df
     
-    def discover_tables(self) -> pd.DataFrame:
-        """Discover tables in the schema with optional filtering"""
-        logger.info(f"Discovering tables in {DB_CONFIG.database}.{DB_CONFIG.schema_name}")
+    def discover_full(self) -> pd.DataFrame:
+        """Fetch column metadata plus table sizes for the whole schema in one query
+        
+        The result is cached across discoverers while the connector that fetched
+        it stays open, and serves table discovery, column metadata and the
+        profiler's row counts, so discovery costs a single round-trip.
+        """
+        key = (DB_CONFIG.database, DB_CONFIG.schema_name)
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            owner = cached[0]()
+            # Metadata fetched over a session that has since ended may be stale
+            if owner is not None and owner.connection is not None:
+                return cached[1].copy(deep=False)
         
+        # Each INFORMATION_SCHEMA view is filtered on its own so Snowflake can
+        # prune it before the join
         query = f"""
-        SHOW TABLES IN SCHEMA {DB_CONFIG.database}.{DB_CONFIG.schema_name}
+        WITH t AS (
+            SELECT table_name, row_count, bytes
+            FROM {DB_CONFIG.database}.INFORMATION_SCHEMA.TABLES
+            WHERE table_schema = %s
+            AND table_type = 'BASE TABLE'
+        ),
+        c AS (
+            SELECT 
+                table_name,
+                column_name,
+                ordinal_position,
+                column_default,
+                is_nullable,
+                data_type,
+                character_maximum_length,
+                numeric_precision,
+                numeric_scale,
+                comment
+            FROM {DB_CONFIG.database}.INFORMATION_SCHEMA.COLUMNS
+            WHERE table_schema = %s
+        )
+        SELECT c.*, t.row_count, t.bytes
+        FROM c
+        JOIN t USING (table_name)
+        ORDER BY table_name, ordinal_position
         """
         
-        tables_data = self.db.execute_query(query)
+        schema_df = self.db.execute_query_pandas(query, [DB_CONFIG.schema_name] * 2)
+        with self._schema_cache_lock:
+            self._schema_cache[key] = (weakref.ref(self.db), schema_df)
+        # Callers get their own frame, so columns they add never reach the cache
+        return schema_df.copy(deep=False)
+    
+    def discover_tables(self) -> pd.DataFrame:
+        """Discover tables in the schema with optional filtering"""
+        logger.info(f"Discovering tables in {DB_CONFIG.database}.{DB_CONFIG.schema_name}")
+        
+        schema_df = self.discover_full()
         
-        if tables_data:
-            df = pd.DataFrame(tables_data)
-            df.columns = df.columns.str.lower()
+        if not schema_df.empty:
+            df = (schema_df[['table_name', 'row_count', 'bytes']]
+                  .drop_duplicates('table_name')
+                  .rename(columns={'table_name': 'name', 'row_count': 'rows'})
+                  .reset_index(drop=True))
             logger.info(f"Found {len(df)} total tables")
             
             # Apply filtering
@@ -64,34 +147,19 @@ class SchemaDiscoverer:
             return pd.DataFrame()
     
     def get_table_metadata(self, table_names: List[str]) -> pd.DataFrame:
-        """Get detailed metadata for tables (unchanged)"""
+        """Get detailed metadata for tables from the cached schema query"""
         logger.info(f"Collecting metadata for {len(table_names)} tables")
         
-        placeholders = ','.join(['%s'] * len(table_names))
-        query = f"""
-        SELECT 
-            table_name,
-            column_name,
-            ordinal_position,
-            column_default,
-            is_nullable,
-            data_type,
-            character_maximum_length,
-            numeric_precision,
-            numeric_scale,
-            comment
-        FROM information_schema.columns
-        WHERE table_schema = %s
-        AND table_name IN ({placeholders})
-        ORDER BY table_name, ordinal_position
-        """
-        
-        params = [DB_CONFIG.schema_name] + table_names
-        columns_data = self.db.execute_query(query, params)
+        schema_df = self.discover_full()
+        if schema_df.empty:
+            return pd.DataFrame()
         
-        df = pd.DataFrame(columns_data)
-        # Convert column names to lowercase for consistency
-        df.columns = df.columns.str.lower()
+        columns = schema_df.columns.drop(list(TABLE_ONLY_COLUMNS), errors='ignore')
+        # Boolean selection copies, so callers can enrich the frame without touching the cache
+        df = schema_df.loc[schema_df['table_name'].isin(table_names), columns].reset_index(drop=True)
+        for column in CATEGORICAL_COLUMNS:
+            if column in df:
+                df[column] = df[column].astype('category')
         logger.info(f"Collected metadata for {len(df)} columns")
         return df
     
@@ -99,58 +167,73 @@ class SchemaDiscoverer:
         """Analyze and classify column roles - UPDATED to use configuration"""
         logger.info("Analyzing column roles and business types")
         
-        def classify_column(row):
-            """Column classification using configurable rules"""
-            col_name = row['column_name'].lower()
-            data_type = row['data_type'].upper()
-            is_nullable = row['is_nullable']
-            
-            # PRIMARY KEY DETECTION (using config)
-            if any(col_name.endswith(suffix) for suffix in COLUMN_CONFIG.primary_key_suffixes):
-                if COLUMN_CONFIG.primary_key_requires_not_null and is_nullable == 'NO':
-                    return 'primary_key', 'Identifier'
-                elif not COLUMN_CONFIG.primary_key_requires_not_null:
-                    return 'primary_key', 'Identifier'
-            
+        # Column names repeat across tables (ID, NAME, ...), so the name rules are
+        # evaluated once per distinct name and broadcast back through the codes
+        codes, unique_names = pd.factorize(metadata_df['column_name'], use_na_sentinel=False)
+        col_name = pd.Series(unique_names, dtype=object).str.lower()
+        
+        data_type = metadata_df['data_type'].str.upper()
+        is_nullable = metadata_df['is_nullable']
+        if isinstance(is_nullable.dtype, pd.CategoricalDtype):
+            # Compare integer codes instead of strings
+            categories = is_nullable.cat.categories
+            not_null = (is_nullable.cat.codes.to_numpy() == categories.get_loc('NO')
+                        if 'NO' in categories else np.zeros(len(is_nullable), dtype=bool))
+        else:
+            not_null = is_nullable.to_numpy() == 'NO'
+        
+        # Name rules in priority order after the primary key rule, evaluated on
+        # the distinct names only
+        name_rules = [
             # FOREIGN KEY DETECTION (using config)
-            if any(col_name.endswith(suffix) for suffix in COLUMN_CONFIG.foreign_key_suffixes):
-                return 'foreign_key', 'Identifier'
-            
+            ('foreign_key', 'Identifier',
+             col_name.str.endswith(COLUMN_CONFIG.foreign_key_suffix_tuple, na=False)),
             # MEASURE DETECTION (using config)
-            # Amount/Currency fields
-            if any(keyword in col_name for keyword in COLUMN_CONFIG.amount_keywords):
-                return 'measure', COLUMN_CONFIG.get_amount_business_type()
-            
-            # Quantity fields
-            if any(keyword in col_name for keyword in COLUMN_CONFIG.quantity_keywords):
-                return 'measure', COLUMN_CONFIG.get_quantity_business_type()
-            
+            ('measure', COLUMN_CONFIG.get_amount_business_type(),
+             _contains_any(col_name, COLUMN_CONFIG.keyword_pattern('amount'))),
+            ('measure', COLUMN_CONFIG.get_quantity_business_type(),
+             _contains_any(col_name, COLUMN_CONFIG.keyword_pattern('quantity'))),
             # DIMENSION DETECTION (using config)
-            # Description fields
-            if any(keyword in col_name for keyword in COLUMN_CONFIG.description_keywords):
-                return 'dimension', COLUMN_CONFIG.get_description_business_type()
-            
-            # Status fields
-            if any(keyword in col_name for keyword in COLUMN_CONFIG.status_keywords):
-                return 'dimension', COLUMN_CONFIG.get_status_business_type()
-            
-            # Location fields (new!)
-            if any(keyword in col_name for keyword in COLUMN_CONFIG.location_keywords):
-                return 'dimension', COLUMN_CONFIG.get_location_business_type()
-            
-            # DEFAULT CLASSIFICATION (using config)
-            # Use data type to determine business type
-            if data_type in ['DATE', 'DATETIME', 'TIMESTAMP']:
-                return 'dimension', COLUMN_CONFIG.get_business_type_for_sql_type(data_type)
-            else:
-                business_type = COLUMN_CONFIG.get_business_type_for_sql_type(data_type)
-                role = 'dimension' if data_type in ['TEXT', 'VARCHAR'] else 'measure'
-                return role, business_type
-        
-        # Apply classification
-        roles_and_types = metadata_df.apply(classify_column, axis=1, result_type='expand')
-        metadata_df['column_role'] = roles_and_types[0]
-        metadata_df['business_data_type'] = roles_and_types[1]
+            ('dimension', COLUMN_CONFIG.get_description_business_type(),
+             _contains_any(col_name, COLUMN_CONFIG.keyword_pattern('description'))),
+            ('dimension', COLUMN_CONFIG.get_status_business_type(),
+             _contains_any(col_name, COLUMN_CONFIG.keyword_pattern('status'))),
+            ('dimension', COLUMN_CONFIG.get_location_business_type(),
+             _contains_any(col_name, COLUMN_CONFIG.keyword_pattern('location'))),
+        ]
+        
+        # Rule code per distinct name: 0 = no name rule, 1 = primary key,
+        # 2.. = name_rules; the first matching rule wins
+        other_rule = np.select([mask.to_numpy() for _, _, mask in name_rules],
+                               np.arange(2, len(name_rules) + 2, dtype=np.uint8), default=0).astype(np.uint8)
+        
+        # PRIMARY KEY DETECTION (using config)
+        pk_name = col_name.str.endswith(COLUMN_CONFIG.primary_key_suffix_tuple, na=False).to_numpy()
+        pk_rule = np.where(pk_name, np.uint8(1), other_rule)
+        
+        # Broadcast the codes to rows; a key suffix on a nullable column falls
+        # through to the next matching rule when NOT NULL is required
+        if COLUMN_CONFIG.primary_key_requires_not_null:
+            rule = np.where(not_null, pk_rule[codes], other_rule[codes])
+        else:
+            rule = pk_rule[codes]
+        
+        roles = np.array([None, 'primary_key'] + [role for role, _, _ in name_rules], dtype=object)
+        business_types = np.array([None, 'Identifier'] + [btype for _, btype, _ in name_rules], dtype=object)
+        column_role = roles[rule]
+        business_data_type = business_types[rule]
+        
+        # DEFAULT CLASSIFICATION: dates and text are dimensions, the rest
+        # measures, typed by their SQL type (looked up once per distinct type)
+        unmatched = rule == 0
+        default_type = data_type.map({t: COLUMN_CONFIG.get_business_type_for_sql_type(t)
+                                      for t in data_type.dropna().unique()}).to_numpy(dtype=object)
+        is_dimension_type = data_type.isin(['DATE', 'DATETIME', 'TIMESTAMP', 'TEXT', 'VARCHAR']).to_numpy()
+        column_role[unmatched] = np.where(is_dimension_type[unmatched], 'dimension', 'measure')
+        business_data_type[unmatched] = default_type[unmatched]
+        
+        metadata_df['column_role'] = column_role
+        metadata_df['business_data_type'] = business_data_type
         
         # Log classification summary
         role_summary = metadata_df['column_role'].value_counts()
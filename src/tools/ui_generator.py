@@ -1,122 +1,288 @@
 """UI generation tool for data catalog interface - Updated with configuration"""
 
+import sys
+import html
+import sqlite3
+import threading
+import numpy as np
 import pandas as pd
 import gradio as gr
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from src.core.config import logger
 
 # NEW: Import the UI config
 from src.core.ui_config import UI_CONFIG
 
+# pyarrow backs the catalog's text columns with Arrow strings when installed
+try:
+    import pyarrow  # noqa: F401
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Fields matched by the free-text search box
+SEARCH_COLUMNS = ('table_name', 'column_name', 'column_description')
+
+# Fields the interface renders; profiling samples and statistics are not kept
+UI_COLUMNS = ('table_name', 'column_name', 'data_type', 'column_role',
+              'business_data_type', 'table_description', 'column_description')
+
+NO_ROWS = np.array([], dtype=np.intp)
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated comparisons can short-circuit on identity"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _positions_by_value(values: pd.Series) -> Dict[Any, np.ndarray]:
+    """Row positions per distinct non-null value in sorted order, keyed by interned strings"""
+    return {_intern(value): positions
+            for value, positions in values.groupby(values, observed=True).indices.items()}
+
+def _as_text(values: pd.Series) -> pd.Series:
+    """Values as strings with missing values blank; Arrow strings keep their dtype"""
+    if not isinstance(values.dtype, pd.StringDtype):
+        values = values.astype(str).where(values.notna(), '')
+    return values.fillna('')
+
+# Same replacements as html.escape(quote=True), '&' first
+_HTML_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'), ("'", '&#x27;'))
+
+def _escape(values: pd.Series) -> pd.Series:
+    """Vectorized ``html.escape``: one str.replace pass per special character"""
+    for char, entity in _HTML_ESCAPES:
+        values = values.str.replace(char, entity, regex=False)
+    return values
+
+def _cell_text(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column values as an object array of escaped strings for vectorized HTML building"""
+    return _escape(_as_text(df[column])).to_numpy(dtype=object)
+
+def _description_text(df: pd.DataFrame) -> np.ndarray:
+    """Column descriptions truncated to the configured display length"""
+    if 'column_description' not in df:
+        return np.full(len(df), '', dtype=object)
+    # Truncate before escaping so the cut never lands inside an entity
+    truncated = UI_CONFIG.truncate_many(_as_text(df['column_description']), is_description=True)
+    return _escape(pd.Series(truncated, dtype=object)).to_numpy(dtype=object)
+
+class _TrigramIndex:
+    """In-memory SQLite FTS5 trigram index over the search blob
+    
+    Trigram matching is substring matching, so results agree with the blob
+    scan; it only works for terms of at least three characters.
+    """
+    
+    MIN_TERM_LENGTH = 3
+    
+    def __init__(self, texts: Iterable[str]):
+        # Gradio runs callbacks on worker threads; one connection, serialized
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(':memory:', check_same_thread=False)
+        self._conn.execute("CREATE VIRTUAL TABLE catalog USING fts5(blob, tokenize='trigram')")
+        self._conn.executemany("INSERT INTO catalog(rowid, blob) VALUES (?, ?)", enumerate(texts))
+    
+    def search(self, term: str) -> np.ndarray:
+        """Sorted row positions whose text contains ``term``"""
+        phrase = '"' + term.replace('"', '""') + '"'
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid FROM catalog WHERE catalog MATCH ? ORDER BY rowid", (phrase,)).fetchall()
+        return np.fromiter((rowid for rowid, in rows), dtype=np.intp, count=len(rows))
+
+def _build_search_index(texts: pd.Series) -> Optional[_TrigramIndex]:
+    """Index the search blob when enabled and SQLite supports FTS5 trigrams"""
+    if not UI_CONFIG.use_search_index:
+        return None
+    try:
+        return _TrigramIndex(texts.tolist())
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Search index unavailable, scanning instead: {str(e)}")
+        return None
+
 class UIGenerator:
     """Generates interactive web interface for data catalog"""
     
-    def __init__(self, documented_df: pd.DataFrame):
-        self.df = documented_df
-        self.tables = sorted(self.df['table_name'].unique())
-        self.business_types = sorted(self.df['business_data_type'].unique())
+    # Fields a catalog must have for search, filters and table details to work
+    REQUIRED_COLUMNS = ('table_name', 'column_name', 'business_data_type')
     
-    def create_interface(self) -> str:
-        """Create and launch Gradio interface - UPDATED to use configuration"""
-        logger.info("Creating Gradio interface for data catalog")
+    def __init__(self, documented_df: pd.DataFrame, theme_override: Optional[Dict[str, str]] = None):
+        # Gradio hues used instead of the configured theme, when given
+        self._theme_override = theme_override
         
-        def search_catalog(search_term: str, table_filter: str, type_filter: str) -> Tuple[str, str]:
-            """Search the data catalog"""
-            filtered_df = self.df.copy()
-            
-            # Apply filters
-            if table_filter != "All Tables":
-                filtered_df = filtered_df[filtered_df['table_name'] == table_filter]
-            
-            if type_filter != "All Types":
-                filtered_df = filtered_df[filtered_df['business_data_type'] == type_filter]
-            
-            # Apply search
-            if search_term:
-                search_mask = (
-                    filtered_df['table_name'].str.contains(search_term, case=False, na=False) |
-                    filtered_df['column_name'].str.contains(search_term, case=False, na=False) |
-                    filtered_df['column_description'].str.contains(search_term, case=False, na=False)
-                )
-                filtered_df = filtered_df[search_mask]
-            
-            if len(filtered_df) == 0:
-                return "No results found.", ""
-            
-            # Use configurable results limit
-            max_results = min(len(filtered_df), UI_CONFIG.max_search_results)
-            display_df = filtered_df.head(max_results)
-            
-            # Create results HTML with config-based styling
-            results_html = self._format_results(display_df)
-            
-            # Enhanced summary with configuration
-            summary_parts = [f"Found {len(filtered_df)} results across {filtered_df['table_name'].nunique()} tables"]
-            if len(filtered_df) > max_results:
-                summary_parts.append(f"(showing first {max_results} results)")
-            
-            summary = " ".join(summary_parts)
-            
-            return summary, results_html
+        # Hold only the displayed fields for the lifetime of the UI, not the
+        # full documented frame with its samples and statistics
+        self.df = documented_df[[column for column in UI_COLUMNS if column in documented_df]]
+        if ARROW_AVAILABLE:
+            # Contiguous UTF-8 buffers instead of one Python object per cell;
+            # search and truncation then run on Arrow's string kernels
+            text_columns = self.df.select_dtypes(include='object').columns
+            self.df = self.df.astype({column: 'string[pyarrow]' for column in text_columns})
         
-        def get_table_details(table_name: str) -> str:
-            """Get detailed table information - UPDATED with config styling"""
-            if table_name == "Select a table":
-                return "Please select a table to view details."
-            
-            table_df = self.df[self.df['table_name'] == table_name]
-            if len(table_df) == 0:
-                return "Table not found."
-            
-            # Get table description
-            table_desc = table_df.iloc[0].get('table_description', 'No description available.')
-            
-            # Create table details HTML with configurable styling
-            details_html = f"""
-            <div style="font-family: {UI_CONFIG.font_family}; font-size: {UI_CONFIG.font_size};">
-                <h2 style="color: {UI_CONFIG.primary_color};">{table_name}</h2>
-                <p><strong>Description:</strong> {table_desc}</p>
-                <p><strong>Columns:</strong> {len(table_df)}</p>
-                
-                <table style="{UI_CONFIG.get_table_style()}">
-                    <tr>
-                        <th style="{UI_CONFIG.get_header_style()}">Column</th>
-                        <th style="{UI_CONFIG.get_header_style()}">Type</th>
-                        <th style="{UI_CONFIG.get_header_style()}">Role</th>
-                        <th style="{UI_CONFIG.get_header_style()}">Description</th>
-                    </tr>
-            """
+        # Lowercased table/column/description text joined per row, so a search
+        # is one literal scan instead of three case-insensitive regex scans
+        self._search_blob = self._build_search_blob(self.df)
+        self._search_index = _build_search_index(self._search_blob)
+        self._tbl_arr = self.df['table_name'].to_numpy(dtype=object)
+        
+        # Row positions per dropdown value, so filtering is a dict lookup
+        self._by_table = _positions_by_value(self.df['table_name'])
+        self._by_btype = _positions_by_value(self.df['business_data_type'])
+        
+        # groupby already produced the distinct values in sorted order (category
+        # order for categoricals), so the dropdowns need no unique()/sorted() pass
+        self.tables = list(self._by_table)
+        self.business_types = list(self._by_btype)
+        
+        # Rendered get_table_details HTML, bounded by the number of tables
+        self._detail_cache: Dict[str, str] = {}
+        
+        # Gradio Blocks, built on first use
+        self._interface: Optional[gr.Blocks] = None
+    
+    @staticmethod
+    def _build_search_blob(df: pd.DataFrame) -> pd.Series:
+        """Join the searchable fields of each row into one lowercased string"""
+        fields = [_as_text(df[column]) for column in SEARCH_COLUMNS if column in df]
+        # A separator that never appears in names keeps matches within one field
+        blob = fields[0].str.cat(fields[1:], sep='\x1f')
+        return blob.str.lower()
+    
+    def search_catalog(self, search_term: str, table_filter: str, type_filter: str) -> Tuple[str, str]:
+        """Search the data catalog"""
+        # Filters and search narrow an array of row positions; a DataFrame is
+        # only materialized for the rows that are displayed
+        positions = None
+        if table_filter != "All Tables":
+            positions = self._by_table.get(table_filter, NO_ROWS)
+        
+        if type_filter != "All Types":
+            type_positions = self._by_btype.get(type_filter, NO_ROWS)
+            positions = (type_positions if positions is None
+                         else np.intersect1d(positions, type_positions, assume_unique=True))
+        
+        # Apply search
+        term = search_term.lower() if search_term else ''
+        if self._search_index is not None and len(term) >= _TrigramIndex.MIN_TERM_LENGTH:
+            matches = self._search_index.search(term)
+            positions = (matches if positions is None
+                         else np.intersect1d(positions, matches, assume_unique=True))
+        elif term:
+            blob = self._search_blob if positions is None else self._search_blob.iloc[positions]
+            hits = blob.str.contains(term, regex=False).to_numpy(dtype=bool)
+            positions = np.flatnonzero(hits) if positions is None else positions[hits]
+        
+        if positions is None:
+            # Nothing filtered: slice the catalog in place rather than gathering
+            # every row position
+            result_count, table_count = len(self.df), len(self.tables)
+            display_rows = slice(0, UI_CONFIG.max_search_results)
+        else:
+            result_count = len(positions)
+            table_count = len(pd.unique(self._tbl_arr[positions]))
+            display_rows = positions[:UI_CONFIG.max_search_results]
+        
+        if result_count == 0:
+            return "No results found.", ""
+        
+        # Use configurable results limit
+        max_results = min(result_count, UI_CONFIG.max_search_results)
+        display_df = self.df.iloc[display_rows]
+        
+        # Create results HTML with config-based styling
+        results_html = self._format_results(display_df)
+        
+        # Enhanced summary with configuration
+        summary_parts = [f"Found {result_count} results across {table_count} tables"]
+        if result_count > max_results:
+            summary_parts.append(f"(showing first {max_results} results)")
+        
+        summary = " ".join(summary_parts)
+        
+        return summary, results_html
+    
+    def get_table_details(self, table_name: str) -> str:
+        """Get detailed table information - UPDATED with config styling"""
+        if table_name == "Select a table":
+            return "Please select a table to view details."
+        
+        # The catalog does not change while the UI runs, so each table's
+        # details are rendered once and served from the cache afterwards
+        details_html = self._detail_cache.get(table_name)
+        if details_html is None:
+            details_html = self._detail_cache[table_name] = self._render_table_details(table_name)
+        return details_html
+    
+    def _render_table_details(self, table_name: str) -> str:
+        """Render the details HTML for one table"""
+        table_df = self.df.take(self._by_table.get(table_name, NO_ROWS))
+        if len(table_df) == 0:
+            return "Table not found."
+        
+        # Get table description
+        table_desc = (table_df['table_description'].iat[0] if 'table_description' in table_df
+                      else 'No description available.')
+        
+        header_style = UI_CONFIG.get_header_style()
+        cell_style = UI_CONFIG.get_cell_style()
+        code_cell_style = UI_CONFIG.get_cell_style(is_code=True)
+        
+        # Create table details HTML with configurable styling; the pieces are
+        # joined once at the end
+        parts = [f"""
+        <div style="font-family: {UI_CONFIG.font_family}; font-size: {UI_CONFIG.font_size};">
+            <h2 style="color: {UI_CONFIG.primary_color};">{html.escape(table_name)}</h2>
+            <p><strong>Description:</strong> {html.escape(str(table_desc))}</p>
+            <p><strong>Columns:</strong> {len(table_df)}</p>
             
-            for i, (_, col) in enumerate(table_df.iterrows()):
-                # Alternate row colors using config
-                if i % 2 == 0:
-                    row_bg = UI_CONFIG._config['styling']['even_row_background']
-                else:
-                    row_bg = UI_CONFIG._config['styling']['odd_row_background']
-                
-                # Truncate description using config
-                description = UI_CONFIG.truncate_text(
-                    str(col.get('column_description', '')), 
-                    is_description=True
-                )
-                
-                details_html += f"""
-                <tr style="background-color: {row_bg};" onmouseover="this.style.backgroundColor='{UI_CONFIG._config['styling']['hover_background']}'" onmouseout="this.style.backgroundColor='{row_bg}'">
-                    <td style="{UI_CONFIG.get_cell_style(is_code=True)}"><code>{col['column_name']}</code></td>
-                    <td style="{UI_CONFIG.get_cell_style()}">{col['data_type']}</td>
-                    <td style="{UI_CONFIG.get_cell_style()}">{col['column_role']}</td>
-                    <td style="{UI_CONFIG.get_cell_style()}">{description}</td>
+            <table style="{UI_CONFIG.get_table_style()}">
+                <tr>
+                    <th style="{header_style}">Column</th>
+                    <th style="{header_style}">Type</th>
+                    <th style="{header_style}">Role</th>
+                    <th style="{header_style}">Description</th>
                 </tr>
-                """
-            
-            details_html += """
-                </table>
-            </div>
-            """
-            return details_html
+        """]
+        
+        parts.append(self._render_rows([
+            (f'<td style="{code_cell_style}"><code>', _cell_text(table_df, 'column_name'), '</code></td>'),
+            (f'<td style="{cell_style}">', _cell_text(table_df, 'data_type'), '</td>'),
+            (f'<td style="{cell_style}">', _cell_text(table_df, 'column_role'), '</td>'),
+            (f'<td style="{cell_style}">', _description_text(table_df), '</td>'),
+        ]))
+        
+        parts.append("""
+            </table>
+        </div>
+        """)
+        return ''.join(parts)
+    
+    def create_interface(self) -> str:
+        """Create and launch Gradio interface - UPDATED to use configuration"""
+        interface = self.build_interface()
+        
+        # Launch interface with configurable server settings
+        logger.info(f"Launching UI on {UI_CONFIG.host}:{UI_CONFIG.port}")
+        url = interface.launch(
+            server_name=UI_CONFIG.host,
+            server_port=UI_CONFIG.port,
+            share=UI_CONFIG.share,
+            inbrowser=UI_CONFIG.inbrowser,
+            max_threads=UI_CONFIG.max_threads,
+            show_error=UI_CONFIG.show_error,
+            show_api=UI_CONFIG.show_api
+        )
+        
+        return f"http://localhost:{UI_CONFIG.port}"
+    
+    def build_interface(self) -> gr.Blocks:
+        """Build the Gradio Blocks for this catalog once; relaunches reuse them"""
+        if self._interface is not None:
+            return self._interface
+        
+        logger.info("Creating Gradio interface for data catalog")
         
         # Create Gradio interface with configurable theme
-        theme_config = UI_CONFIG.get_gradio_theme_config()
+        theme_config = self._theme_override or UI_CONFIG.get_gradio_theme_config()
         
         with gr.Blocks(
             title="Database Catalog", 
@@ -163,7 +329,7 @@ class UIGenerator:
                         export_btn = gr.Button("Export Results", variant="secondary")
                     
                     search_btn.click(
-                        search_catalog,
+                        self.search_catalog,
                         inputs=[search_input, table_filter, type_filter],
                         outputs=[search_summary, search_results]
                     )
@@ -178,24 +344,13 @@ class UIGenerator:
                     table_details = gr.HTML()
                     
                     table_selector.change(
-                        get_table_details,
+                        self.get_table_details,
                         inputs=[table_selector],
                         outputs=[table_details]
                     )
         
-        # Launch interface with configurable server settings
-        logger.info(f"Launching UI on {UI_CONFIG.host}:{UI_CONFIG.port}")
-        url = interface.launch(
-            server_name=UI_CONFIG.host,
-            server_port=UI_CONFIG.port,
-            share=UI_CONFIG.share,
-            inbrowser=UI_CONFIG.inbrowser,
-            max_threads=UI_CONFIG.max_threads,
-            show_error=UI_CONFIG.show_error,
-            show_api=UI_CONFIG.show_api
-        )
-        
-        return f"http://localhost:{UI_CONFIG.port}"
+        self._interface = interface
+        return interface
     
     def _format_results(self, df: pd.DataFrame) -> str:
         """Format search results as HTML table - UPDATED with configurable styling"""
@@ -203,52 +358,60 @@ class UIGenerator:
         # Use configurable results per page
         display_df = df.head(UI_CONFIG.results_per_page)
         
-        html = f"""
+        header_style = UI_CONFIG.get_header_style()
+        cell_style = UI_CONFIG.get_cell_style()
+        code_cell_style = UI_CONFIG.get_cell_style(is_code=True)
+        
+        parts = [f"""
         <div style="font-family: {UI_CONFIG.font_family};">
             <table style="{UI_CONFIG.get_table_style()}">
                 <tr>
-                    <th style="{UI_CONFIG.get_header_style()}">Table</th>
-                    <th style="{UI_CONFIG.get_header_style()}">Column</th>
-                    <th style="{UI_CONFIG.get_header_style()}">Type</th>
-                    <th style="{UI_CONFIG.get_header_style()}">Business Type</th>
-                    <th style="{UI_CONFIG.get_header_style()}">Description</th>
+                    <th style="{header_style}">Table</th>
+                    <th style="{header_style}">Column</th>
+                    <th style="{header_style}">Type</th>
+                    <th style="{header_style}">Business Type</th>
+                    <th style="{header_style}">Description</th>
                 </tr>
-        """
+        """]
         
-        for i, (_, row) in enumerate(display_df.iterrows()):
-            # Alternate row colors using config
-            if i % 2 == 0:
-                row_bg = UI_CONFIG._config['styling']['even_row_background']
-            else:
-                row_bg = UI_CONFIG._config['styling']['odd_row_background']
-            
-            # Truncate description using config
-            description = UI_CONFIG.truncate_text(
-                str(row.get('column_description', '')), 
-                is_description=True
-            )
-            
-            html += f"""
-            <tr style="background-color: {row_bg};" onmouseover="this.style.backgroundColor='{UI_CONFIG._config['styling']['hover_background']}'" onmouseout="this.style.backgroundColor='{row_bg}'">
-                <td style="{UI_CONFIG.get_cell_style()}"><strong>{row['table_name']}</strong></td>
-                <td style="{UI_CONFIG.get_cell_style(is_code=True)}"><code>{row['column_name']}</code></td>
-                <td style="{UI_CONFIG.get_cell_style()}">{row['data_type']}</td>
-                <td style="{UI_CONFIG.get_cell_style()}">{row['business_data_type']}</td>
-                <td style="{UI_CONFIG.get_cell_style()}">{description}</td>
-            </tr>
-            """
-        
-        html += """
+        parts.append(self._render_rows([
+            (f'<td style="{cell_style}"><strong>', _cell_text(display_df, 'table_name'), '</strong></td>'),
+            (f'<td style="{code_cell_style}"><code>', _cell_text(display_df, 'column_name'), '</code></td>'),
+            (f'<td style="{cell_style}">', _cell_text(display_df, 'data_type'), '</td>'),
+            (f'<td style="{cell_style}">', _cell_text(display_df, 'business_data_type'), '</td>'),
+            (f'<td style="{cell_style}">', _description_text(display_df), '</td>'),
+        ]))
+        
+        parts.append("""
             </table>
         </div>
-        """
+        """)
         
         # Add pagination info if results were truncated
         if len(df) > UI_CONFIG.results_per_page:
-            html += f"""
-            <p style="color: {UI_CONFIG._config['theme']['warning_color']}; font-style: italic; margin-top: 10px;">
+            parts.append(f"""
+            <p style="color: {UI_CONFIG.warning_color}; font-style: italic; margin-top: 10px;">
                 Showing {UI_CONFIG.results_per_page} of {len(df)} results
             </p>
-            """
+            """)
+        
+        return ''.join(parts)
+    
+    @staticmethod
+    def _render_rows(cells: List[Tuple[str, np.ndarray, str]]) -> str:
+        """Build every <tr> at once from (opening markup, values, closing markup) cells
+        
+        Each cell is concatenated column-wise over object arrays, so the cost
+        is a few array passes instead of a Python iteration per row.
+        """
+        row_count = len(cells[0][1])
+        row_bg = np.where(np.arange(row_count) % 2 == 0,
+                          UI_CONFIG.even_row_background, UI_CONFIG.odd_row_background).astype(object)
         
-        return html
\ No newline at end of file
+        rows = ('\n<tr style="background-color: ' + row_bg
+                + ';" onmouseover="this.style.backgroundColor=\'' + UI_CONFIG.hover_background
+                + '\'" onmouseout="this.style.backgroundColor=\'' + row_bg + '\'">')
+        for opening, values, closing in cells:
+            rows = rows + opening + values + closing
+        rows = rows + '</tr>\n'
+        return ''.join(rows.tolist())
@@ -0,0 +1,60 @@
+"""Connection pool shared by the component tests"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from src.tools.database_connector import DatabaseConnector, DatabaseConnectionError
+
+class ConnectionPool:
+    """Hands out connected DatabaseConnectors and reuses them across tests
+
+    Connectors are created on demand up to ``max_size`` and put back on
+    release instead of being closed, so the login handshake is paid once
+    per connector rather than once per test.
+    """
+
+    def __init__(self, factory: Callable[[], DatabaseConnector] = DatabaseConnector, max_size: int = 4):
+        self._factory = factory
+        self._max_size = max_size
+        self._idle: "queue.LifoQueue[DatabaseConnector]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._connectors: List[DatabaseConnector] = []
+
+    @contextmanager
+    def acquire(self) -> Iterator[DatabaseConnector]:
+        """Borrow a connected connector for the duration of the block"""
+        connector = self._checkout()
+        try:
+            yield connector
+        finally:
+            self._idle.put(connector)
+
+    def _checkout(self) -> DatabaseConnector:
+        try:
+            connector = self._idle.get_nowait()
+        except queue.Empty:
+            connector = self._create() or self._idle.get()
+
+        # A connector whose session dropped is reconnected before reuse
+        if not connector.is_connected and not connector.connect():
+            self._idle.put(connector)
+            raise DatabaseConnectionError("Failed to establish database connection")
+        return connector
+
+    def _create(self) -> Optional[DatabaseConnector]:
+        """A new connector, or None when the pool is at its size limit"""
+        with self._lock:
+            if len(self._connectors) >= self._max_size:
+                return None
+            connector = self._factory()
+            self._connectors.append(connector)
+        return connector
+
+    def close(self) -> None:
+        """Close every connector the pool created"""
+        with self._lock:
+            connectors, self._connectors = self._connectors, []
+        for connector in connectors:
+            connector.close()
@@ -0,0 +1,77 @@
+"""Shared pytest configuration for the test suite"""
+
+import os
+import importlib
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path for testing
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# DB_CONFIG validates credentials at import; no test opens a real connection,
+# so placeholders are enough for the src modules to import
+for var in ("SNOWFLAKE_ACCOUNT", "SNOWFLAKE_USER", "SNOWFLAKE_PASSWORD",
+            "SNOWFLAKE_WAREHOUSE", "SNOWFLAKE_DATABASE", "SNOWFLAKE_SCHEMA"):
+    os.environ.setdefault(var, "test")
+
+# Config singletons most test modules import; none of them pull in pandas
+PREIMPORT_MODULES = (
+    'src.core.ai_config',
+    'src.core.ui_config',
+    'src.core.column_config',
+    'src.core.data_processing_config',
+)
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", default=False,
+                     help="also run tests marked slow")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: imports the pipeline and its heavy dependencies; run with --run-slow")
+    
+    # Load the configs (and write their bytecode) once before collection
+    for module in PREIMPORT_MODULES:
+        importlib.import_module(module)
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+@pytest.fixture(scope="session")
+def data_cfg():
+    """The data processing config singleton, imported once per session"""
+    from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+    return DATA_PROCESSING_CONFIG
+
+@pytest.fixture(scope="session")
+def ui_cfg():
+    """The UI config singleton, imported once per session"""
+    from src.core.ui_config import UI_CONFIG
+    return UI_CONFIG
+
+@pytest.fixture(scope="session")
+def column_cfg():
+    """The column classification config singleton, imported once per session"""
+    from src.core.column_config import COLUMN_CONFIG
+    return COLUMN_CONFIG
+
+@pytest.fixture(scope="session")
+def configs(data_cfg, ui_cfg, column_cfg):
+    """The refactored config singletons together, as configs.data/.ui/.column"""
+    return SimpleNamespace(data=data_cfg, ui=ui_cfg, column=column_cfg)
+
+@pytest.fixture
+def mutable_configs(configs):
+    """The config singletons, with any changes a test makes undone afterwards"""
+    saved = {name: cfg.save_state() for name, cfg in vars(configs).items()}
+    yield configs
+    for name, cfg in vars(configs).items():
+        cfg.restore_state(saved[name])
@@ -1,72 +1,102 @@
 #!/usr/bin/env python3
-"""Comprehensive test script for database catalog components"""
+"""Comprehensive test script for database catalog components
 
+The full pipeline test makes AI API calls and is skipped unless
+RUN_PIPELINE_TEST=1 is set.
+"""
+
+import io
+import os
 import sys
 import traceback
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 
 # Add src to path - robust path handling for tests directory
-import sys
-import os
-
-# Get the project root directory (parent of tests directory)
-project_root = Path(__file__).parent.parent
-src_path = project_root / 'src'
+_ROOT = Path(__file__).resolve().parent.parent
+_SRC = _ROOT / 'src'
 
-# Add both project root and src to Python path
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_path))
+# Add both src and project root to Python path
+sys.path[:0] = [str(_SRC), str(_ROOT)]
 
-# Debug: Print paths to help troubleshoot
-print(f"🔧 Project root: {project_root}")
-print(f"🔧 Source path: {src_path}")
-print(f"🔧 Source path exists: {src_path.exists()}")
+# Debug: set TEST_DEBUG=1 to print paths when troubleshooting imports
+if os.environ.get('TEST_DEBUG'):
+    print(f"🔧 Project root: {_ROOT}")
+    print(f"🔧 Source path: {_SRC}")
+    print(f"🔧 Source path exists: {_SRC.exists()}")
 
 # Import components
 from src.core.config import DB_CONFIG, APP_CONFIG, logger
-from src.tools.database_connector import DatabaseConnector, get_database_connection
+from src.core.ai_config import AI_CONFIG
+from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+from src.core.ui_config import UI_CONFIG
+from src.core.column_config import COLUMN_CONFIG
+from src.tools.database_connector import DatabaseConnector
 from src.tools.schema_discoverer import SchemaDiscoverer
 from src.tools.data_profiler import DataProfiler
 from src.agents.documentation_agent import DocumentationAgent
 from src.core.pipeline import CatalogPipeline
+from _pool import ConnectionPool
+
+# Snowflake settings the database tests need; kept in order for error messages
+REQUIRED_ENV_VARS = ('SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_PASSWORD',
+                     'SNOWFLAKE_WAREHOUSE', 'SNOWFLAKE_DATABASE', 'SNOWFLAKE_SCHEMA')
 
 class ComponentTester:
     """Test runner for database catalog components"""
     
+    # Indexed by the success flag
+    _STATUS = ("❌ FAIL", "✅ PASS")
+    
     def __init__(self):
         self.results = {}
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
+        # Connections are shared by the DB tests instead of opened per test
+        self._pool = ConnectionPool(factory=DatabaseConnector, max_size=4)
+        # Independent tests run concurrently and report through log_result
+        self._results_lock = threading.Lock()
+        # Report text is collected here and written to stdout once; each test
+        # writes to its own buffer, appended in test order when it is done
+        self._buf = io.StringIO()
+        self._test_output = threading.local()
+        # Discovery results shared by the schema and profiling tests
+        self._discovery = None
+        self._discovery_lock = threading.Lock()
         
-    def log_result(self, test_name: str, success: bool, message: str = "", duration: float = 0):
-        """Log test results"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        self.results[test_name] = {
-            'success': success,
-            'message': message,
-            'duration': duration
-        }
+    @property
+    def _out(self) -> io.StringIO:
+        """The running test's output buffer, or the report itself outside a test"""
+        return getattr(self._test_output, 'buf', self._buf)
+    
+    def _print(self, text: str = "") -> None:
+        """Append a line to the buffered report"""
+        self._out.write(f"{text}\n")
+    
+    def log_result(self, test_name: str, success: bool, message: str = "", duration_ns: int = 0):
+        """Log test results; durations are monotonic nanoseconds"""
+        duration = duration_ns / 1e9
+        duration_str = f" ({duration:.2f}s)" if duration_ns > 0 else ""
+        message_str = f"    {message}\n" if message else ""
+        # Buffered with the test's other output; run_all_tests writes it out at the end
+        self._out.write(f"{self._STATUS[bool(success)]} {test_name}{duration_str}\n{message_str}\n")
         
-        duration_str = f" ({duration:.2f}s)" if duration > 0 else ""
-        print(f"{status} {test_name}{duration_str}")
-        if message:
-            print(f"    {message}")
-        print()
+        with self._results_lock:
+            self.results[test_name] = {
+                'success': success,
+                'message': message,
+                'duration': duration
+            }
     
     def test_configuration_loading(self) -> bool:
         """Test 1: Configuration Loading"""
-        print("🔧 Testing Configuration Loading...")
-        test_start = time.time()
+        self._print("🔧 Testing Configuration Loading...")
+        test_start = time.perf_counter_ns()
         
         try:
-            # Test individual config imports
-            from src.core.ai_config import AI_CONFIG
-            from src.core.data_processing_config import DATA_PROCESSING_CONFIG
-            from src.core.ui_config import UI_CONFIG
-            from src.core.column_config import COLUMN_CONFIG
-            
             # Test basic property access
             assert AI_CONFIG.primary_model is not None, "AI config primary_model is None"
             assert DATA_PROCESSING_CONFIG.max_sample_rows > 0, "Data processing max_sample_rows invalid"
@@ -78,299 +108,334 @@ class ComponentTester:
             sample_rows_2 = DATA_PROCESSING_CONFIG.max_sample_rows
             assert sample_rows_1 == sample_rows_2, "max_sample_rows property inconsistent"
             
-            duration = time.time() - test_start
+            duration_ns = time.perf_counter_ns() - test_start
             self.log_result("Configuration Loading", True, 
-                          f"All config classes loaded successfully. Sample rows: {sample_rows_1}", duration)
+                          f"All config classes loaded successfully. Sample rows: {sample_rows_1}", duration_ns)
             return True
             
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Configuration Loading", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Configuration Loading", False, f"Error: {str(e)}", duration_ns)
             return False
     
     def test_database_connection(self) -> bool:
         """Test 2: Database Connection"""
-        print("🔌 Testing Database Connection...")
-        test_start = time.time()
+        self._print("🔌 Testing Database Connection...")
+        test_start = time.perf_counter_ns()
         
         try:
             # Test environment variables
-            required_vars = ['SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_PASSWORD', 
-                           'SNOWFLAKE_WAREHOUSE', 'SNOWFLAKE_DATABASE', 'SNOWFLAKE_SCHEMA']
-            missing_vars = []
-            
-            for var in required_vars:
-                import os
-                if not os.getenv(var):
-                    missing_vars.append(var)
+            env = os.environ
+            missing_vars = [var for var in REQUIRED_ENV_VARS if not env.get(var)]
             
             if missing_vars:
                 self.log_result("Database Connection", False, 
                               f"Missing environment variables: {', '.join(missing_vars)}", 
-                              time.time() - test_start)
+                              time.perf_counter_ns() - test_start)
                 return False
             
             # Test connection
             connector = DatabaseConnector()
             if connector.connect():
-                # Test basic query
-                result = connector.execute_query("SELECT CURRENT_VERSION(), CURRENT_DATABASE(), CURRENT_SCHEMA()")
-                
+                # get_connection_info probes version, database and schema in one round-trip
                 conn_info = connector.get_connection_info()
                 info_str = f"DB: {conn_info.get('current_database')}.{conn_info.get('current_schema')}"
                 
                 connector.close()
                 
-                duration = time.time() - test_start
-                self.log_result("Database Connection", True, info_str, duration)
+                duration_ns = time.perf_counter_ns() - test_start
+                self.log_result("Database Connection", True, info_str, duration_ns)
                 return True
             else:
                 self.log_result("Database Connection", False, "Failed to connect", 
-                              time.time() - test_start)
+                              time.perf_counter_ns() - test_start)
                 return False
                 
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Database Connection", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Database Connection", False, f"Error: {str(e)}", duration_ns)
             return False
     
     def test_context_manager(self) -> bool:
         """Test 3: Database Context Manager"""
-        print("🔄 Testing Database Context Manager...")
-        test_start = time.time()
+        self._print("🔄 Testing Database Context Manager...")
+        test_start = time.perf_counter_ns()
         
         try:
-            with get_database_connection() as db:
+            with self._pool.acquire() as db:
                 result = db.execute_query("SELECT 1 as test_col")
                 assert len(result) == 1, "Context manager query failed"
-                assert result[0]['TEST_COL'] == 1, "Query result incorrect"
+                assert result[0]['test_col'] == 1, "Query result incorrect"
             
-            duration = time.time() - test_start
-            self.log_result("Database Context Manager", True, "Context manager working correctly", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Database Context Manager", True, "Context manager working correctly", duration_ns)
             return True
             
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Database Context Manager", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Database Context Manager", False, f"Error: {str(e)}", duration_ns)
             return False
     
+    def _discover(self, db: DatabaseConnector) -> Tuple[Any, Any, Any]:
+        """Tables, metadata for the first 2 tables and their analyzed columns
+        
+        Computed once and shared by the schema discovery and profiling tests;
+        whichever runs first does the work while the other waits on the lock.
+        """
+        with self._discovery_lock:
+            if self._discovery is None:
+                discoverer = SchemaDiscoverer(db)
+                tables_df = metadata_df = analyzed_df = discoverer.discover_tables()
+                if not tables_df.empty:
+                    metadata_df = analyzed_df = discoverer.get_table_metadata(tables_df['name'].tolist()[:2])
+                if not metadata_df.empty:
+                    analyzed_df = discoverer.analyze_column_roles(metadata_df)
+                self._discovery = (tables_df, metadata_df, analyzed_df)
+            return self._discovery
+    
     def test_schema_discovery(self) -> bool:
         """Test 4: Schema Discovery"""
-        print("🔍 Testing Schema Discovery...")
-        test_start = time.time()
+        self._print("🔍 Testing Schema Discovery...")
+        test_start = time.perf_counter_ns()
         
         try:
-            with get_database_connection() as db:
-                discoverer = SchemaDiscoverer(db)
+            with self._pool.acquire() as db:
+                tables_df, metadata_df, analyzed_df = self._discover(db)
                 
                 # Test table discovery
-                tables_df = discoverer.discover_tables()
                 if tables_df.empty:
                     self.log_result("Schema Discovery", False, "No tables found", 
-                                  time.time() - test_start)
+                                  time.perf_counter_ns() - test_start)
                     return False
                 
                 table_names = tables_df['name'].tolist()
                 
                 # Test metadata collection for first few tables
-                test_tables = table_names[:2]  # Test with first 2 tables
-                metadata_df = discoverer.get_table_metadata(test_tables)
-                
                 if metadata_df.empty:
                     self.log_result("Schema Discovery", False, "No metadata found", 
-                                  time.time() - test_start)
+                                  time.perf_counter_ns() - test_start)
                     return False
                 
                 # Test column role analysis
-                analyzed_df = discoverer.analyze_column_roles(metadata_df)
-                
-                required_cols = ['table_name', 'column_name', 'column_role', 'business_data_type']
-                missing_cols = [col for col in required_cols if col not in analyzed_df.columns]
+                required_cols = frozenset(('table_name', 'column_name', 'column_role', 'business_data_type'))
+                missing_cols = required_cols - frozenset(analyzed_df.columns)
                 
                 if missing_cols:
                     self.log_result("Schema Discovery", False, 
-                                  f"Missing columns: {missing_cols}", time.time() - test_start)
+                                  f"Missing columns: {sorted(missing_cols)}", time.perf_counter_ns() - test_start)
                     return False
                 
-                duration = time.time() - test_start
+                duration_ns = time.perf_counter_ns() - test_start
                 self.log_result("Schema Discovery", True, 
-                              f"Found {len(table_names)} tables, {len(analyzed_df)} columns", duration)
+                              f"Found {len(table_names)} tables, {len(analyzed_df)} columns", duration_ns)
                 return True
                 
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Schema Discovery", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Schema Discovery", False, f"Error: {str(e)}", duration_ns)
             return False
     
     def test_data_profiling(self) -> bool:
         """Test 5: Data Profiling"""
-        print("📊 Testing Data Profiling...")
-        test_start = time.time()
+        self._print("📊 Testing Data Profiling...")
+        test_start = time.perf_counter_ns()
         
         try:
-            with get_database_connection() as db:
-                discoverer = SchemaDiscoverer(db)
+            with self._pool.acquire() as db:
                 profiler = DataProfiler(db)
                 
-                # Get a small sample for testing
-                tables_df = discoverer.discover_tables()
-                if tables_df.empty:
+                # Reuse the schema test's discovery instead of repeating it
+                tables_df, _, analyzed_df = self._discover(db)
+                if tables_df.empty or analyzed_df.empty:
                     self.log_result("Data Profiling", False, "No tables for profiling test", 
-                                  time.time() - test_start)
+                                  time.perf_counter_ns() - test_start)
                     return False
                 
-                table_names = tables_df['name'].tolist()[:1]  # Test with just 1 table
-                metadata_df = discoverer.get_table_metadata(table_names)
-                analyzed_df = discoverer.analyze_column_roles(metadata_df)
-                
-                # Test profiling on first few columns
+                # Test profiling on first few columns of just 1 table
+                first_table = tables_df['name'].iat[0]
+                analyzed_df = analyzed_df[analyzed_df['table_name'] == first_table]
                 test_df = analyzed_df.head(5)  # Test with first 5 columns
                 profiled_df = profiler.profile_columns(test_df)
                 
                 # Check that profiling added some information
-                original_cols = set(analyzed_df.columns)
-                profiled_cols = set(profiled_df.columns)
-                new_cols = profiled_cols - original_cols
+                new_cols = profiled_df.columns.difference(analyzed_df.columns).tolist()
                 
-                duration = time.time() - test_start
+                duration_ns = time.perf_counter_ns() - test_start
                 self.log_result("Data Profiling", True, 
-                              f"Profiled {len(test_df)} columns, added fields: {new_cols}", duration)
+                              f"Profiled {len(test_df)} columns, added fields: {new_cols}", duration_ns)
                 return True
                 
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Data Profiling", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Data Profiling", False, f"Error: {str(e)}", duration_ns)
             return False
     
     def test_ai_documentation(self) -> bool:
         """Test 6: AI Documentation Generation"""
-        print("🤖 Testing AI Documentation Generation...")
-        test_start = time.time()
+        self._print("🤖 Testing AI Documentation Generation...")
+        test_start = time.perf_counter_ns()
         
         try:
             # Check for AI API key
-            import os
             if not os.getenv('ANTHROPIC_API_KEY') and not os.getenv('OPENAI_API_KEY'):
                 self.log_result("AI Documentation", False, 
                               "No AI API key found (ANTHROPIC_API_KEY or OPENAI_API_KEY)", 
-                              time.time() - test_start)
+                              time.perf_counter_ns() - test_start)
                 return False
             
             # Create sample data for testing
-            sample_data = pd.DataFrame({
-                'table_name': ['CUSTOMER', 'CUSTOMER', 'ORDER'],
-                'column_name': ['customer_id', 'customer_name', 'order_date'],
-                'data_type': ['NUMBER', 'VARCHAR', 'DATE'],
-                'business_data_type': ['Identifier', 'Description', 'Date'],
-                'column_role': ['primary_key', 'dimension', 'dimension'],
-                'sample_values': ['1, 2, 3', 'John, Jane, Bob', '2023-01-01, 2023-01-02']
-            })
+            sample_data = pd.DataFrame.from_records([
+                {'table_name': 'CUSTOMER', 'column_name': 'customer_id', 'data_type': 'NUMBER',
+                 'business_data_type': 'Identifier', 'column_role': 'primary_key', 'sample_values': '1, 2, 3'},
+                {'table_name': 'CUSTOMER', 'column_name': 'customer_name', 'data_type': 'VARCHAR',
+                 'business_data_type': 'Description', 'column_role': 'dimension', 'sample_values': 'John, Jane, Bob'},
+                {'table_name': 'ORDER', 'column_name': 'order_date', 'data_type': 'DATE',
+                 'business_data_type': 'Date', 'column_role': 'dimension', 'sample_values': '2023-01-01, 2023-01-02'},
+            ])
             
             agent = DocumentationAgent()
             
             # Test with small sample to avoid high API costs
-            documented_df = agent.generate_documentation(sample_data)
+            try:
+                documented_df = agent.generate_documentation(sample_data)
+            finally:
+                agent.close()
             
             # Check that documentation was added
-            required_cols = ['table_description', 'column_description']
-            missing_cols = [col for col in required_cols if col not in documented_df.columns]
+            required_cols = frozenset(('table_description', 'column_description'))
+            missing_cols = required_cols - frozenset(documented_df.columns)
             
             if missing_cols:
                 self.log_result("AI Documentation", False, 
-                              f"Missing documentation columns: {missing_cols}", 
-                              time.time() - test_start)
+                              f"Missing documentation columns: {sorted(missing_cols)}", 
+                              time.perf_counter_ns() - test_start)
                 return False
             
             # Check that descriptions are not empty
-            empty_descriptions = documented_df['column_description'].isna().sum()
+            empty_descriptions = sum(1 for description in documented_df['column_description']
+                                     if not isinstance(description, str) or not description)
             
-            duration = time.time() - test_start
+            duration_ns = time.perf_counter_ns() - test_start
             self.log_result("AI Documentation", True, 
-                          f"Generated descriptions, {empty_descriptions} empty descriptions", duration)
+                          f"Generated descriptions, {empty_descriptions} empty descriptions", duration_ns)
             return True
             
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("AI Documentation", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("AI Documentation", False, f"Error: {str(e)}", duration_ns)
             return False
     
     def test_pipeline_integration(self) -> bool:
         """Test 7: Full Pipeline Integration"""
-        print("🔄 Testing Full Pipeline Integration...")
-        test_start = time.time()
+        self._print("🔄 Testing Full Pipeline Integration...")
+        test_start = time.perf_counter_ns()
+        
+        # Opt-in only: the full run is slow and makes paid AI API calls
+        if os.environ.get('RUN_PIPELINE_TEST') != '1':
+            self.log_result("Pipeline Integration", True, "Skipped (set RUN_PIPELINE_TEST=1)", 0)
+            return True
         
         try:
             pipeline = CatalogPipeline()
             
-            # This is a longer test - might want to make it optional
-            print("    ⚠️  This test will run the full pipeline and may take several minutes...")
-            print("    💰 This test will make AI API calls which may incur costs...")
-            
-            response = input("    Continue with full pipeline test? (y/N): ")
-            if response.lower() not in ['y', 'yes']:
-                self.log_result("Pipeline Integration", True, "Skipped by user choice", 0)
-                return True
+            self._print("    ⚠️  This test will run the full pipeline and may take several minutes...")
+            self._print("    💰 This test will make AI API calls which may incur costs...")
             
             url = pipeline.run()
             
             if url and "localhost" in url:
-                duration = time.time() - test_start
+                duration_ns = time.perf_counter_ns() - test_start
                 self.log_result("Pipeline Integration", True, 
-                              f"Pipeline completed successfully. UI at: {url}", duration)
+                              f"Pipeline completed successfully. UI at: {url}", duration_ns)
                 return True
             else:
                 self.log_result("Pipeline Integration", False, 
                               "Pipeline completed but no valid URL returned", 
-                              time.time() - test_start)
+                              time.perf_counter_ns() - test_start)
                 return False
                 
         except Exception as e:
-            duration = time.time() - test_start
-            self.log_result("Pipeline Integration", False, f"Error: {str(e)}", duration)
+            duration_ns = time.perf_counter_ns() - test_start
+            self.log_result("Pipeline Integration", False, f"Error: {str(e)}", duration_ns)
             return False
     
+    def _run_test(self, test_method) -> Tuple[bool, str]:
+        """Run one test method, returning its result and everything it reported
+        
+        An unexpected exception counts as a failure.
+        """
+        self._test_output.buf = io.StringIO()
+        try:
+            return bool(test_method()), self._out.getvalue()
+        except Exception as e:
+            self._print(f"❌ CRITICAL ERROR in {test_method.__name__}: {str(e)}")
+            traceback.print_exc(file=self._out)
+            return False, self._out.getvalue()
+        finally:
+            del self._test_output.buf
+    
     def run_all_tests(self) -> Dict:
         """Run all tests and return summary"""
-        print("🚀 Starting Database Catalog Component Tests")
-        print("=" * 60)
+        self._print("🚀 Starting Database Catalog Component Tests")
+        self._print("=" * 60)
         
-        test_methods = [
+        # These have no data dependency on one another and mostly wait on the
+        # database or the AI API, so they run side by side; the pooled
+        # connections cap how many hit Snowflake at once
+        parallel_tests = [
             self.test_configuration_loading,
             self.test_database_connection,
             self.test_context_manager,
             self.test_schema_discovery,
             self.test_data_profiling,
             self.test_ai_documentation,
-            self.test_pipeline_integration
         ]
+        # Runs the whole pipeline and launches the UI, so it runs alone at the end
+        serial_tests = [self.test_pipeline_integration]
         
         passed = 0
         failed = 0
         
-        for test_method in test_methods:
-            try:
-                if test_method():
+        try:
+            with ThreadPoolExecutor(max_workers=len(parallel_tests)) as executor:
+                futures = [executor.submit(self._run_test, test_method) for test_method in parallel_tests]
+                for future in as_completed(futures):
+                    if future.result()[0]:
+                        passed += 1
+                    else:
+                        failed += 1
+            
+            # Each test's header stays next to its results, in the order listed above
+            for future in futures:
+                self._buf.write(future.result()[1])
+            
+            for test_method in serial_tests:
+                success, output = self._run_test(test_method)
+                self._buf.write(output)
+                if success:
                     passed += 1
                 else:
                     failed += 1
-            except Exception as e:
-                print(f"❌ CRITICAL ERROR in {test_method.__name__}: {str(e)}")
-                traceback.print_exc()
-                failed += 1
+        finally:
+            self._pool.close()
         
         # Summary
-        total_duration = time.time() - self.start_time
-        print("=" * 60)
-        print(f"📊 TEST SUMMARY")
-        print(f"   Total Tests: {passed + failed}")
-        print(f"   ✅ Passed: {passed}")
-        print(f"   ❌ Failed: {failed}")
-        print(f"   ⏱️  Total Duration: {total_duration:.2f}s")
+        total_duration = (time.perf_counter_ns() - self.start_time) / 1e9
+        self._print("=" * 60)
+        self._print(f"📊 TEST SUMMARY")
+        self._print(f"   Total Tests: {passed + failed}")
+        self._print(f"   ✅ Passed: {passed}")
+        self._print(f"   ❌ Failed: {failed}")
+        self._print(f"   ⏱️  Total Duration: {total_duration:.2f}s")
         
         if failed == 0:
-            print("🎉 All tests passed! Your database catalog is ready to use.")
+            self._print("🎉 All tests passed! Your database catalog is ready to use.")
         else:
-            print("⚠️  Some tests failed. Check the errors above and fix issues before proceeding.")
+            self._print("⚠️  Some tests failed. Check the errors above and fix issues before proceeding.")
+        
+        # The whole report goes out in one write
+        sys.stdout.write(self._buf.getvalue())
+        sys.stdout.flush()
         
         return {
             'passed': passed,
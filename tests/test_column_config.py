@@ -0,0 +1,56 @@
+"""Tests for name-based column classification"""
+
+import pytest
+
+from src.core.column_config import ColumnClassificationConfig
+
+@pytest.fixture
+def column_config():
+    return ColumnClassificationConfig()
+
+class TestClassifyFieldByName:
+    """Test cases for classify_field_by_name"""
+
+    def test_rule_priority_beats_position(self, column_config):
+        """Test that an earlier rule wins even when its keyword appears later in the name"""
+        result = column_config.classify_field_by_name('QUANTITY_TOTAL')
+
+        assert result['business_type'] == 'Currency'
+        assert result['reason'] == 'Contains amount keyword: total'
+
+    def test_keyword_rules_and_default(self, column_config):
+        """Test each keyword rule and the fallback classification"""
+        assert column_config.classify_field_by_name('ITEM_QTY')['business_type'] == 'Quantity'
+        assert column_config.classify_field_by_name('SHIP_CITY')['business_type'] == 'Location'
+        assert column_config.classify_field_by_name('ORDER_STATE')['business_type'] == 'Status'
+        assert column_config.classify_field_by_name('MISC')['reason'] == 'No specific patterns detected'
+
+    def test_update_recompiles_keywords(self, column_config):
+        """Test that keyword changes made through update() are picked up"""
+        column_config.update('measures.amount_fields.keywords', ['misc'])
+
+        result = column_config.classify_field_by_name('MISC')
+        assert result['role'] == 'measure'
+        assert result['business_type'] == 'Currency'
+
+    def test_update_refreshes_suffix_tuples(self, column_config):
+        """Test that suffix changes made through update() are picked up"""
+        column_config.update('primary_keys.suffixes', ['_code'])
+
+        assert column_config.primary_key_suffix_tuple == ('_code',)
+        assert column_config.classify_field_by_name('COUNTRY_CODE')['role'] == 'primary_key'
+
+    def test_keyword_patterns_follow_updates(self, column_config):
+        """Test that per-rule patterns are compiled and refreshed on update()"""
+        assert column_config.keyword_pattern('quantity').search('item_qty')
+
+        column_config.update('dimensions.location_fields.keywords', [])
+        assert column_config.keyword_pattern('location') is None
+
+    def test_classification_is_cached_per_name(self, column_config):
+        """Test that repeated names reuse the cached result without sharing it"""
+        first = column_config.classify_field_by_name('ORDER_ID')
+        first['role'] = 'changed'
+        
+        assert column_config.classify_field_by_name('order_id')['role'] == 'primary_key'
+        assert column_config._classify_cached.cache_info().hits == 1
@@ -0,0 +1,23 @@
+"""Import checks for the component configuration singletons
+
+The config modules import without pandas, so this runs in the default test run.
+"""
+
+import pytest
+
+def test_component_configs():
+    """Test that existing config classes can be imported without errors"""
+    try:
+        from src.core.ai_config import AI_CONFIG
+        from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+        from src.core.ui_config import UI_CONFIG
+        from src.core.column_config import COLUMN_CONFIG
+        
+        # Test basic access to verify configs loaded
+        assert AI_CONFIG.primary_model is not None
+        assert DATA_PROCESSING_CONFIG.max_sample_rows > 0
+        assert UI_CONFIG.port > 0
+        assert len(COLUMN_CONFIG.primary_key_suffixes) > 0
+        
+    except Exception as e:
+        pytest.fail(f"Failed to import configuration classes: {e}")
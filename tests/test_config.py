@@ -10,21 +10,23 @@ from unittest.mock import patch
 import sys
 import os
 
-# Get the project root directory (parent of tests directory)
-project_root = Path(__file__).parent.parent
-src_path = project_root / 'src'
+_ROOT = Path(__file__).resolve().parent.parent
+_SRC = _ROOT / 'src'
 
-# Add both project root and src to Python path
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_path))
+# Add both src and project root to Python path
+sys.path[:0] = [str(_SRC), str(_ROOT)]
 
-# Debug: Print paths to help troubleshoot
-print(f"Project root: {project_root}")
-print(f"Source path: {src_path}")
-print(f"Source path exists: {src_path.exists()}")
+# Debug: set TEST_DEBUG=1 to print paths when troubleshooting imports
+if os.environ.get('TEST_DEBUG'):
+    print(f"Project root: {_ROOT}")
+    print(f"Source path: {_SRC}")
+    print(f"Source path exists: {_SRC.exists()}")
 
 from src.core.base_config import BaseConfig
 
+# Write fixtures with libyaml when available, matching the loader side
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 class TestConfig(BaseConfig):
     """Test configuration class"""
     
@@ -73,7 +75,7 @@ class TestBaseConfig:
         }
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=YamlDumper)
             config_path = f.name
         
         try:
@@ -111,6 +113,39 @@ class TestBaseConfig:
         config.update('new.nested.key', 'value')
         assert config.get('new.nested.key') == 'value'
     
+    def test_dot_path_is_split_once(self):
+        """Test that repeated lookups of the same key reuse its split path"""
+        from src.core.base_config import _key_parts
+        config = TestConfig("nonexistent.yaml", "test")
+        _key_parts.cache_clear()
+        
+        for _ in range(3):
+            assert config.get('api.timeout') == 30
+        assert _key_parts.cache_info().misses == 1
+    
+    def test_get_reads_the_live_nested_settings(self):
+        """Test that get() sees changes made directly to a section it returned"""
+        config = TestConfig("nonexistent.yaml", "test")
+        assert config.get('api.timeout') == 30
+        
+        config.get('api')['timeout'] = 45
+        
+        assert config.get('api.timeout') == 45
+    
+    def test_restore_state_undoes_updates(self):
+        """Test that restore_state returns to the saved settings without sharing them"""
+        config = TestConfig("nonexistent.yaml", "test")
+        state = config.save_state()
+        
+        config.update('api.timeout', 120)
+        config.update('new.key', 'value')
+        config.restore_state(state)
+        
+        assert config.get('api.timeout') == 30
+        assert config.get('new.key') is None
+        config.update('api.timeout', 5)
+        assert state['api']['timeout'] == 30
+    
     def test_config_save_and_reload(self):
         """Test saving and reloading configuration"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -132,6 +167,35 @@ class TestBaseConfig:
             # Default values should still be present
             assert config2.get('database.host') == 'localhost'
     
+    def test_yaml_strings_are_interned(self):
+        """Test that string keys and values loaded from YAML are interned"""
+        test_config = {'measures': {'keywords': ['amount', 'price'], 'business_type': 'Currency'}}
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(test_config, f, Dumper=YamlDumper)
+            config_path = f.name
+        
+        try:
+            config = TestConfig(config_path, "test")
+            assert config.get('measures.business_type') is sys.intern('Currency')
+            assert all(k is sys.intern(k) for k in config.get('measures.keywords'))
+        finally:
+            Path(config_path).unlink()
+    
+    def test_cached_yaml_is_not_shared(self):
+        """Test that instances loaded from the same file do not share state"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'api': {'timeout': 60}}, f, Dumper=YamlDumper)
+            config_path = f.name
+        
+        try:
+            config = TestConfig(config_path, "test")
+            config.update('api.timeout', 5)
+            
+            assert TestConfig(config_path, "test").get('api.timeout') == 60
+        finally:
+            Path(config_path).unlink()
+    
     def test_invalid_yaml_handling(self):
         """Test handling of invalid YAML files"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -158,26 +222,6 @@ class TestBaseConfig:
         finally:
             Path(config_path).unlink()
 
-def test_component_configs():
-    """Test that existing config classes can be imported without errors"""
-    try:
-        from src.core.ai_config import AI_CONFIG
-        from src.core.data_processing_config import DATA_PROCESSING_CONFIG
-        from src.core.ui_config import UI_CONFIG
-        from src.core.column_config import COLUMN_CONFIG
-        
-        # Test basic access to verify configs loaded
-        assert AI_CONFIG.primary_model is not None
-        assert DATA_PROCESSING_CONFIG.max_sample_rows > 0
-        assert UI_CONFIG.port > 0
-        assert len(COLUMN_CONFIG.primary_key_suffixes) > 0
-        
-        print("✅ All configuration classes imported successfully")
-        
-    except Exception as e:
-        pytest.fail(f"Failed to import configuration classes: {e}")
-
 if __name__ == "__main__":
     # Run tests directly
-    test_component_configs()
-    print("✅ Configuration tests completed")
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
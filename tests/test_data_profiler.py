@@ -0,0 +1,239 @@
+"""Tests for DataProfiler query batching"""
+
+import pandas as pd
+import pytest
+
+from src.tools.data_profiler import DataProfiler, _stats_query_template
+from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+
+class FakeConnector:
+    """Records queries and answers them from canned results"""
+    
+    def __init__(self, responder):
+        self.queries = []
+        self.params = []
+        self.responder = responder
+    
+    def execute_query(self, query, params=None, timeout=None):
+        self.queries.append(query)
+        self.params.append(params)
+        return self.responder(query)
+    
+    def execute_query_streaming(self, query, params=None, batch_size=1000, timeout=None):
+        yield from self.execute_query(query, params, timeout)
+
+class FakeAsyncConnector(FakeConnector):
+    """FakeConnector that also accepts queries through submit_async/fetch_async"""
+    
+    def __init__(self, responder):
+        super().__init__(responder)
+        self.events = []
+    
+    def submit_async(self, query, params=None, timeout=None):
+        self.events.append('submit')
+        self.queries.append(query)
+        return len(self.queries) - 1
+    
+    def fetch_async(self, query_id):
+        self.events.append('fetch')
+        return self.responder(self.queries[query_id])
+
+def respond(query):
+    if "INFORMATION_SCHEMA.TABLES" in query:
+        return [{'table_name': 'ORDERS', 'row_count': 10}]
+    if "LISTAGG" in query:
+        return [{'c1_sample': 'a; b'}]
+    return [{'c0_min': 1, 'c0_max': 9, 'c0_avg': 5.0, 'c0_dc': 9, 'c1_dc': 2,
+             'c2_min': '2024-01-01', 'c2_max': '2024-12-31', 'c2_dc': 300}]
+
+@pytest.fixture
+def metadata_df():
+    return pd.DataFrame({
+        'table_name': ['ORDERS'] * 4,
+        'column_name': ['AMOUNT', 'STATUS', 'CREATED', 'PAYLOAD'],
+        'data_type': ['NUMBER', 'TEXT', 'DATE', 'VARIANT'],
+    })
+
+class TestDataProfiler:
+    """Test cases for per-table bulk profiling"""
+    
+    def test_table_profiled_in_fixed_number_of_queries(self, metadata_df):
+        """Test that a table costs a row-count lookup, one aggregate and one values query"""
+        db = FakeConnector(respond)
+        profiled = DataProfiler(db).profile_columns(metadata_df)
+        
+        assert len(db.queries) == 3
+        assert profiled.loc[0, 'distinct_count'] == 9
+        assert profiled.loc[0, 'avg_value'] == "5.00"
+        assert profiled.loc[1, 'sample_values'] == "a; b"
+        assert profiled.loc[2, 'max_value'] == "2024-12-31"
+        assert pd.isna(profiled.loc[3, 'distinct_count'])
+    
+    def test_async_queries_submitted_before_fetching(self, metadata_df):
+        """Test that every table's bulk queries are in flight before any result is read"""
+        other_df = metadata_df.assign(table_name='ITEMS')
+        db = FakeAsyncConnector(respond)
+        profiled = DataProfiler(db).profile_columns(pd.concat([metadata_df, other_df], ignore_index=True))
+        
+        assert db.events == ['submit'] * 4 + ['fetch'] * 4
+        assert profiled.loc[4, 'distinct_count'] == 9
+        assert profiled.loc[5, 'sample_values'] == "a; b"
+    
+    def test_table_iteration_submits_every_table_up_front(self, metadata_df):
+        """Test that iter_table_profiles overlaps all tables' queries, not one table at a time"""
+        other_df = metadata_df.assign(table_name='ITEMS')
+        db = FakeAsyncConnector(respond)
+        tables = DataProfiler(db).iter_table_profiles(pd.concat([metadata_df, other_df], ignore_index=True))
+        
+        table_name, first = next(tables)
+        assert db.events == ['submit'] * 4 + ['fetch'] * 2
+        assert table_name == 'ORDERS'
+        assert first.loc[1, 'sample_values'] == "a; b"
+        
+        table_name, second = next(tables)
+        assert table_name == 'ITEMS'
+        assert second.index.tolist() == [4, 5, 6, 7]
+        assert second.loc[4, 'distinct_count'] == 9
+        assert pd.isna(second.loc[7, 'distinct_count'])
+    
+    def test_query_text_is_reused_across_same_shaped_tables(self, metadata_df):
+        """Test that tables with the same columns share cached query text under their own names"""
+        other_df = metadata_df.assign(table_name='ORDERS_2024')
+        db = FakeConnector(respond)
+        _stats_query_template.cache_clear()
+        DataProfiler(db).profile_columns(pd.concat([metadata_df, other_df], ignore_index=True))
+        
+        stats_queries = [query for query in db.queries if "c0_min" in query]
+        assert _stats_query_template.cache_info()[:2] == (1, 1)  # (hits, misses)
+        assert '."ORDERS" ' in stats_queries[0]
+        assert '."ORDERS_2024" ' in stats_queries[1]
+        assert stats_queries[0].replace('"ORDERS"', '"ORDERS_2024"') == stats_queries[1]
+    
+    def test_identifiers_are_quoted(self):
+        """Test that reserved-word table and column names are quoted in generated SQL"""
+        db = FakeConnector(respond)
+        metadata_df = pd.DataFrame({'table_name': ['ORDER'], 'column_name': ['GROUP'],
+                                    'data_type': ['NUMBER'], 'row_count': [10]})
+        DataProfiler(db).profile_columns(metadata_df)
+        
+        assert '."ORDER"' in db.queries[0]
+        assert 'MIN("GROUP")' in db.queries[0]
+    
+    def test_bulk_failure_falls_back_to_single_columns(self, metadata_df):
+        """Test that a failing bulk query is retried column by column"""
+        def failing(query):
+            if "c0_min" in query:
+                raise RuntimeError("bad column")
+            return respond(query)
+        
+        db = FakeConnector(failing)
+        profiled = DataProfiler(db).profile_columns(metadata_df)
+        
+        assert len(db.queries) > 3
+        assert 'distinct_count' in profiled.columns
+    
+    def test_row_counts_fetched_once_for_all_tables(self):
+        """Test that row counts for every table come from a single lookup"""
+        db = FakeConnector(lambda query: [{'table_name': 'A', 'row_count': 5},
+                                          {'table_name': 'B', 'row_count': 7}]
+                           if "INFORMATION_SCHEMA" in query else [])
+        metadata_df = pd.DataFrame({'table_name': ['A', 'B', 'B'],
+                                    'column_name': ['X', 'Y', 'Z'],
+                                    'data_type': ['VARIANT'] * 3})
+        
+        profiler = DataProfiler(db)
+        list(profiler.iter_table_profiles(metadata_df))
+        
+        assert sum("INFORMATION_SCHEMA" in q for q in db.queries) == 1
+        assert profiler._get_table_row_count('B') == 7
+        
+        # Table names are bound as a single JSON array parameter
+        assert db.params[0][1] == '["A", "B"]'
+    
+    def test_joined_row_counts_skip_lookup(self):
+        """Test that row counts carried on the metadata frame are not fetched again"""
+        db = FakeConnector(lambda query: [])
+        metadata_df = pd.DataFrame({'table_name': ['A', 'A'],
+                                    'column_name': ['X', 'Y'],
+                                    'data_type': ['VARIANT'] * 2,
+                                    'row_count': [5, 5]})
+        profiler = DataProfiler(db)
+        profiler.profile_columns(metadata_df)
+        
+        assert db.queries == []
+        assert profiler._get_table_row_count('A') == 5
+    
+    def test_parallel_profiling_keeps_table_order(self, monkeypatch):
+        """Test that concurrently profiled tables come back in input order"""
+        monkeypatch.setitem(DATA_PROCESSING_CONFIG._config['performance'], 'enable_parallel_processing', True)
+        db = FakeConnector(lambda query: [])
+        metadata_df = pd.DataFrame({'table_name': ['C', 'A', 'B', 'A'],
+                                    'column_name': ['W', 'X', 'Y', 'Z'],
+                                    'data_type': ['VARIANT'] * 4})
+        
+        tables = [name for name, _ in DataProfiler(db).iter_table_profiles(metadata_df)]
+        
+        assert tables == ['C', 'A', 'B']
+    
+    def test_single_column_aggregates_use_spec_formatters(self):
+        """Test that the per-column fallback formats numeric and date aggregates"""
+        db = FakeConnector(lambda query: [{'min_value': 1, 'max_value': 2.5, 'avg_value': None,
+                                           'distinct_count': 2}])
+        profiler = DataProfiler(db)
+        profiler._row_counts['T'] = 10
+        
+        numeric = profiler._profile_single_column('T', 'N', 'NUMBER')
+        date = profiler._profile_single_column('T', 'D', 'DATE')
+        
+        assert numeric == {'min_value': "1.00", 'max_value': "2.50", 'avg_value': None, 'distinct_count': 2}
+        assert date == {'min_value': "1", 'max_value': "2.5", 'distinct_count': 2}
+        assert 'AVG' not in db.queries[-1]
+    
+    def test_text_fallback_stops_at_sample_length(self, monkeypatch):
+        """Test that single-column text profiling stops reading once the sample is full"""
+        monkeypatch.setitem(DATA_PROCESSING_CONFIG._config['text_analysis'], 'max_sample_text_length', 20)
+        pulled = []
+        
+        def values():
+            for i in range(100):
+                pulled.append(i)
+                yield {'value': f"value{i:03d}"}
+        
+        db = FakeConnector(lambda query: [{'distinct_count': 100}])
+        db.execute_query_streaming = lambda query, **kwargs: values()
+        
+        profile = DataProfiler(db)._profile_text_column('T', 'name', '')
+        
+        assert len(pulled) == 3
+        assert profile['distinct_count'] == 100
+
+class TestSampleClause:
+    """Test cases for table-size based sampling"""
+    
+    def test_clause_by_table_size(self, monkeypatch):
+        """Test that medium tables sample rows and large tables sample micro-partitions"""
+        sampling = DATA_PROCESSING_CONFIG._config['sampling']
+        monkeypatch.setitem(sampling, 'small_table_threshold', 100)
+        monkeypatch.setitem(sampling, 'medium_table_threshold', 1000)
+        monkeypatch.setitem(sampling, 'large_table_threshold', 1000)
+        monkeypatch.setitem(sampling, 'bernoulli_sample_percent', 10)
+        monkeypatch.setitem(sampling, 'system_sample_percent', 1)
+        
+        assert DATA_PROCESSING_CONFIG.get_sample_clause(50) == ""
+        assert DATA_PROCESSING_CONFIG.get_sample_clause(500) == "SAMPLE BERNOULLI (10)"
+        assert DATA_PROCESSING_CONFIG.get_sample_clause(5000) == "SAMPLE SYSTEM (1)"
+    
+    def test_clause_follows_table_reference(self):
+        """Test that single-column queries place the sample clause before WHERE"""
+        db = FakeConnector(lambda query: [{'distinct_count': 0}])
+        db.execute_query_streaming = lambda query, **kwargs: iter(())
+        profiler = DataProfiler(db)
+        profiler._get_sample_clause = lambda row_count: "SAMPLE SYSTEM (1)"
+        profiler._row_counts['T'] = 10
+        
+        profiler._profile_single_column('T', 'N', 'NUMBER')
+        profiler._profile_single_column('T', 'S', 'TEXT')
+        
+        for query in db.queries:
+            assert query.index("SAMPLE SYSTEM (1)") < query.index("WHERE")
+
@@ -0,0 +1,177 @@
+"""Tests for DatabaseConnector result handling"""
+
+import threading
+import pandas as pd
+
+import snowflake.connector
+from src.tools.database_connector import DatabaseConnector
+from src.core.data_processing_config import DATA_PROCESSING_CONFIG
+
+class FakeCursor:
+    """Tuple cursor returning canned rows with uppercase column names"""
+
+    description = [('TABLE_NAME',), ('ROW_COUNT',)]
+    rows = [('ORDERS', 10), ('ITEMS', 20), ('USERS', 30)]
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.position = 0
+        self.closed = False
+
+    def execute(self, query, params=None, _statement_params=None):
+        self.connection.queries.append((query, _statement_params))
+
+    def fetchone(self):
+        return (1,)
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchmany(self, size):
+        batch = self.rows[self.position:self.position + size]
+        self.position += size
+        return batch
+
+    def fetch_pandas_all(self):
+        return pd.DataFrame(self.rows, columns=[name for name, in self.description])
+
+    def close(self):
+        self.closed = True
+
+class FakeConnection:
+    """Hands out FakeCursors and records executed statements"""
+
+    def __init__(self):
+        self.queries = []
+        self.cursors = []
+
+    def cursor(self, *args):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def close(self):
+        pass
+
+def connected_connector():
+    connector = DatabaseConnector()
+    connector.connection = FakeConnection()
+    connector._is_connected = True
+    return connector
+
+class TestQueryResults:
+    """Test cases for row normalization"""
+
+    def test_execute_query_lowercases_keys(self):
+        """Test that rows come back keyed by lowercased column names"""
+        rows = connected_connector().execute_query("SELECT table_name, row_count FROM t")
+
+        assert rows[0] == {'table_name': 'ORDERS', 'row_count': 10}
+        assert len(rows) == 3
+
+    def test_streaming_lowercases_keys(self):
+        """Test that streamed rows use the same keys as execute_query"""
+        rows = list(connected_connector().execute_query_streaming("SELECT 1", batch_size=2))
+
+        assert [row['table_name'] for row in rows] == ['ORDERS', 'ITEMS', 'USERS']
+
+    def test_pandas_result_lowercases_columns(self):
+        """Test that DataFrame results use the same column names as dict rows"""
+        df = connected_connector().execute_query_pandas("SELECT table_name, row_count FROM t")
+
+        assert list(df.columns) == ['table_name', 'row_count']
+        assert df['row_count'].tolist() == [10, 20, 30]
+
+    def test_pandas_fallback_keeps_columns(self, monkeypatch):
+        """Test that the row-based fallback names columns from the cursor"""
+        monkeypatch.setattr('src.tools.database_connector.ARROW_AVAILABLE', False)
+        monkeypatch.setattr(FakeCursor, 'rows', [])
+        df = connected_connector().execute_query_pandas("SELECT table_name, row_count FROM t")
+        
+        assert list(df.columns) == ['table_name', 'row_count']
+        assert df.empty
+
+class TestConnectionState:
+    """Test cases for connection checks"""
+
+    def test_queries_do_not_ping(self):
+        """Test that a query is the only statement sent on the hot path"""
+        connector = connected_connector()
+        connector.execute_query("SELECT table_name FROM t")
+
+        assert [query for query, _ in connector.connection.queries] == ["SELECT table_name FROM t"]
+
+    def test_connect_sends_no_test_query(self, monkeypatch):
+        """Test that connecting relies on the driver handshake alone"""
+        connection = FakeConnection()
+        monkeypatch.setattr(snowflake.connector, 'connect', lambda **kwargs: connection)
+        connector = DatabaseConnector()
+
+        assert connector.connect()
+        assert connector.is_connected
+        assert connection.queries == []
+
+    def test_connect_downloads_results_in_parallel(self, monkeypatch):
+        """Test that the configured download threads are passed to the driver"""
+        params = {}
+        monkeypatch.setattr(snowflake.connector, 'connect',
+                            lambda **kwargs: params.update(kwargs) or FakeConnection())
+        
+        assert DatabaseConnector().connect()
+        assert params['client_prefetch_threads'] == DATA_PROCESSING_CONFIG.result_download_threads
+    
+    def test_health_check_pings_server(self):
+        """Test that health_check actively runs a probe query"""
+        connector = connected_connector()
+
+        assert connector.health_check()
+        assert connector.connection.queries == [("SELECT 1", None)]
+
+class TestStatementTimeout:
+    """Test cases for query timeout handling"""
+
+    def test_default_timeout_adds_no_statements(self):
+        """Test that queries at the session timeout run without extra statements"""
+        connector = connected_connector()
+        connector.execute_query("SELECT 1")
+
+        assert ("SELECT 1", None) in connector.connection.queries
+        assert not any("ALTER SESSION" in query for query, _ in connector.connection.queries)
+
+    def test_override_uses_statement_params(self):
+        """Test that a non-default timeout travels with the statement itself"""
+        connector = connected_connector()
+        connector.execute_query("SELECT 1", timeout=5)
+
+        assert ("SELECT 1", {'STATEMENT_TIMEOUT_IN_SECONDS': 5}) in connector.connection.queries
+
+class TestCursorReuse:
+    """Test cases for per-thread cursors"""
+
+    def test_cursor_reused_within_thread(self):
+        """Test that consecutive queries on one thread share a cursor"""
+        connector = connected_connector()
+        connector.execute_query("SELECT 1")
+        connector.execute_query("SELECT 2")
+
+        assert len(connector.connection.cursors) == 1
+
+    def test_threads_get_separate_cursors(self):
+        """Test that each thread queries through its own cursor"""
+        connector = connected_connector()
+        connector.execute_query("SELECT 1")
+        worker = threading.Thread(target=connector.execute_query, args=("SELECT 2",))
+        worker.start()
+        worker.join()
+
+        assert len(connector.connection.cursors) == 2
+
+    def test_close_releases_cursors(self):
+        """Test that closing the connector closes the per-thread cursors"""
+        connector = connected_connector()
+        connector.execute_query("SELECT 1")
+        cursors = connector.connection.cursors
+        connector.close()
+
+        assert all(cursor.closed for cursor in cursors)
+
@@ -0,0 +1,104 @@
+"""Tests for DocumentationAgent table grouping and streaming"""
+
+import time
+import warnings
+import pandas as pd
+import pytest
+
+pytest.importorskip("crewai")
+
+import src.agents.documentation_agent as documentation_agent
+from src.agents.documentation_agent import DocumentationAgent
+from src.core.ai_config import AI_CONFIG
+
+def table_frames(*table_names):
+    """(table name, one-column frame) pairs as iter_table_profiles yields them"""
+    return [(name, pd.DataFrame({'table_name': [name], 'column_name': ['ID']})) for name in table_names]
+
+@pytest.fixture
+def concurrent_requests(monkeypatch):
+    """Enable concurrent AI requests with the given worker limit"""
+    def enable(max_workers):
+        performance = AI_CONFIG._config['performance']
+        monkeypatch.setitem(performance, 'enable_concurrent_requests', True)
+        monkeypatch.setitem(performance, 'max_concurrent_requests', max_workers)
+    return enable
+
+@pytest.fixture
+def pool_sizes(monkeypatch):
+    """Record the max_workers of every pool the agent creates"""
+    sizes = []
+    
+    class RecordingExecutor(documentation_agent.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, *args, **kwargs):
+            sizes.append(max_workers)
+            super().__init__(max_workers, *args, **kwargs)
+    
+    monkeypatch.setattr(documentation_agent, 'ThreadPoolExecutor', RecordingExecutor)
+    return sizes
+
+class TestGenerateDocumentation:
+    """Test cases for generate_documentation"""
+    
+    def test_unused_table_categories_are_not_documented(self):
+        """Test that a subset of a categorical frame only documents the tables it contains"""
+        documented = []
+        # No AI client is needed; document_table is the per-table AI call
+        agent = object.__new__(DocumentationAgent)
+        agent.document_table = lambda table_name, table_df: documented.append((table_name, len(table_df))) or []
+        
+        enriched_df = pd.DataFrame({'table_name': pd.Categorical(['ORDERS', 'ITEMS', 'USERS']),
+                                    'column_name': ['ID', 'SKU', 'EMAIL']})
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            agent.generate_documentation(enriched_df[enriched_df['table_name'] != 'ITEMS'])
+        
+        assert documented == [('ORDERS', 1), ('USERS', 1)]
+
+class TestGenerateDocumentationStream:
+    """Test cases for generate_documentation_stream"""
+    
+    def test_tables_return_in_submission_order(self, concurrent_requests):
+        """Test that tables finishing out of order are collected in the order they arrived"""
+        concurrent_requests(3)
+        agent = object.__new__(DocumentationAgent)
+        delays = {'ORDERS': 0.06, 'ITEMS': 0.03, 'USERS': 0.0}
+        
+        def document_table(table_name, table_df):
+            time.sleep(delays[table_name])
+            return table_df.assign(column_description=f"{table_name} id").to_dict('records')
+        agent.document_table = document_table
+        
+        documented_df = agent.generate_documentation_stream(table_frames('ORDERS', 'ITEMS', 'USERS'))
+        
+        assert documented_df['table_name'].tolist() == ['ORDERS', 'ITEMS', 'USERS']
+        assert documented_df['column_description'].tolist() == ['ORDERS id', 'ITEMS id', 'USERS id']
+    
+    def test_workers_follow_concurrency_settings(self, concurrent_requests, pool_sizes):
+        """Test that tables are documented one at a time unless concurrency is enabled"""
+        agent = object.__new__(DocumentationAgent)
+        agent.document_table = lambda table_name, table_df: table_df.to_dict('records')
+        
+        agent.generate_documentation_stream(table_frames('ORDERS', 'ITEMS'))
+        concurrent_requests(2)
+        agent.generate_documentation_stream(table_frames('ORDERS', 'ITEMS'))
+        
+        assert pool_sizes == [1, 2]
+    
+    def test_failed_table_keeps_undocumented_rows(self):
+        """Test that a table whose AI calls fail is still returned, without descriptions"""
+        agent = object.__new__(DocumentationAgent)
+        
+        def describe_table(table_name, records):
+            if table_name == 'ITEMS':
+                raise RuntimeError("provider unavailable")
+            return f"{table_name} table"
+        agent._generate_table_description = describe_table
+        agent._generate_column_descriptions = lambda records, table_description: [
+            dict(record, table_description=table_description) for record in records]
+        
+        documented_df = agent.generate_documentation_stream(table_frames('ORDERS', 'ITEMS'))
+        
+        assert documented_df['table_name'].tolist() == ['ORDERS', 'ITEMS']
+        assert documented_df.loc[0, 'table_description'] == 'ORDERS table'
+        assert pd.isna(documented_df.loc[1, 'table_description'])
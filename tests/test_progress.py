@@ -0,0 +1,239 @@
+"""Tests for progress tracking utilities"""
+
+import logging
+import pytest
+
+import src.core.progress as progress_module
+from src.core.progress import (ProgressTracker, ProgressReporter, BatchProcessor,
+                               track_progress, flush_progress_logs)
+
+@pytest.fixture
+def progress_lines():
+    """Collect progress lines delivered to the catalog logger"""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    
+    catalog_logger = logging.getLogger("database_catalog")
+    original_level = catalog_logger.level
+    catalog_logger.setLevel(logging.INFO)
+    catalog_logger.addHandler(handler)
+    
+    def lines(marker: str = "Rate:"):
+        # Buffered progress lines may be batched into a single record
+        messages = [line for r in records for line in r.getMessage().splitlines()]
+        return [line for line in messages if marker in line]
+    
+    yield lines
+    
+    catalog_logger.removeHandler(handler)
+    catalog_logger.setLevel(original_level)
+
+class TestProgressTracker:
+    """Test cases for the log-based ProgressTracker path"""
+
+    def test_final_update_always_logs(self, progress_lines):
+        """Test that reaching the total logs even between clock checks"""
+        tracker = ProgressTracker(3, "Items", use_tqdm=False, log_interval=3600)
+        for _ in range(3):
+            tracker.update(1)
+        tracker.close()
+        flush_progress_logs()
+
+        lines = progress_lines()
+        assert len(lines) == 1
+        assert lines[0].startswith("Items: 3/3 (100.0%)")
+
+    def test_slow_loop_logs_each_interval(self, progress_lines, monkeypatch):
+        """Test that a short loop of slow items still logs intermediate progress"""
+        clock = [0.0]
+        monkeypatch.setattr(progress_module.time, 'monotonic', lambda: clock[0])
+        tracker = ProgressTracker(10, "Items", use_tqdm=False, log_interval=1)
+        for _ in range(10):
+            clock[0] += 2.0
+            tracker.update(1)
+        tracker.close()
+        flush_progress_logs()
+        
+        assert [line.split(" (")[0] for line in progress_lines()] == [f"Items: {i}/10" for i in range(1, 11)]
+    
+    def test_clock_reads_back_off_while_updates_are_fast(self, monkeypatch):
+        """Test that fast updates read the clock ever less often, up to check_every"""
+        reads = []
+        tracker = ProgressTracker(None, "Items", use_tqdm=False, log_interval=10, check_every=4)
+        monkeypatch.setattr(progress_module.time, 'monotonic', lambda: reads.append(1) or 0.0)
+        for _ in range(12):
+            tracker.update(1)
+        
+        # Ticks 1, 2, 4, 8 and 12: the gap doubles until it reaches check_every
+        assert len(reads) == 5
+    
+    def test_slow_update_resets_clock_backoff(self, monkeypatch):
+        """Test that one slow update makes the next updates read the clock again"""
+        clock = [0.0]
+        tracker = ProgressTracker(None, "Items", use_tqdm=False, log_interval=10, check_every=1024)
+        monkeypatch.setattr(progress_module.time, 'monotonic', lambda: clock[0])
+        for _ in range(64):
+            tracker.update(1)
+        assert tracker._check_mask == 127
+        
+        # The next clock read, at tick 128, sees the stall and drops the backoff
+        clock[0] += 5.0
+        for _ in range(64):
+            tracker.update(1)
+        
+        assert tracker._check_mask == 0
+    
+    def test_progress_lines_are_batched(self, progress_lines):
+        """Test that progress lines are emitted together when the tracker closes"""
+        tracker = ProgressTracker(100, "Items", use_tqdm=False, log_interval=0, check_every=1)
+        for _ in range(3):
+            tracker.update(1)
+        assert progress_lines() == []
+        
+        tracker.close()
+        flush_progress_logs()
+        
+        assert len(progress_lines()) == 3
+    
+    def test_sampled_updates_still_count(self, progress_lines):
+        """Test that sampling skips work but not increments or the final line"""
+        tracker = ProgressTracker(10, "Items", use_tqdm=False, log_interval=0,
+                                  check_every=1, sampling_rate=4)
+        for _ in range(10):
+            tracker.update(1)
+        tracker.close()
+        flush_progress_logs()
+        
+        assert [line.split(" (")[0] for line in progress_lines()] == ["Items: 4/10", "Items: 8/10", "Items: 10/10"]
+    
+    def test_close_is_idempotent(self, progress_lines):
+        """Test that closing twice logs a single completion line"""
+        with ProgressTracker(2, "Items", use_tqdm=False) as tracker:
+            tracker.update(2)
+            tracker.close()
+        flush_progress_logs()
+        
+        assert len(progress_lines("Completed Items")) == 1
+    
+    def test_check_every_must_be_power_of_two(self):
+        """Test that a non power-of-two check interval is rejected"""
+        with pytest.raises(ValueError):
+            ProgressTracker(10, use_tqdm=False, check_every=3)
+        with pytest.raises(ValueError):
+            ProgressTracker(10, use_tqdm=False, sampling_rate=6)
+
+class TestLogBuffer:
+    """Test cases for batched progress log output"""
+    
+    def test_one_flusher_thread_handles_idle_lines(self, progress_lines):
+        """Test that repeated flushes reuse one thread and idle lines still get written"""
+        import time
+        buffer = progress_module._LogBuffer(flush_interval=0.01)
+        for i in range(3):
+            buffer.push(f"Rate: {i}")
+            buffer.flush()
+        flusher = buffer._flusher
+        
+        buffer.push("Rate: idle")
+        deadline = time.monotonic() + 5
+        while "Rate: idle" not in progress_lines() and time.monotonic() < deadline:
+            time.sleep(0.01)
+            flush_progress_logs()
+        
+        assert buffer._flusher is flusher
+        assert progress_lines() == ["Rate: 0", "Rate: 1", "Rate: 2", "Rate: idle"]
+
+class TestTrackProgress:
+    """Test cases for track_progress"""
+    
+    def test_generator_is_streamed(self, progress_lines):
+        """Test that generator inputs are yielded lazily with an open-ended total"""
+        consumed = []
+        
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+        
+        tracked = track_progress(items(), "Rows", use_tqdm=False, log_interval=0, check_every=1)
+        assert next(tracked) == 0
+        assert consumed == [0]
+        
+        assert list(tracked) == [1, 2]
+        flush_progress_logs()
+        assert [line.split(" Rate")[0] for line in progress_lines()] == ["Rows: 1", "Rows: 2", "Rows: 3"]
+
+class TestBatchProcessor:
+    """Test cases for BatchProcessor"""
+    
+    def test_generator_input_is_streamed(self):
+        """Test that generator inputs are batched without being materialized"""
+        consumed = []
+        
+        def items():
+            for i in range(7):
+                consumed.append(i)
+                yield i
+        
+        seen = []
+        def processor(batch):
+            # Only the current batch should have been pulled from the generator
+            seen.append(len(consumed))
+            return [x * 2 for x in batch]
+        
+        processor_obj = BatchProcessor(batch_size=3)
+        results = processor_obj.process_batches(items(), processor, use_tqdm=False)
+        
+        assert results == [0, 2, 4, 6, 8, 10, 12]
+        assert seen == [3, 6, 7]
+    
+    def test_sequence_input_is_sliced(self):
+        """Test that sized sequences keep their batch type"""
+        processor_obj = BatchProcessor(batch_size=2)
+        results = processor_obj.process_batches("abcde", lambda batch: batch, use_tqdm=False)
+        
+        assert results == ["ab", "cd", "e"]
+    
+    def test_parallel_batches_keep_order(self):
+        """Test that concurrent batches are returned in input order"""
+        import time
+        
+        def processor(batch):
+            # Earlier batches finish last
+            time.sleep(0.01 * (5 - batch[0]))
+            return list(batch)
+        
+        processor_obj = BatchProcessor(batch_size=1, max_workers=4)
+        results = processor_obj.process_batches(range(5), processor, use_tqdm=False)
+        
+        assert results == [0, 1, 2, 3, 4]
+    
+    def test_parallel_batch_errors_are_skipped(self):
+        """Test that a failing batch does not stop the others"""
+        def processor(batch):
+            if 2 in batch:
+                raise ValueError("bad batch")
+            return list(batch)
+        
+        processor_obj = BatchProcessor(batch_size=2, max_workers=2, ordered=False)
+        results = processor_obj.process_batches(iter(range(6)), processor, use_tqdm=False)
+        
+        assert sorted(results) == [0, 1, 4, 5]
+
+class TestProgressReporter:
+    """Test cases for ProgressReporter"""
+    
+    def test_overall_progress_uses_running_totals(self):
+        """Test that completions are reflected in totals and per-operation stats"""
+        reporter = ProgressReporter({'profile': 4, 'document': 2})
+        reporter.complete_operation('profile', 2)
+        reporter.complete_operation('document')
+        reporter.complete_operation('unknown')
+        
+        progress = reporter.get_overall_progress()
+        assert progress['total_items'] == 6
+        assert progress['completed_items'] == 3
+        assert progress['completion_percentage'] == 50.0
+        assert progress['operations']['profile'] == {'completed': 2, 'total': 4, 'percentage': 50.0}
+        assert list(progress['operations']) == ['profile', 'document']
@@ -1,217 +1,81 @@
-#!/usr/bin/env python3
 """
-Test script for refactored configuration files
-Run after migrating to BaseConfig to ensure everything works
+Tests for the refactored configuration files
+Run after migrating to BaseConfig to ensure everything works:
+
+    pytest tests/test_refactored_configs.py --lf -x
+
+--lf reruns only the tests that failed last time (all of them on a clean cache).
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-# Add src to path (from tests directory)
-project_root = Path(__file__).parent.parent
-src_path = project_root / 'src'
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_path))
+# The project root is put on sys.path once by conftest.py
 
-def test_refactored_configs():
-    """Test all refactored config files"""
-    print("🔧 Testing Refactored Configuration Files")
-    print("=" * 50)
-    
-    success_count = 0
-    total_tests = 0
-    
-    # Test 1: Import all configs
-    print("\n📦 Test 1: Importing Refactored Configs")
-    try:
-        from src.core.base_config import BaseConfig
-        from src.core.data_processing_config import DATA_PROCESSING_CONFIG
-        from src.core.ui_config import UI_CONFIG
-        from src.core.column_config import COLUMN_CONFIG
-        
-        print("✅ All refactored configs imported successfully")
-        success_count += 1
-    except Exception as e:
-        print(f"❌ Import failed: {e}")
-    total_tests += 1
+def test_configs_are_base_configs(configs):
+    """Test that the refactored configs all derive from BaseConfig"""
+    from src.core.base_config import BaseConfig
     
-    # Test 2: Test BaseConfig features
-    print("\n🔧 Test 2: BaseConfig Features")
-    try:
-        # Test dot notation
-        port = UI_CONFIG.get('server.port', 7860)
-        sample_rows = DATA_PROCESSING_CONFIG.get('sampling.max_sample_rows', 5000)
-        pk_suffixes = COLUMN_CONFIG.get('primary_keys.suffixes', [])
-        
-        print(f"✅ Dot notation works - Port: {port}, Sample rows: {sample_rows}")
-        print(f"✅ PK suffixes: {pk_suffixes}")
-        success_count += 1
-    except Exception as e:
-        print(f"❌ BaseConfig features failed: {e}")
-    total_tests += 1
-    
-    # Test 3: Backwards compatibility 
-    print("\n🔄 Test 3: Backwards Compatibility")
-    try:
-        # All old properties should still work
-        assert DATA_PROCESSING_CONFIG.max_sample_rows > 0
-        assert UI_CONFIG.port > 0
-        assert len(COLUMN_CONFIG.primary_key_suffixes) > 0
-        
-        print("✅ All old properties still work")
-        print(f"   - Max sample rows: {DATA_PROCESSING_CONFIG.max_sample_rows}")
-        print(f"   - UI port: {UI_CONFIG.port}")
-        print(f"   - Primary key suffixes: {COLUMN_CONFIG.primary_key_suffixes}")
-        success_count += 1
-    except Exception as e:
-        print(f"❌ Backwards compatibility failed: {e}")
-    total_tests += 1
-    
-    # Test 4: Configuration validation
-    print("\n✅ Test 4: Configuration Validation")
-    try:
-        data_valid = DATA_PROCESSING_CONFIG.validate()
-        ui_valid = UI_CONFIG.validate()
-        column_valid = COLUMN_CONFIG.validate()
-        
-        print(f"✅ Data processing config valid: {data_valid}")
-        print(f"✅ UI config valid: {ui_valid}")  
-        print(f"✅ Column config valid: {column_valid}")
-        
-        if all([data_valid, ui_valid, column_valid]):
-            success_count += 1
-        else:
-            print("❌ Some configs failed validation")
-    except Exception as e:
-        print(f"❌ Validation test failed: {e}")
-    total_tests += 1
+    assert all(isinstance(cfg, BaseConfig) for cfg in vars(configs).values())
+
+@pytest.mark.parametrize('cfg_name,key,expected_type', [
+    ('ui', 'server.port', int),
+    ('data', 'sampling.max_sample_rows', int),
+    ('column', 'primary_keys.suffixes', list),
+])
+def test_dot_notation(configs, cfg_name, key, expected_type):
+    """Test BaseConfig dot notation access"""
+    assert isinstance(getattr(configs, cfg_name).get(key), expected_type)
+
+@pytest.mark.parametrize('cfg_name,prop', [
+    ('data', 'max_sample_rows'),
+    ('ui', 'port'),
+    ('column', 'primary_key_suffixes'),
+])
+def test_backwards_compatibility(configs, cfg_name, prop):
+    """Test that the old properties still work"""
+    assert getattr(getattr(configs, cfg_name), prop)
+
+@pytest.mark.parametrize('cfg_name', ['data', 'ui', 'column'])
+def test_configuration_validation(configs, cfg_name):
+    """Test that every config passes its own validation"""
+    assert getattr(configs, cfg_name).validate()
+
+def test_helper_methods(configs):
+    """Test the helper methods added during the refactor"""
+    data_cfg, ui_cfg, column_cfg = configs.data, configs.ui, configs.column
+    assert data_cfg.get_sampling_strategy(1000)
+    assert data_cfg.format_numeric_value(123.456)
     
-    # Test 5: New helper methods
-    print("\n🛠️  Test 5: New Helper Methods") 
-    try:
-        # Test data processing helpers
-        strategy = DATA_PROCESSING_CONFIG.get_sampling_strategy(1000)
-        formatted_value = DATA_PROCESSING_CONFIG.format_numeric_value(123.456)
-        
-        # Test UI helpers
-        table_style = UI_CONFIG.get_table_style()
-        gradio_theme = UI_CONFIG.get_gradio_theme_config()
-        
-        # Test column classification helpers
-        all_measures = COLUMN_CONFIG.get_all_measure_keywords()
-        field_classification = COLUMN_CONFIG.classify_field_by_name('customer_id')
-        
-        print("✅ Data processing helpers work")
-        print(f"   - Sampling strategy for 1000 rows: {strategy}")
-        print(f"   - Formatted value: {formatted_value}")
-        
-        print("✅ UI helpers work")
-        print(f"   - Gradio theme: {gradio_theme}")
-        
-        print("✅ Column classification helpers work")
-        print(f"   - Measure keywords count: {len(all_measures)}")
-        print(f"   - customer_id classification: {field_classification}")
-        
-        success_count += 1
-    except Exception as e:
-        print(f"❌ Helper methods test failed: {e}")
-    total_tests += 1
+    assert ui_cfg.get_table_style()
+    assert 'primary_hue' in ui_cfg.get_gradio_theme_config()
     
-    # Test 6: Config updating (non-destructive)
-    print("\n🔄 Test 6: Runtime Configuration Updates")
-    try:
-        # Save original values
-        original_port = UI_CONFIG.port
-        original_batch_size = DATA_PROCESSING_CONFIG.batch_size
-        
-        # Test updating
-        UI_CONFIG.update('server.port', 8080)  
-        DATA_PROCESSING_CONFIG.update('profiling.batch_size', 15)
-        
-        # Verify updates
-        assert UI_CONFIG.get('server.port') == 8080
-        assert DATA_PROCESSING_CONFIG.get('profiling.batch_size') == 15
-        
-        # Restore original values
-        UI_CONFIG.update('server.port', original_port)
-        DATA_PROCESSING_CONFIG.update('profiling.batch_size', original_batch_size)
-        
-        print("✅ Runtime config updates work")
-        print(f"   - Temporarily changed port to 8080, restored to {original_port}")
-        print(f"   - Temporarily changed batch size to 15, restored to {original_batch_size}")
-        
-        success_count += 1
-    except Exception as e:
-        print(f"❌ Runtime updates test failed: {e}")
-    total_tests += 1
+    assert len(column_cfg.get_all_measure_keywords()) > 0
+    assert column_cfg.classify_field_by_name('customer_id')['role'] == 'primary_key'
+
+def test_runtime_updates(mutable_configs):
+    """Test runtime configuration updates without leaking them to other tests"""
+    data_cfg, ui_cfg = mutable_configs.data, mutable_configs.ui
     
-    # Summary
-    print("\n" + "=" * 50)
-    print(f"📊 REFACTOR TEST RESULTS")
-    print(f"   ✅ Passed: {success_count}")
-    print(f"   ❌ Failed: {total_tests - success_count}")
-    print(f"   📊 Total: {total_tests}")
+    ui_cfg.update('server.port', 8080)
+    data_cfg.update('profiling.batch_size', 15)
     
-    if success_count == total_tests:
-        print("\n🎉 All tests passed! Refactoring was successful.")
-        print("   Your configs now use BaseConfig and have new features:")
-        print("   • Better error handling")
-        print("   • Dot notation access") 
-        print("   • Configuration validation")
-        print("   • Runtime config updates")
-        print("   • All existing functionality preserved")
-        return True
-    else:
-        print(f"\n⚠️  {total_tests - success_count} test(s) failed.")
-        print("   Consider rolling back to backup files and trying migration again.")
-        return False
+    assert ui_cfg.get('server.port') == 8080
+    assert ui_cfg.port == 8080
+    assert data_cfg.get('profiling.batch_size') == 15
 
-def test_integration_with_existing_code():
-    """Test that refactored configs work with existing pipeline code"""
-    print("\n🔗 Integration Test: Pipeline Compatibility")
+@pytest.mark.parametrize('cfg_name,key,value', [
+    ('ui', 'server.port', 8081),
+    ('column', 'primary_keys.suffixes', ['_code']),
+])
+def test_restore_state_refreshes_derived_settings(mutable_configs, cfg_name, key, value):
+    """Test that restoring saved settings also refreshes values resolved from them"""
+    cfg = getattr(mutable_configs, cfg_name)
+    state = cfg.save_state()
+    original = cfg.get(key)
     
-    try:
-        # Test that the pipeline can still import and use configs
-        from src.core.pipeline import CatalogPipeline
-        from src.tools.schema_discoverer import SchemaDiscoverer
-        from src.tools.data_profiler import DataProfiler
-        from src.agents.documentation_agent import DocumentationAgent
-        from src.tools.ui_generator import UIGenerator
-        
-        print("✅ All pipeline components can import configs")
-        
-        # Test that config values are accessible
-        from src.core.data_processing_config import DATA_PROCESSING_CONFIG
-        
-        # These are used by the schema discoverer
-        include_tables = DATA_PROCESSING_CONFIG.include_tables
-        batch_size = DATA_PROCESSING_CONFIG.batch_size
-        
-        print(f"✅ Pipeline can access config values:")
-        print(f"   - Include tables: {include_tables}")
-        print(f"   - Batch size: {batch_size}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Integration test failed: {e}")
-        return False
-
-def main():
-    """Run all refactor tests"""
-    config_test_passed = test_refactored_configs()
-    integration_test_passed = test_integration_with_existing_code()
+    cfg.update(key, value)
+    cfg.restore_state(state)
     
-    if config_test_passed and integration_test_passed:
-        print("\n🚀 MIGRATION SUCCESSFUL!")
-        print("   You can now use your refactored configuration system.")
-        print("   Run 'python main.py' to test the full pipeline.")
-        return 0
-    else:
-        print("\n🔄 MIGRATION ISSUES DETECTED")
-        print("   Consider rolling back to backup files:")
-        print("   cp src/core/*.backup src/core/")
-        return 1
-
-if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    assert cfg.get(key) == original
+    assert mutable_configs.ui.port == mutable_configs.ui.get('server.port')
+    assert mutable_configs.column.primary_key_suffix_tuple == tuple(mutable_configs.column.primary_key_suffixes)
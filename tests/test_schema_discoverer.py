@@ -0,0 +1,157 @@
+"""Tests for SchemaDiscoverer metadata discovery and column classification"""
+
+import pandas as pd
+import pytest
+
+from src.tools.schema_discoverer import SchemaDiscoverer
+
+class FakeConnector:
+    """Records queries and returns one row per column"""
+    
+    def __init__(self):
+        self.queries = []
+        self.connection = object()  # an open session
+    
+    def execute_query_pandas(self, query, params=None, timeout=None):
+        self.queries.append(query)
+        return pd.DataFrame({
+            'table_name': ['ITEMS', 'ORDERS', 'ORDERS'],
+            'column_name': ['ID', 'ID', 'TOTAL'],
+            'data_type': ['NUMBER'] * 3,
+            'row_count': [20, 10, 10],
+            'bytes': [2048, 1024, 1024],
+        })
+
+@pytest.fixture(autouse=True)
+def fresh_schema_cache():
+    """Keep the shared schema cache from leaking between tests"""
+    SchemaDiscoverer.invalidate()
+    yield
+    SchemaDiscoverer.invalidate()
+
+class TestSchemaMetadata:
+    """Test cases for discover_tables and get_table_metadata"""
+    
+    def test_tables_and_columns_share_one_query(self):
+        """Test that table discovery and column metadata come from a single round-trip"""
+        db = FakeConnector()
+        discoverer = SchemaDiscoverer(db)
+        
+        tables_df = discoverer.discover_tables()
+        metadata_df = discoverer.get_table_metadata(['ORDERS'])
+        
+        assert len(db.queries) == 1
+        assert tables_df['name'].tolist() == ['ITEMS', 'ORDERS']
+        assert tables_df['rows'].tolist() == [20, 10]
+        assert metadata_df['column_name'].tolist() == ['ID', 'TOTAL']
+        
+        # Table sizes are reported by discover_tables only; row counts feed the profiler
+        assert 'bytes' in tables_df.columns
+        assert 'bytes' not in metadata_df.columns
+        assert metadata_df['row_count'].tolist() == [10, 10]
+        
+        # Enriching the returned frame must not leak into the cached one
+        metadata_df['column_role'] = 'measure'
+        assert 'column_role' not in discoverer.get_table_metadata(['ORDERS']).columns
+    
+    def test_low_cardinality_columns_are_categorical(self):
+        """Test that repeated metadata values are stored as categoricals"""
+        discoverer = SchemaDiscoverer(FakeConnector())
+        metadata_df = discoverer.get_table_metadata(['ITEMS', 'ORDERS'])
+        
+        assert isinstance(metadata_df['table_name'].dtype, pd.CategoricalDtype)
+        assert isinstance(metadata_df['data_type'].dtype, pd.CategoricalDtype)
+        assert metadata_df['table_name'].cat.categories.tolist() == ['ITEMS', 'ORDERS']
+    
+    def test_schema_cache_is_shared_across_discoverers(self):
+        """Test that a second discoverer reuses the first one's schema query"""
+        first, second = FakeConnector(), FakeConnector()
+        SchemaDiscoverer(first).discover_tables()
+        
+        tables_df = SchemaDiscoverer(second).discover_tables()
+        
+        assert len(first.queries) == 1
+        assert second.queries == []
+        assert tables_df['name'].tolist() == ['ITEMS', 'ORDERS']
+    
+    def test_invalidate_drops_only_the_owners_entry(self):
+        """Test that invalidating another connector keeps the cached schema"""
+        db = FakeConnector()
+        SchemaDiscoverer(db).discover_full()
+        
+        SchemaDiscoverer.invalidate(FakeConnector())
+        SchemaDiscoverer(db).discover_full()
+        assert len(db.queries) == 1
+        
+        SchemaDiscoverer.invalidate(db)
+        SchemaDiscoverer(db).discover_full()
+        assert len(db.queries) == 2
+
+    def test_discover_full_returns_a_copy(self):
+        """Test that columns written onto the returned frame stay out of the shared cache"""
+        db = FakeConnector()
+        for _ in range(2):
+            schema_df = SchemaDiscoverer(db).discover_full()
+            assert 'sample_values' not in schema_df.columns
+            schema_df['sample_values'] = 'a; b'
+        
+        assert len(db.queries) == 1
+    
+    def test_closed_owner_makes_cache_stale(self):
+        """Test that schema metadata is fetched again once its connector is closed"""
+        db = FakeConnector()
+        SchemaDiscoverer(db).discover_full()
+        db.connection = None
+        
+        other = FakeConnector()
+        SchemaDiscoverer(other).discover_full()
+        
+        assert len(other.queries) == 1
+    
+    def test_collected_owner_makes_cache_stale(self):
+        """Test that the cache does not keep its connector alive"""
+        SchemaDiscoverer(FakeConnector()).discover_full()
+        
+        other = FakeConnector()
+        SchemaDiscoverer(other).discover_full()
+        
+        assert len(other.queries) == 1
+
+class TestAnalyzeColumnRoles:
+    """Test cases for analyze_column_roles"""
+    
+    def test_rules_apply_in_priority_order(self):
+        """Test that key, measure, dimension and type-default rules are applied in order"""
+        metadata_df = pd.DataFrame({
+            'column_name': ['CUSTOMER_ID', 'NOTE_ID', 'ORDER_FK', 'UNIT_PRICE', 'ITEM_QTY',
+                            'PRODUCT_NAME', 'ORDER_STATUS', 'SHIP_CITY', 'CREATED', 'MISC', 'RATIO'],
+            'data_type': ['NUMBER', 'NUMBER', 'NUMBER', 'NUMBER', 'NUMBER',
+                          'TEXT', 'TEXT', 'VARCHAR', 'date', 'VARCHAR', 'FLOAT'],
+            'is_nullable': ['NO', 'YES', 'YES', 'YES', 'YES',
+                            'YES', 'YES', 'YES', 'YES', 'YES', 'YES'],
+        })
+        
+        result = SchemaDiscoverer(None).analyze_column_roles(metadata_df)
+        
+        assert list(result['column_role']) == [
+            'primary_key', 'measure', 'foreign_key', 'measure', 'measure',
+            'dimension', 'dimension', 'dimension', 'dimension', 'dimension', 'measure']
+        assert list(result['business_data_type']) == [
+            'Identifier', 'Numeric', 'Identifier', 'Currency', 'Quantity',
+            'Description', 'Status', 'Location', 'Date', 'Text', 'Numeric']
+    
+    def test_categorical_input_matches_object_input(self):
+        """Test that categorical metadata classifies the same as plain strings"""
+        metadata_df = pd.DataFrame({
+            'column_name': ['ORDER_ID', 'NOTE_ID', 'CREATED'],
+            'data_type': ['NUMBER', 'NUMBER', 'DATE'],
+            'is_nullable': ['NO', 'YES', 'YES'],
+        })
+        categorical_df = metadata_df.astype({'data_type': 'category', 'is_nullable': 'category'})
+        
+        discoverer = SchemaDiscoverer(None)
+        expected = discoverer.analyze_column_roles(metadata_df.copy())
+        result = discoverer.analyze_column_roles(categorical_df)
+        
+        assert list(result['column_role']) == list(expected['column_role'])
+        assert list(result['business_data_type']) == list(expected['business_data_type'])
@@ -0,0 +1,36 @@
+"""Tests for UIConfig text truncation"""
+
+import pytest
+
+@pytest.fixture(params=['one', 'many'])
+def truncate(request, ui_cfg):
+    """truncate_text, or truncate_many applied to a single text, behind one signature"""
+    if request.param == 'one':
+        return ui_cfg.truncate_text
+    return lambda text, **kwargs: ui_cfg.truncate_many([text], **kwargs)[0]
+
+class TestTruncation:
+    """Test cases shared by truncate_text and truncate_many"""
+    
+    def test_short_text_is_unchanged(self, truncate):
+        assert truncate("abc", max_length=5) == "abc"
+    
+    def test_text_at_the_limit_is_unchanged(self, truncate):
+        assert truncate("abcde", max_length=5) == "abcde"
+    
+    def test_long_text_gets_the_indicator(self, truncate, ui_cfg):
+        assert truncate("abcdef", max_length=5) == "abcde" + ui_cfg.long_text_indicator
+    
+    def test_default_length_follows_is_description(self, truncate, ui_cfg):
+        """Test that descriptions and sample values use their own configured lengths"""
+        for is_description, limit in ((True, ui_cfg.description_truncate_length),
+                                      (False, ui_cfg.sample_values_truncate_length)):
+            assert truncate("x" * limit, is_description=is_description) == "x" * limit
+            assert truncate("x" * (limit + 1), is_description=is_description) == (
+                "x" * limit + ui_cfg.long_text_indicator)
+
+def test_truncate_many_keeps_order(ui_cfg):
+    """Test that bulk truncation returns one result per input, in order"""
+    texts = ["a", "abcdef", ""]
+    
+    assert ui_cfg.truncate_many(texts, max_length=3) == ["a", "abc" + ui_cfg.long_text_indicator, ""]
@@ -0,0 +1,214 @@
+"""Tests for UIGenerator search and rendering"""
+
+import pandas as pd
+import pytest
+
+gr = pytest.importorskip("gradio")
+
+from src.tools.ui_generator import UIGenerator
+
+@pytest.fixture
+def catalog_df():
+    return pd.DataFrame({
+        'table_name': ['ORDERS', 'ORDERS', 'ITEMS', 'USERS'],
+        'column_name': ['ORDER_ID', 'TOTAL', 'ITEM_ID', 'EMAIL'],
+        'data_type': ['NUMBER', 'NUMBER', 'NUMBER', 'TEXT'],
+        'column_role': ['primary_key', 'measure', 'primary_key', 'dimension'],
+        'business_data_type': ['Identifier', 'Currency', 'Identifier', 'Text'],
+        'table_description': ['Orders', 'Orders', 'Items', 'Users'],
+        'column_description': ['Order key', 'Order total', None, 'Contact address'],
+    })
+
+class TestSearchCatalog:
+    """Test cases for search_catalog"""
+
+    def test_search_is_case_insensitive_across_fields(self, catalog_df):
+        """Test that the term matches table, column and description text"""
+        ui = UIGenerator(catalog_df)
+
+        summary, _ = ui.search_catalog("order", "All Tables", "All Types")
+        assert summary.startswith("Found 2 results across 1 tables")
+
+        summary, _ = ui.search_catalog("ADDRESS", "All Tables", "All Types")
+        assert summary.startswith("Found 1 results")
+
+    def test_search_is_literal(self, catalog_df):
+        """Test that regex metacharacters in the term are matched literally"""
+        ui = UIGenerator(catalog_df)
+
+        assert ui.search_catalog("_ID|", "All Tables", "All Types")[0] == "No results found."
+        assert ui.search_catalog("nan", "All Tables", "All Types")[0] == "No results found."
+
+    def test_filters_combine_with_search(self, catalog_df):
+        """Test that table and type filters narrow the search"""
+        ui = UIGenerator(catalog_df)
+
+        summary, _ = ui.search_catalog("_id", "All Tables", "Identifier")
+        assert summary.startswith("Found 2 results across 2 tables")
+
+        summary, _ = ui.search_catalog("_id", "ITEMS", "Identifier")
+        assert summary.startswith("Found 1 results")
+
+    def test_unfiltered_search_lists_catalog(self, catalog_df, monkeypatch):
+        """Test that an empty search shows the catalog up to the results limit"""
+        from src.core.ui_config import UI_CONFIG
+        monkeypatch.setattr(UI_CONFIG, '_max_search_results', 3)
+
+        summary, html = UIGenerator(catalog_df).search_catalog("", "All Tables", "All Types")
+
+        assert summary == "Found 4 results across 3 tables (showing first 3 results)"
+        assert html.count('<tr style="background-color: ') == 3
+
+    def test_unknown_filter_value_finds_nothing(self, catalog_df):
+        """Test that a filter value missing from the catalog yields no rows"""
+        ui = UIGenerator(catalog_df)
+
+        assert ui.search_catalog("", "MISSING", "All Types")[0] == "No results found."
+        assert ui.search_catalog("", "ORDERS", "Text")[0] == "No results found."
+
+class TestSearchIndex:
+    """Test cases for the trigram search index"""
+
+    @pytest.mark.parametrize("term", ["order", "_id", "id", "ADDRESS", 'or"der', "t\x1fo"])
+    def test_index_agrees_with_scan(self, catalog_df, monkeypatch, term):
+        """Test that indexed and scanned searches return the same results"""
+        from src.core.ui_config import UI_CONFIG
+        indexed = UIGenerator(catalog_df)
+        monkeypatch.setattr(UI_CONFIG, '_use_search_index', False)
+        scanned = UIGenerator(catalog_df)
+
+        assert indexed._search_index is not None and scanned._search_index is None
+        assert (indexed.search_catalog(term, "All Tables", "All Types")
+                == scanned.search_catalog(term, "All Tables", "All Types"))
+        assert (indexed.search_catalog(term, "ORDERS", "Identifier")
+                == scanned.search_catalog(term, "ORDERS", "Identifier"))
+
+class TestRendering:
+    """Test cases for HTML rendering"""
+
+    def test_result_rows_alternate_background(self, catalog_df):
+        """Test that each result becomes one row with alternating colors"""
+        from src.core.ui_config import UI_CONFIG
+        html = UIGenerator(catalog_df)._format_results(catalog_df)
+
+        assert html.count('<tr style="background-color: ') == 4
+        assert html.index(UI_CONFIG.even_row_background) < html.index(UI_CONFIG.odd_row_background)
+        assert '<code>ORDER_ID</code>' in html
+        assert '<strong>USERS</strong>' in html
+
+    def test_table_details_list_table_columns(self, catalog_df):
+        """Test that table details render only the selected table's columns"""
+        html = UIGenerator(catalog_df).get_table_details('ORDERS')
+
+        assert '<code>ORDER_ID</code>' in html and '<code>TOTAL</code>' in html
+        assert 'ITEM_ID' not in html
+        assert '<p><strong>Columns:</strong> 2</p>' in html
+        assert UIGenerator(catalog_df).get_table_details('MISSING') == "Table not found."
+
+    def test_long_descriptions_are_truncated(self, catalog_df):
+        """Test that descriptions over the configured length are cut with the indicator"""
+        from src.core.ui_config import UI_CONFIG
+        limit = UI_CONFIG.description_truncate_length
+        catalog_df.loc[1, 'column_description'] = 'x' * (limit + 5)
+
+        html = UIGenerator(catalog_df)._format_results(catalog_df)
+
+        assert 'x' * limit + UI_CONFIG.long_text_indicator + '</td>' in html
+        assert 'x' * (limit + 1) not in html
+        assert '>Order key</td>' in html
+
+    def test_table_details_rendered_once(self, catalog_df, monkeypatch):
+        """Test that reselecting a table serves the cached HTML"""
+        ui = UIGenerator(catalog_df)
+        calls = []
+        render = ui._render_table_details
+        monkeypatch.setattr(ui, '_render_table_details', lambda name: calls.append(name) or render(name))
+
+        first = ui.get_table_details('ORDERS')
+        assert ui.get_table_details('ORDERS') == first
+        assert calls == ['ORDERS']
+
+    def test_markup_in_values_is_escaped(self, catalog_df):
+        """Test that catalog text cannot inject HTML into the rendered page"""
+        catalog_df.loc[1, 'column_description'] = '<script>alert("x")</script> & more'
+        catalog_df.loc[0, 'table_description'] = 'Orders <b>table</b>'
+
+        ui = UIGenerator(catalog_df)
+        results = ui._format_results(catalog_df)
+        details = ui.get_table_details('ORDERS')
+
+        assert '<script>' not in results and '<script>' not in details
+        assert '&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; more' in results
+        assert 'Orders &lt;b&gt;table&lt;/b&gt;' in details
+
+class TestCatalogFrame:
+    """Test cases for the frame held by the UI"""
+
+    def test_only_displayed_fields_are_kept(self, catalog_df):
+        """Test that profiling fields are dropped from the UI's frame"""
+        catalog_df['sample_values'] = 'a; b'
+        catalog_df['distinct_count'] = 2
+
+        ui = UIGenerator(catalog_df)
+
+        assert 'sample_values' not in ui.df.columns
+        assert 'distinct_count' not in ui.df.columns
+        assert ui.tables == ['ITEMS', 'ORDERS', 'USERS']
+
+    def test_dropdowns_list_observed_values_in_order(self, catalog_df):
+        """Test that dropdown choices skip unused categories and missing values"""
+        catalog_df['table_name'] = pd.Categorical(catalog_df['table_name'],
+                                                  categories=['ITEMS', 'ORDERS', 'UNUSED', 'USERS'])
+        catalog_df.loc[3, 'business_data_type'] = None
+
+        ui = UIGenerator(catalog_df)
+
+        assert ui.tables == ['ITEMS', 'ORDERS', 'USERS']
+        assert ui.business_types == ['Currency', 'Identifier']
+
+    def test_text_columns_use_arrow_strings(self, catalog_df):
+        """Test that text columns are Arrow-backed when pyarrow is installed"""
+        pytest.importorskip("pyarrow")
+
+        ui = UIGenerator(catalog_df)
+
+        assert ui.df['column_name'].dtype == 'string[pyarrow]'
+        assert all(type(name) is str for name in ui.tables)
+        assert ui.search_catalog("contact", "All Tables", "All Types")[0].startswith("Found 1 results")
+
+class TestInterface:
+    """Test cases for building the Gradio interface"""
+
+    def test_blocks_are_built_once(self, catalog_df):
+        """Test that rebuilding the interface reuses the same Blocks without launching"""
+        ui = UIGenerator(catalog_df, theme_override={'primary_hue': 'blue', 'secondary_hue': 'yellow',
+                                                     'neutral_hue': 'gray'})
+
+        interface = ui.build_interface()
+
+        assert isinstance(interface, gr.Blocks)
+        assert ui.build_interface() is interface
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'object'])
+def string_backend(request, monkeypatch):
+    """Run a test with and without Arrow-backed strings"""
+    if request.param:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr('src.tools.ui_generator.ARROW_AVAILABLE', request.param)
+
+class TestStringBackends:
+    """Test cases that must behave the same on either string backend"""
+
+    def test_missing_descriptions_render_blank(self, catalog_df, string_backend):
+        """Test that a missing description renders as an empty cell"""
+        html = UIGenerator(catalog_df)._format_results(catalog_df)
+
+        assert '<code>ITEM_ID</code>' in html
+        assert 'nan' not in html and '&lt;NA&gt;' not in html and '<NA>' not in html
+
+    def test_search_matches_on_both_backends(self, catalog_df, string_backend):
+        """Test that filtered search results agree across backends"""
+        summary, _ = UIGenerator(catalog_df).search_catalog("_id", "ORDERS", "All Types")
+
+        assert summary.startswith("Found 1 results across 1 tables")
+
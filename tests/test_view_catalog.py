@@ -0,0 +1,86 @@
+"""Tests for the standalone catalog viewer's CSV loading"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("gradio")
+pytest.importorskip("pyarrow")
+
+import view_catalog
+
+@pytest.fixture
+def catalog_csv(tmp_path):
+    path = tmp_path / "final_data_dictionary.csv"
+    pd.DataFrame({
+        'table_name': ['ORDERS', 'ORDERS'],
+        'column_name': ['ID', 'NOTE'],
+        'business_data_type': ['Identifier', None],
+    }).to_csv(path, index=False)
+    return path
+
+class TestLoadCatalog:
+    """Test cases for the parquet sidecar cache"""
+    
+    def test_sidecar_is_reused_while_csv_unchanged(self, catalog_csv, monkeypatch):
+        """Test that a second load reads the sidecar instead of parsing the CSV"""
+        first = view_catalog._load_catalog(catalog_csv)
+        assert view_catalog._sidecar_path(catalog_csv).exists()
+        
+        monkeypatch.setattr(pd, 'read_csv', lambda *args, **kwargs: pytest.fail("CSV re-parsed"))
+        second = view_catalog._load_catalog(catalog_csv)
+        
+        assert second['column_name'].tolist() == first['column_name'].tolist()
+        assert second['business_data_type'].isna().tolist() == [False, True]
+    
+    def test_sidecar_leaves_user_parquet_alone(self, catalog_csv):
+        """Test that a parquet file sharing the CSV's name is neither read nor overwritten"""
+        user_parquet = catalog_csv.with_suffix('.parquet')
+        pd.DataFrame({'important': [1, 2]}).to_parquet(user_parquet)
+        
+        df = view_catalog._load_catalog(catalog_csv)
+        
+        assert 'important' not in df.columns
+        assert pd.read_parquet(user_parquet).columns.tolist() == ['important']
+        assert sorted(p.name for p in catalog_csv.parent.iterdir()) == [
+            '.final_data_dictionary.catalog-cache.parquet',
+            'final_data_dictionary.csv',
+            'final_data_dictionary.parquet',
+        ]
+    
+    def test_changed_csv_rebuilds_sidecar(self, catalog_csv):
+        """Test that editing the CSV invalidates the sidecar"""
+        view_catalog._load_catalog(catalog_csv)
+        
+        pd.DataFrame({'table_name': ['ITEMS'], 'column_name': ['SKU'],
+                      'business_data_type': ['Code']}).to_csv(catalog_csv, index=False)
+        
+        assert view_catalog._load_catalog(catalog_csv)['column_name'].tolist() == ['SKU']
+    
+    def test_only_displayed_fields_are_loaded(self, catalog_csv):
+        """Test that extra CSV columns are skipped and repeated labels are categorical"""
+        df = pd.read_csv(catalog_csv)
+        df['sample_values'] = '1, 2'
+        df.to_csv(catalog_csv, index=False)
+        
+        for loaded in (view_catalog._load_catalog(catalog_csv), view_catalog._load_catalog(catalog_csv)):
+            assert 'sample_values' not in loaded.columns
+            assert isinstance(loaded['table_name'].dtype, pd.CategoricalDtype)
+            assert isinstance(loaded['business_data_type'].dtype, pd.CategoricalDtype)
+
+class TestRecentCatalogs:
+    """Test cases for listing available data dictionaries"""
+    
+    def test_newest_matching_files_first(self, tmp_path):
+        """Test that only timestamped dictionaries are listed, newest first and capped"""
+        for day in range(1, 13):
+            (tmp_path / f"final_data_dictionary_202501{day:02d}_000000.csv").touch()
+        (tmp_path / "final_data_dictionary_latest.csv").touch()
+        (tmp_path / "profiled_20250130_000000.csv").touch()
+        
+        listed = view_catalog._recent_catalogs(tmp_path, limit=3)
+        
+        assert [path.name for path in listed] == [
+            "final_data_dictionary_20250112_000000.csv",
+            "final_data_dictionary_20250111_000000.csv",
+            "final_data_dictionary_20250110_000000.csv",
+        ]
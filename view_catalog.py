@@ -4,15 +4,101 @@ Standalone UI launcher for existing data dictionary CSV files
 Usage: python view_catalog.py [csv_file_path]
 """
 
+import os
+import re
 import sys
+import heapq
+import tempfile
+import threading
 import pandas as pd
 from pathlib import Path
+from typing import List
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+# Run as a script, this file's directory is already first on sys.path, so
+# the src package imports resolve without prepending anything
+from src.tools.ui_generator import UIGenerator, UI_COLUMNS
 
-from src.tools.ui_generator import UIGenerator
-from src.core.config import logger
+# pyarrow enables the binary parquet sidecar cache; without it the CSV is parsed every launch
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Fixed Gradio hues for the standalone viewer, passed to UIGenerator as-is
+_GRADIO_THEME = {
+    'primary_hue': 'blue',
+    'secondary_hue': 'yellow',
+    'neutral_hue': 'gray'
+}
+
+# Data dictionaries written by the pipeline, named by their creation timestamp
+_CATALOG_FILE = re.compile(r'final_data_dictionary_\d{8}_\d{6}\.csv$')
+_LISTED_CATALOGS = 10
+
+# Only the displayed fields are parsed; low-cardinality ones are stored as codes
+_CSV_OPTIONS = {
+    'usecols': lambda column: column in UI_COLUMNS,
+    'dtype': {'table_name': 'category', 'business_data_type': 'category',
+              'data_type': 'category', 'column_role': 'category'},
+}
+
+# Parquet schema metadata keys recording the CSV the sidecar was built from and
+# the load options it reflects
+_SRC_MTIME_KEY = b'src_mtime_ns'
+_SRC_SIZE_KEY = b'src_size'
+_FORMAT_KEY = b'catalog_format'
+_FORMAT_VERSION = b'2'
+
+def _sidecar_path(csv_path: Path) -> Path:
+    """The hidden cache file for csv_path, named so it cannot collide with the user's own files"""
+    return csv_path.with_name(f".{csv_path.stem}.catalog-cache.parquet")
+
+def _write_sidecar(table: "pa.Table", sidecar: Path) -> None:
+    """Write the cache next to the CSV atomically, so readers never see a partial file"""
+    fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix='.tmp')
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_name)
+        os.replace(tmp_name, sidecar)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+def _load_catalog(csv_path: Path) -> pd.DataFrame:
+    """Load a data dictionary CSV, reusing a parquet sidecar while the CSV is unchanged"""
+    if not ARROW_AVAILABLE:
+        return pd.read_csv(csv_path, **_CSV_OPTIONS)
+    
+    stat = csv_path.stat()
+    source = {_SRC_MTIME_KEY: str(stat.st_mtime_ns).encode(), _SRC_SIZE_KEY: str(stat.st_size).encode(),
+              _FORMAT_KEY: _FORMAT_VERSION}
+    sidecar = _sidecar_path(csv_path)
+    
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+        if all(metadata.get(key) == value for key, value in source.items()):
+            return pq.read_table(sidecar).to_pandas()
+    except (OSError, pa.ArrowException):
+        pass  # Missing or unreadable sidecar; rebuild it below
+    
+    df = pd.read_csv(csv_path, **_CSV_OPTIONS)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source})
+        _write_sidecar(table, sidecar)
+    except (OSError, pa.ArrowException) as e:
+        from src.core.config import logger
+        logger.warning(f"Could not write catalog cache {sidecar}: {e}")
+    return df
+
+def _recent_catalogs(outputs_dir: Path, limit: int = _LISTED_CATALOGS) -> List[Path]:
+    """The most recent data dictionary CSVs in outputs_dir, newest first"""
+    # The timestamp in the name sorts chronologically, so only the top entries are ordered
+    with os.scandir(outputs_dir) as entries:
+        matches = [entry.name for entry in entries if _CATALOG_FILE.match(entry.name)]
+    return [outputs_dir / name for name in heapq.nlargest(limit, matches)]
 
 def main():
     """Launch UI with existing CSV data"""
@@ -31,9 +117,9 @@ def main():
         print("\nAvailable files in outputs directory:")
         outputs_dir = Path("outputs")
         if outputs_dir.exists():
-            csv_files = list(outputs_dir.glob("final_data_dictionary_*.csv"))
+            csv_files = _recent_catalogs(outputs_dir)
             if csv_files:
-                for f in sorted(csv_files, reverse=True):  # Most recent first
+                for f in csv_files:  # Most recent first
                     print(f"  {f}")
                 print(f"\nTo use a specific file: python {sys.argv[0]} <csv_file_path>")
             else:
@@ -43,35 +129,22 @@ def main():
     try:
         # Load the CSV data
         print(f"Loading data from: {csv_path}")
-        df = pd.read_csv(csv_path)
+        df = _load_catalog(csv_path)
         
         # Validate expected columns
-        required_columns = ['table_name', 'column_name', 'business_data_type']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in UIGenerator.REQUIRED_COLUMNS if col not in df.columns]
         
         if missing_columns:
             print(f"Error: CSV missing required columns: {missing_columns}")
             print(f"Available columns: {list(df.columns)}")
             return 1
         
-        print(f"Loaded {len(df)} columns from {df['table_name'].nunique()} tables")
-        
-        # Create and launch UI
-        ui_generator = UIGenerator(df)
-        
-        # Fix the Gradio color issue by updating the UI config temporarily
-        from src.core.ui_config import UI_CONFIG
-        
-        # Override the problematic color method
-        def get_gradio_theme_config_fixed():
-            return {
-                'primary_hue': 'blue',
-                'secondary_hue': 'yellow', 
-                'neutral_hue': 'gray'
-            }
+        # table_name is categorical, so its distinct values are already enumerated
+        print(f"Loaded {len(df)} columns from {df['table_name'].cat.categories.size} tables")
         
-        # Monkey patch the method
-        UI_CONFIG.get_gradio_theme_config = get_gradio_theme_config_fixed
+        # Create and launch UI; the fixed hues avoid the Gradio color issue
+        # without patching the shared UI_CONFIG
+        ui_generator = UIGenerator(df, theme_override=_GRADIO_THEME)
         
         url = ui_generator.create_interface()
         
@@ -79,17 +152,16 @@ def main():
         print(f"Access at: {url}")
         print(f"Press Ctrl+C to stop the server")
         
-        # Keep the script running
+        # Keep the script running; the main thread sleeps until Ctrl+C
         try:
-            while True:
-                import time
-                time.sleep(1)
+            threading.Event().wait()
         except KeyboardInterrupt:
             print("\nShutting down...")
             return 0
             
     except Exception as e:
         print(f"Error loading or displaying data: {e}")
+        from src.core.config import logger
         logger.exception("Failed to launch UI")
         return 1
 